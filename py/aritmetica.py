@@ -6,8 +6,22 @@ Versión mejorada con más funcionalidades y validaciones
 
 import math
 import random
-from typing import List, Tuple, Dict, Any, Union
+import sys
+import threading
+import heapq
+import numbers
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, compress, islice
+from typing import List, Tuple, Dict, Any, Union, Iterable, Iterator
 from fractions import Fraction
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él las APIs por lotes usan el camino escalar
+    np = None
 
 class ConjuntosNumericos:
     """Clase para trabajar con conjuntos numéricos y sus propiedades"""
@@ -57,8 +71,8 @@ class ConjuntosNumericos:
         elif isinstance(n, float):
             # Es racional si se puede expresar como fracción
             try:
-                frac = Fraction(n).limit_denominator(10000)
-                if abs(float(frac) - n) < 1e-10:
+                numerador, denominador = Fraccionarios.decimal_a_fraccion(n, 10000)
+                if abs(numerador / denominador - n) < 1e-10:
                     clasificacion['racional'] = True
                 else:
                     clasificacion['irracional'] = True
@@ -67,20 +81,97 @@ class ConjuntosNumericos:
         
         return clasificacion
     
+    @staticmethod
+    def clasificar_lote(valores) -> Dict[str, Any]:
+        """Clasifica un arreglo de números y devuelve una columna booleana por cada clave de clasificar_numero"""
+        if np is None:
+            filas = [ConjuntosNumericos.clasificar_numero(v) for v in valores]
+            return {clave: [fila[clave] for fila in filas] for clave in _CLAVES_CLASIFICACION}
+        
+        valores = np.ravel(np.asarray(valores))
+        columnas = {clave: np.zeros(valores.size, dtype=bool) for clave in _CLAVES_CLASIFICACION}
+        columnas['real'][:] = True
+        
+        # Solo los carriles que no caben en int64/float64 exactos se resuelven con la función escalar
+        # (en int64 también -2^63, cuyo valor absoluto desborda)
+        if valores.dtype.kind in 'biu':
+            if valores.dtype.kind == 'u':
+                escalares = valores > np.iinfo(np.int64).max
+            elif valores.dtype.itemsize == 8:
+                escalares = valores == np.iinfo(np.int64).min
+            else:
+                escalares = np.zeros(valores.size, dtype=bool)
+            enteros = ~escalares
+            numeros = np.where(enteros, valores, 0).astype(np.int64)
+        elif valores.dtype.kind == 'O':
+            # Una lista con algún entero mayor que int64 llega como arreglo de objetos
+            enteros = np.fromiter((isinstance(v, int) and -2 ** 63 < v < 2 ** 63 for v in valores),
+                                  dtype=bool, count=valores.size)
+            escalares = ~enteros
+            numeros = np.where(enteros, valores, 0).astype(np.int64)
+        elif valores.dtype.kind == 'f':
+            valores = valores.astype(np.float64)
+            finitos = np.isfinite(valores)
+            enteros = finitos & (valores == np.floor(np.where(finitos, valores, 0)))
+            escalares = enteros & (np.abs(valores) >= 2.0 ** 53)
+            enteros &= ~escalares
+            numeros = np.where(enteros, valores, 0).astype(np.int64)
+        else:
+            escalares = np.ones(valores.size, dtype=bool)
+            enteros = np.zeros(valores.size, dtype=bool)
+            numeros = np.zeros(valores.size, dtype=np.int64)
+        
+        # Enteros: signo, paridad, primalidad desde la criba compartida y perfectos de 64 bits
+        absolutos = np.abs(numeros)
+        primos = _tabla_primos.es_primo_lote(absolutos) & enteros
+        columnas['entero'] |= enteros
+        columnas['racional'] |= enteros
+        columnas['natural'] |= enteros & (numeros > 0)
+        columnas['par'] |= enteros & ((numeros & 1) == 0)
+        columnas['impar'] |= enteros & ((numeros & 1) == 1)
+        columnas['primo'] |= primos
+        columnas['compuesto'] |= enteros & (absolutos > 1) & ~primos
+        columnas['perfecto'] |= enteros & np.isin(absolutos, _PERFECTOS_64_BITS)
+        
+        # No enteros: racionalidad con una sola pasada de fracciones continuas por lotes
+        if valores.dtype.kind == 'f':
+            fraccionarios = ~enteros & ~escalares
+            numeradores, denominadores, pendientes = _limitar_denominador_lote(np.where(fraccionarios, valores, 0.0), 10000)
+            # Por encima de 2^53 el cociente en float64 ya no coincide con numerador / denominador de Python
+            pendientes |= np.abs(numeradores) >= 2 ** 53
+            pendientes &= fraccionarios
+            racionales = np.abs(numeradores / np.maximum(denominadores, 1) - valores) < 1e-10
+            resueltos = fraccionarios & ~pendientes
+            columnas['racional'] |= resueltos & racionales
+            columnas['irracional'] |= resueltos & ~racionales
+            escalares |= pendientes
+        
+        for i in np.flatnonzero(escalares):
+            fila = ConjuntosNumericos.clasificar_numero(valores[i:i + 1].tolist()[0])
+            for clave in _CLAVES_CLASIFICACION:
+                columnas[clave][i] = fila[clave]
+        
+        return columnas
+    
     @staticmethod
     def es_perfecto(n: int) -> bool:
         """Verifica si un número es perfecto (suma de sus divisores propios = n)"""
         if n <= 1:
             return False
         
-        suma_divisores = 1  # 1 siempre es divisor propio
-        for i in range(2, int(math.sqrt(n)) + 1):
-            if n % i == 0:
-                suma_divisores += i
-                if i != n // i:  # Evitar contar dos veces la raíz cuadrada
-                    suma_divisores += n // i
+        if n < _tabla_aritmetica.limite:
+            return _tabla_aritmetica.sigma(n) == 2 * n
+        
+        if n % 2 == 1:
+            # No se conocen impares perfectos y no existe ninguno por debajo de la cota
+            if n < _COTA_IMPARES_PERFECTOS:
+                return False
+            return AritmeticaBasica.suma_divisores(n) == 2 * n
         
-        return suma_divisores == n
+        # Euclides–Euler: un par es perfecto si y solo si n = 2^(p-1)(2^p - 1) con 2^p - 1 primo
+        k = (n & -n).bit_length() - 1
+        p = k + 1
+        return n >> k == (1 << p) - 1 and _lucas_lehmer(p)
     
     @staticmethod
     def propiedades_operaciones() -> Dict[str, str]:
@@ -97,67 +188,739 @@ class ConjuntosNumericos:
             'elemento_inverso_producto': 'a × (1/a) = 1 (a ≠ 0)'
         }
 
+# Traduce banderas 0/1 a dígitos '0'/'1' para empaquetar la criba en bits
+_BANDERAS_A_BITS = bytes.maketrans(b'\x00\x01', b'01')
+
+def _criba_simple(limite: int) -> List[int]:
+    """Criba de Eratóstenes directa: primos menores o iguales que limite"""
+    if limite < 2:
+        return []
+    
+    criba = bytearray(b'\x01') * (limite + 1)
+    criba[0] = criba[1] = 0
+    for i in range(2, math.isqrt(limite) + 1):
+        if criba[i]:
+            criba[i * i::i] = bytes(len(range(i * i, limite + 1, i)))
+    
+    return list(compress(range(limite + 1), criba))
+
+def _cribar_impares(inicio: int, fin: int, primos_base) -> bytearray:
+    """Criba los impares de [inicio, fin) con inicio par: la posición j representa a inicio + 2j + 1"""
+    tamano = (fin - inicio) // 2
+    banderas = bytearray(b'\x01') * tamano
+    if inicio == 0 and tamano:
+        banderas[0] = 0  # El 1 no es primo
+    
+    for p in primos_base:
+        if p == 2:
+            continue
+        if p * p >= fin:
+            break
+        
+        # Primer múltiplo impar de p dentro del tramo, sin tachar al propio p
+        multiplo = max(p * p, (inicio + p) // p * p)
+        if multiplo % 2 == 0:
+            multiplo += p
+        j = (multiplo - inicio - 1) // 2
+        if j < tamano:
+            banderas[j::p] = bytes((tamano - 1 - j) // p + 1)
+    
+    return banderas
+
+class TablaPrimos:
+    """Tabla de primos compartida por el proceso: bitset de impares que crece bajo demanda"""
+    
+    ALINEACION = 16  # Cada byte del bitset cubre 8 impares, es decir 16 enteros
+    LIMITE_INICIAL = 1 << 16
+    LIMITE_AUTOMATICO = 1 << 20  # es_primo solo amplía la tabla por debajo de este valor
+    LIMITE_LOTE = 1 << 26  # Límite hasta el que las consultas por lotes amplían la tabla
+    LIMITE_MAXIMO = 1 << 32  # Los primos se guardan en un array('I')
+    
+    def __init__(self):
+        self.limite = 0  # La tabla cubre los enteros de [0, limite)
+        self._bits = bytearray()  # El bit i representa al impar 2i + 1
+        self._primos = array('I')
+        self._bits_lote = None  # Copia NumPy del bitset para es_primo_lote, rehecha al crecer la tabla
+        self._candado = threading.Lock()
+    
+    def asegurar(self, n: int) -> None:
+        """Amplía la tabla, si hace falta, para cubrir todos los enteros menores que n"""
+        if n <= self.limite:
+            return
+        if n > self.LIMITE_MAXIMO:
+            raise ValueError(f"La tabla de primos no puede superar {self.LIMITE_MAXIMO}")
+        
+        with self._candado:
+            if n > self.limite:
+                # Crecimiento geométrico para amortizar las ampliaciones sucesivas
+                nuevo = max(n, 2 * self.limite, self.LIMITE_INICIAL)
+                nuevo = -(-nuevo // self.ALINEACION) * self.ALINEACION
+                self._extender(min(nuevo, self.LIMITE_MAXIMO))
+    
+    def _extender(self, nuevo_limite: int) -> None:
+        """Criba solo el tramo [limite, nuevo_limite) y lo agrega al bitset"""
+        inicio = self.limite
+        raiz = math.isqrt(nuevo_limite - 1)
+        primos_base = self._primos if raiz < inicio else _criba_simple(raiz)
+        banderas = _cribar_impares(inicio, nuevo_limite, primos_base)
+        
+        # Empaquetar 8 banderas por byte: invertir y leer en base 2 deja la bandera j en el bit j
+        bits = int(banderas[::-1].translate(_BANDERAS_A_BITS), 2)
+        self._bits += bits.to_bytes(len(banderas) // 8, 'little')
+        
+        if inicio == 0:
+            self._primos.append(2)
+        self._primos.extend(compress(range(inicio + 1, nuevo_limite, 2), banderas))
+        self.limite = nuevo_limite
+    
+    def es_primo(self, n: int) -> bool:
+        """Consulta O(1) del bitset; requiere 0 <= n < limite"""
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        i = n >> 1
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+    
+    def es_primo_lote(self, numeros):
+        """Consulta el bitset para un arreglo NumPy de enteros no negativos"""
+        resultado = np.zeros(numeros.shape, dtype=bool)
+        if numeros.size == 0:
+            return resultado
+        
+        maximo = int(numeros.max())
+        if maximo < self.LIMITE_LOTE:
+            self.asegurar(maximo + 1)
+        
+        limite = self.limite
+        # Una vista directa del bytearray impediría ampliarlo, así que se guarda una copia
+        # y solo se rehace cuando la tabla ha crecido desde la última consulta
+        bits = self._bits_lote
+        if bits is None or bits.size * self.ALINEACION < limite:
+            bits = self._bits_lote = np.frombuffer(bytes(self._bits), dtype=np.uint8)
+        
+        dentro = numeros < limite
+        candidatos = numeros[dentro]
+        indices = candidatos >> 1
+        marcados = (bits[indices >> 3] >> (indices & 7).astype(np.uint8)) & 1
+        resultado[dentro] = ((marcados == 1) & (candidatos % 2 == 1)) | (candidatos == 2)
+        
+        for i in np.flatnonzero(~dentro):
+            resultado[i] = AritmeticaBasica.es_primo(int(numeros[i]))
+        return resultado
+    
+    def primos_hasta(self, limite: int) -> List[int]:
+        """Devuelve los primos menores o iguales que limite como porción de la lista cacheada"""
+        if limite < 2:
+            return []
+        self.asegurar(limite + 1)
+        return self._primos[:bisect_right(self._primos, limite)].tolist()
+    
+    def primos_base(self, limite: int) -> array:
+        """Como primos_hasta, pero devuelve un array('I') compacto en lugar de una lista"""
+        if limite < 2:
+            return array('I')
+        self.asegurar(limite + 1)
+        return self._primos[:bisect_right(self._primos, limite)]
+    
+    def primos_entre(self, a: int, b: int) -> array:
+        """Primos de [a, b] ya presentes en la tabla, sin ampliarla"""
+        return self._primos[bisect_left(self._primos, a):bisect_right(self._primos, b)]
+    
+    def contar_entre(self, a: int, b: int) -> int:
+        """Cantidad de primos de [a, b] ya presentes en la tabla, sin ampliarla"""
+        return max(0, bisect_right(self._primos, b) - bisect_left(self._primos, a))
+    
+    def enesimo(self, n: int) -> Union[int, None]:
+        """n-ésimo primo si la tabla ya lo contiene, None en otro caso"""
+        return self._primos[n - 1] if 1 <= n <= len(self._primos) else None
+
+# Tabla de primos compartida por todas las funciones del módulo
+_tabla_primos = TablaPrimos()
+
+# Mapa de primos en disco (MapaPrimos de mapa_primos.py); None mientras no se cargue ninguno
+_mapa_primos = None
+
+def _segmentos_impares(a: int, b: int, segmento: int) -> Iterator[Tuple[int, int, bytearray]]:
+    """Criba segmentada de los impares de [a, b]: genera (inicio, fin, banderas) por segmento.
+    
+    Solo guarda los primos hasta √b y un bytearray de segmento impares, así que la memoria es
+    O(√b + segmento) aunque el intervalo sea enorme o esté lejos del origen.
+    """
+    if segmento < 1:
+        raise ValueError("El tamaño del segmento debe ser positivo")
+    raiz = math.isqrt(b)
+    if raiz >= TablaPrimos.LIMITE_MAXIMO:
+        raise ValueError(f"La criba segmentada solo admite intervalos por debajo de {TablaPrimos.LIMITE_MAXIMO}²")
+    if raiz < _tabla_primos.limite or raiz < TablaPrimos.LIMITE_AUTOMATICO:
+        primos_base = _tabla_primos.primos_base(raiz)
+    else:
+        # Los primos base se criban en un array local que se libera al terminar: una consulta lejana
+        # no debe dejar la tabla compartida del proceso agrandada hasta √b
+        primos_base = array('I', [2])
+        for inicio_base, fin_base, banderas in _segmentos_impares(0, raiz, segmento):
+            primos_base.extend(compress(range(inicio_base + 1, fin_base, 2), banderas))
+    
+    inicio = a - a % 2  # Par: el primer candidato es inicio + 1
+    while inicio < b:
+        fin = min(inicio + 2 * segmento, b + 1)
+        yield inicio, fin, _cribar_impares(inicio, fin, primos_base)
+        inicio += 2 * segmento
+
+class TablaFactorMinimo:
+    """Tabla del menor factor primo de cada entero para factorizar en O(log n)"""
+    
+    LIMITE_LOTE = 1 << 23  # Límite hasta el que factorizar_lote amplía la tabla
+    LIMITE_MAXIMO = 1 << 32  # Los factores se guardan en un array('I')
+    
+    def __init__(self):
+        self.limite = 0  # La tabla cubre los enteros de [0, limite)
+        self._spf = array('I')  # 0 indica que el número es primo (o 0 y 1)
+        self._candado = threading.Lock()
+    
+    def asegurar(self, n: int) -> None:
+        """Amplía la tabla, si hace falta, para cubrir todos los enteros menores que n"""
+        if n <= self.limite:
+            return
+        if n > self.LIMITE_MAXIMO:
+            raise ValueError(f"La tabla de factores no puede superar {self.LIMITE_MAXIMO}")
+        
+        with self._candado:
+            if n > self.limite:
+                self._extender(min(max(n, 2 * self.limite), self.LIMITE_MAXIMO))
+    
+    def _extender(self, nuevo_limite: int) -> None:
+        """Calcula el menor factor primo del tramo [limite, nuevo_limite)"""
+        inicio = self.limite
+        tramo = array('I', bytes(self._spf.itemsize * (nuevo_limite - inicio)))
+        
+        # Recorrer los primos de mayor a menor para que el más pequeño escriba el último
+        for p in reversed(_tabla_primos.primos_hasta(math.isqrt(nuevo_limite - 1))):
+            primero = max(p * p, (inicio + p - 1) // p * p)
+            if primero < nuevo_limite:
+                cantidad = (nuevo_limite - 1 - primero) // p + 1
+                tramo[primero - inicio::p] = array('I', [p]) * cantidad
+        
+        self._spf.extend(tramo)
+        self.limite = nuevo_limite
+    
+    def factorizar(self, n: int) -> Dict[int, int]:
+        """Factoriza 2 <= n < limite siguiendo la cadena de menores factores primos"""
+        spf = self._spf
+        factorizacion = {}
+        while n > 1:
+            p = spf[n] or n
+            n //= p
+            factorizacion[p] = factorizacion.get(p, 0) + 1
+        return factorizacion
+
+# Tabla de menores factores primos; solo crece al pedir factorizaciones en lote
+_tabla_factor_minimo = TablaFactorMinimo()
+
+class TablaFuncionesAritmeticas:
+    """Tablas de sigma (suma de divisores), tau (número de divisores), phi de Euler y Möbius"""
+    
+    LIMITE_INICIAL = 1 << 12
+    LIMITE_AUTOMATICO = 1 << 16  # Las consultas sueltas solo amplían la tabla por debajo de este valor
+    LIMITE_LOTE = 1 << 22  # Límite hasta el que las consultas por rangos amplían la tabla
+    LIMITE_MAXIMO = 1 << 26  # Unos 17 bytes por entero entre las cuatro tablas
+    
+    def __init__(self):
+        self.limite = 0  # Las tablas cubren los enteros de [0, limite)
+        self._sigma = array('Q')
+        self._tau = array('H')
+        self._phi = array('I')
+        self._mu = array('b')
+        self._candado = threading.Lock()
+    
+    def asegurar(self, n: int) -> None:
+        """Amplía las tablas, si hace falta, para cubrir todos los enteros menores que n"""
+        if n <= self.limite:
+            return
+        if n > self.LIMITE_MAXIMO:
+            raise ValueError(f"Las tablas de funciones aritméticas no pueden superar {self.LIMITE_MAXIMO}")
+        
+        with self._candado:
+            if n > self.limite:
+                self._extender(min(max(n, 2 * self.limite, self.LIMITE_INICIAL), self.LIMITE_MAXIMO))
+    
+    def _extender(self, nuevo_limite: int) -> None:
+        """Criba el tramo [limite, nuevo_limite) con las potencias de los primos hasta su raíz.
+        
+        Cada potencia p^j actualiza por rebanadas a todos sus múltiplos; lo que queda en resto
+        tras dividir por esos primos es 1 o un único primo grande, que se aplica al final.
+        """
+        inicio = self.limite
+        tamano = nuevo_limite - inicio
+        resto = array('I', range(inicio, nuevo_limite))
+        phi = array('I', range(inicio, nuevo_limite))
+        tau = array('H', [1]) * tamano
+        sigma = array('Q', [1]) * tamano
+        mu = array('b', [1]) * tamano
+        
+        for p in _tabla_primos.primos_base(math.isqrt(nuevo_limite - 1)):
+            rebanada = slice(max(p, -(-inicio // p) * p) - inicio, None, p)
+            phi[rebanada] = array('I', [x - x // p for x in phi[rebanada]])
+            mu[rebanada] = array('b', [-x for x in mu[rebanada]])
+            
+            # Al pasar de p^(j-1) a p^j el factor de p en tau va de j a j + 1 y en sigma de
+            # 1 + p + ... + p^(j-1) a 1 + p + ... + p^j
+            potencia, j, suma_anterior = p, 1, 1
+            while potencia < nuevo_limite:
+                suma = suma_anterior + potencia
+                rebanada = slice(max(potencia, -(-inicio // potencia) * potencia) - inicio, None, potencia)
+                resto[rebanada] = array('I', [x // p for x in resto[rebanada]])
+                tau[rebanada] = array('H', [x // j * (j + 1) for x in tau[rebanada]])
+                sigma[rebanada] = array('Q', [x // suma_anterior * suma for x in sigma[rebanada]])
+                if j == 2:
+                    mu[rebanada] = array('b', [0]) * len(mu[rebanada])
+                potencia, j, suma_anterior = potencia * p, j + 1, suma
+        
+        # El primo grande que quede en resto aparece con exponente 1
+        phi = array('I', [x - x // r if r > 1 else x for x, r in zip(phi, resto)])
+        tau = array('H', [2 * x if r > 1 else x for x, r in zip(tau, resto)])
+        sigma = array('Q', [x * (r + 1) if r > 1 else x for x, r in zip(sigma, resto)])
+        mu = array('b', [-x if r > 1 else x for x, r in zip(mu, resto)])
+        if inicio == 0:
+            tau[0] = sigma[0] = mu[0] = 0
+        
+        self._sigma.extend(sigma)
+        self._tau.extend(tau)
+        self._phi.extend(phi)
+        self._mu.extend(mu)
+        self.limite = nuevo_limite
+    
+    def sigma(self, n: int) -> int:
+        """Suma de los divisores de 0 <= n < limite"""
+        return self._sigma[n]
+    
+    def tau(self, n: int) -> int:
+        """Número de divisores de 0 <= n < limite"""
+        return self._tau[n]
+    
+    def phi(self, n: int) -> int:
+        """Función phi de Euler de 0 <= n < limite"""
+        return self._phi[n]
+    
+    def mu(self, n: int) -> int:
+        """Función de Möbius de 0 <= n < limite"""
+        return self._mu[n]
+    
+    def rango(self, inicio: int, fin: int) -> Dict[str, List[int]]:
+        """Las cuatro funciones para [inicio, fin), con fin <= limite, en listas paralelas"""
+        return {
+            'sigma': self._sigma[inicio:fin].tolist(),
+            'tau': self._tau[inicio:fin].tolist(),
+            'phi': self._phi[inicio:fin].tolist(),
+            'mu': self._mu[inicio:fin].tolist()
+        }
+    
+    def cubre(self, n: int) -> bool:
+        """Indica si n está en las tablas, ampliándolas antes si es pequeño"""
+        if 0 <= n < self.LIMITE_AUTOMATICO:
+            self.asegurar(n + 1)
+        return 0 <= n < self.limite
+
+# Tablas de funciones aritméticas compartidas por el módulo
+_tabla_aritmetica = TablaFuncionesAritmeticas()
+
+# Primos pequeños para descartar compuestos antes de Miller–Rabin
+_PRIMOS_PEQUENOS = tuple(_criba_simple(100))
+
+# Bases que hacen determinista a Miller–Rabin para todo n menor que la cota
+# (Jaeschke; Sorenson y Webster). Cubren holgadamente los enteros de 64 bits.
+_BASES_MILLER_RABIN = (
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+)
+
+# Generador propio para bases de Miller–Rabin y semillas de Pollard–rho,
+# así no se consume el estado global de random
+_azar_interno = random.Random()
+
+def _miller_rabin(n: int, bases) -> bool:
+    """Prueba fuerte de Miller–Rabin para n impar mayor que 3 con las bases dadas"""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = Potenciacion.potencia_modular(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    
+    return True
+
+# No existen números perfectos impares por debajo de 10^1500 (Ochem y Rao, 2012)
+_COTA_IMPARES_PERFECTOS = 10 ** 1500
+
+def _lucas_lehmer(p: int) -> bool:
+    """Prueba de Lucas–Lehmer: indica si el número de Mersenne 2^p - 1 es primo"""
+    if p == 2:
+        return True
+    if not AritmeticaBasica.es_primo(p):
+        return False
+    
+    mersenne = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = (s * s - 2) % mersenne
+    return s == 0
+
+# Números perfectos pares que caben en 64 bits: 2^(p-1)(2^p - 1) para los primeros primos de Mersenne
+_PERFECTOS_64_BITS = [(1 << (p - 1)) * ((1 << p) - 1) for p in (2, 3, 5, 7, 13, 17, 19, 31)]
+
+# Claves en el orden en que clasificar_numero construye su diccionario
+_CLAVES_CLASIFICACION = ('natural', 'entero', 'racional', 'irracional', 'real',
+                         'par', 'impar', 'primo', 'compuesto', 'perfecto')
+
+# Primos para la división tentativa previa a Pollard–rho
+_PRIMOS_DIVISION = tuple(_criba_simple(1000))
+
+def _pollard_brent(n: int) -> int:
+    """Devuelve un divisor no trivial de n compuesto usando la variante de Brent de Pollard–rho"""
+    if n % 2 == 0:
+        return 2
+    
+    while True:
+        y = _azar_interno.randrange(1, n)
+        c = _azar_interno.randrange(1, n)
+        m = 128  # Diferencias acumuladas en el producto antes de cada mcd
+        g = r = q = 1
+        
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        
+        # El producto acumulado saltó el divisor: repetir paso a paso desde ys
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        
+        if g != n:
+            return g
+
+def _factorizar(n: int) -> Dict[int, int]:
+    """Factorización por niveles: división por primos cacheados y luego Pollard–Brent"""
+    factorizacion = {}
+    
+    for p in _PRIMOS_DIVISION:
+        if p * p > n:
+            break
+        if n % p == 0:
+            exponente = 0
+            while n % p == 0:
+                n //= p
+                exponente += 1
+            factorizacion[p] = exponente
+    
+    # Lo que queda no tiene factores pequeños: se comprueba primalidad antes de cada división
+    pendientes = [n] if n > 1 else []
+    while pendientes:
+        m = pendientes.pop()
+        if AritmeticaBasica.es_primo(m):
+            factorizacion[m] = factorizacion.get(m, 0) + 1
+        else:
+            d = _pollard_brent(m)
+            pendientes.append(d)
+            pendientes.append(m // d)
+    
+    return dict(sorted(factorizacion.items()))
+
+def _resto_cifras(cifras: Union[str, Iterable[str]], modulo: int, bloque: int = 2048) -> int:
+    """Resto módulo modulo de |número| leyendo sus cifras decimales una sola vez.
+    
+    Acepta una cadena, un iterable de fragmentos o un objeto con read(); el número es un signo
+    opcional seguido solo de cifras, con a lo sumo un salto de línea final (el de un archivo de
+    texto). La memoria no depende de la longitud.
+    """
+    if isinstance(cifras, str):
+        fragmentos = (cifras[i:i + bloque] for i in range(0, len(cifras), bloque))
+    elif hasattr(cifras, 'read'):
+        fragmentos = iter(lambda: cifras.read(bloque), cifras.read(0))
+    else:
+        fragmentos = cifras
+    
+    resto, hay_cifras, potencia_bloque = 0, False, pow(10, bloque, modulo)
+    primero, terminado = True, False
+    for fragmento in fragmentos:
+        if isinstance(fragmento, bytes):
+            fragmento = fragmento.decode('ascii')
+        if not fragmento:
+            continue
+        if terminado:
+            raise ValueError("El número solo puede contener dígitos decimales")
+        if fragmento.endswith('\n'):
+            fragmento, terminado = fragmento[:-1], True
+        if primero and fragmento[:1] in ('-', '+'):
+            fragmento = fragmento[1:]
+        primero = False
+        if not fragmento:
+            continue
+        if not (fragmento.isascii() and fragmento.isdigit()):
+            raise ValueError("El número solo puede contener dígitos decimales")
+        
+        hay_cifras = True
+        # Horner por bloques: cada bloque de cifras entra con una sola conversión y una multiplicación
+        for i in range(0, len(fragmento), bloque):
+            pieza = fragmento[i:i + bloque]
+            potencia = potencia_bloque if len(pieza) == bloque else pow(10, len(pieza), modulo)
+            resto = (resto * potencia + int(pieza)) % modulo
+    
+    if not hay_cifras:
+        raise ValueError("El número no contiene cifras")
+    return resto
+
+_MINIMO_INT64 = -2 ** 63
+_MAXIMO_INT64 = 2 ** 63 - 1
+
+def _enteros_int64(valores):
+    """Arreglo int64 con los carriles que caben de forma segura y máscara de los que no.
+    
+    Se excluye también -2^63, cuyo valor absoluto no cabe en int64; los carriles que no son
+    enteros (float, Fraction...) quedan siempre fuera.
+    """
+    if valores.dtype.kind in 'bi':
+        enteros = valores.astype(np.int64)
+        return enteros, enteros == _MINIMO_INT64
+    if valores.dtype.kind == 'u':
+        fuera = valores > _MAXIMO_INT64
+        return np.where(fuera, 0, valores).astype(np.int64), fuera
+    if valores.dtype.kind == 'O':
+        fuera = np.array([type(x) is not int or not _MINIMO_INT64 < x <= _MAXIMO_INT64 for x in valores.flat],
+                         dtype=bool).reshape(valores.shape)
+        enteros = np.array([0 if f else x for x, f in zip(valores.flat, fuera.flat)],
+                           dtype=np.int64).reshape(valores.shape)
+        return enteros, fuera
+    return np.zeros(valores.shape, dtype=np.int64), np.ones(valores.shape, dtype=bool)
+
+def _por_pares(a, b, rapida, escalar):
+    """Aplica una operación entera por pares sobre arreglos NumPy o secuencias de enteros.
+    
+    rapida trabaja sobre los carriles int64 y devuelve (resultado, desbordados); los carriles
+    desbordados o que no caben en int64 se recalculan con la función escalar sobre int de
+    Python, así que cada resultado coincide exactamente con el de la versión escalar.
+    """
+    if np is None:
+        return [escalar(x, y) for x, y in zip(a, b)]
+    
+    a, b = np.broadcast_arrays(np.asarray(a), np.asarray(b))
+    enteros_a, fuera_a = _enteros_int64(a)
+    enteros_b, fuera_b = _enteros_int64(b)
+    fuera = fuera_a | fuera_b
+    resultado, desbordados = rapida(np.where(fuera, 0, enteros_a), np.where(fuera, 0, enteros_b))
+    
+    lentos = fuera | desbordados
+    if lentos.any():
+        if resultado.dtype != bool:
+            resultado = resultado.astype(object)
+        resultado[lentos] = [escalar(x, y) for x, y in zip(a[lentos].tolist(), b[lentos].tolist())]
+    return resultado
+
+def _mcd_int64(a, b):
+    """mcd por carriles; sin -2^63 en la entrada np.gcd no puede desbordar"""
+    return np.gcd(a, b), np.zeros(a.shape, dtype=bool)
+
+def _mcm_int64(a, b):
+    """mcm por carriles como |a| / mcd · |b|, marcando los carriles cuyo producto no cabe en int64"""
+    ceros = (a == 0) | (b == 0)
+    cociente = np.abs(a) // np.where(ceros, 1, np.gcd(a, b))
+    absoluto_b = np.abs(b)
+    desbordados = ~ceros & (cociente > _MAXIMO_INT64 // np.maximum(absoluto_b, 1))
+    return np.where(ceros | desbordados, 0, cociente * absoluto_b), desbordados
+
+def _es_divisible_int64(dividendos, divisores):
+    """es_divisible por carriles: un divisor 0 da False"""
+    restos = dividendos % np.where(divisores == 0, 1, divisores)
+    return (divisores != 0) & (restos == 0), np.zeros(dividendos.shape, dtype=bool)
+
 class AritmeticaBasica:
     """Clase para manejar operaciones de aritmética básica"""
     
     @staticmethod
     def es_primo(n: int) -> bool:
         """Verifica si un número es primo"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
+        n = _entero_exacto(n)
+        if n is None:
             return False
+        if n < _tabla_primos.limite:
+            return _tabla_primos.es_primo(n)
+        if _mapa_primos is not None and n < _mapa_primos.limite:
+            return _mapa_primos.es_primo(n)
+        if n < TablaPrimos.LIMITE_AUTOMATICO:
+            _tabla_primos.asegurar(n + 1)
+            return _tabla_primos.es_primo(n)
         
-        for i in range(3, int(math.sqrt(n)) + 1, 2):
-            if n % i == 0:
+        for p in _PRIMOS_PEQUENOS:
+            if n % p == 0:
                 return False
-        return True
+        
+        # Miller–Rabin determinista mientras exista un conjunto de bases conocido
+        for cota, bases in _BASES_MILLER_RABIN:
+            if n < cota:
+                return _miller_rabin(n, bases)
+        return AritmeticaBasica.es_primo_probable(n)
+    
+    @staticmethod
+    def es_primo_probable(n: int, rondas: int = 24) -> bool:
+        """Prueba de probable primo fuerte para enteros de cualquier tamaño (base 2 y bases aleatorias)"""
+        if n < 2:
+            return False
+        for p in _PRIMOS_PEQUENOS:
+            if n % p == 0:
+                return n == p
+        
+        # Cada ronda fuerte deja pasar a un compuesto con probabilidad menor que 1/4
+        bases = [2] + [_azar_interno.randrange(3, n - 1) for _ in range(rondas)]
+        return _miller_rabin(n, bases)
     
     @staticmethod
     def generar_primos(limite: int) -> List[int]:
         """Genera todos los números primos hasta un límite usando la Criba de Eratóstenes"""
-        if limite < 2:
-            return []
+        if limite < _tabla_primos.limite:
+            return _tabla_primos.primos_hasta(limite)
+        # Con un mapa compartido cargado no se duplica la criba en la tabla de cada proceso
+        if _mapa_primos is not None and limite < _mapa_primos.limite:
+            return _mapa_primos.primos_hasta(limite)
+        if limite < TablaPrimos.LIMITE_LOTE:
+            return _tabla_primos.primos_hasta(limite)
+        # Por encima, la criba segmentada evita agrandar la tabla compartida del proceso
+        return list(AritmeticaBasica.primos_en_intervalo(2, limite))
+    
+    @staticmethod
+    def primos_en_intervalo(a: int, b: int, segmento: int = 1 << 18) -> Iterator[int]:
+        """Genera en orden los primos de [a, b] con una criba segmentada de impares.
+        
+        segmento es el número de impares (bytes) que se criban a la vez; el valor por defecto,
+        256 KiB, cabe en la caché L2 de la mayoría de procesadores.
+        """
+        a = max(a, 2)
+        if b < a:
+            return
+        if b < _tabla_primos.limite:
+            # El tramo ya está en la tabla compartida
+            yield from _tabla_primos.primos_entre(a, b)
+            return
+        if _mapa_primos is not None and b < _mapa_primos.limite:
+            yield from _mapa_primos.primos_entre(a, b)
+            return
+        
+        if a == 2:
+            yield 2
+        for inicio, fin, banderas in _segmentos_impares(a, b, segmento):
+            yield from compress(range(inicio + 1, fin, 2), banderas)
+    
+    @staticmethod
+    def contar_primos(b: int, a: int = 2, segmento: int = 1 << 18) -> int:
+        """Cuenta los primos de [a, b]; con un solo argumento es la función π(b)"""
+        a = max(a, 2)
+        if b < a:
+            return 0
+        if b < _tabla_primos.limite:
+            return _tabla_primos.contar_entre(a, b)
+        if _mapa_primos is not None and b < _mapa_primos.limite:
+            return _mapa_primos.contar_entre(a, b)
         
-        es_primo = [True] * (limite + 1)
-        es_primo[0] = es_primo[1] = False
+        cantidad = 1 if a == 2 else 0
+        for _, _, banderas in _segmentos_impares(a, b, segmento):
+            cantidad += banderas.count(1)
+        return cantidad
+    
+    @staticmethod
+    def enesimo_primo(n: int, segmento: int = 1 << 18) -> int:
+        """Devuelve el n-ésimo primo (enesimo_primo(1) = 2)"""
+        if n < 1:
+            raise ValueError("La posición del primo debe ser al menos 1")
+        _tabla_primos.asegurar(TablaPrimos.LIMITE_INICIAL)
+        primo = _tabla_primos.enesimo(n)
+        if primo is not None:
+            return primo
         
-        for i in range(2, int(math.sqrt(limite)) + 1):
-            if es_primo[i]:
-                for j in range(i * i, limite + 1, i):
-                    es_primo[j] = False
+        # Cota superior de Rosser: p_n < n (ln n + ln ln n) para n >= 6
+        cota = int(n * (math.log(n) + math.log(math.log(n)))) + 1
+        # Seguir contando por segmentos desde el final de la tabla hasta alcanzar la posición n
+        inicio = _tabla_primos.limite
+        cantidad = _tabla_primos.contar_entre(0, inicio)
+        for desde, fin, banderas in _segmentos_impares(inicio, cota, segmento):
+            en_segmento = banderas.count(1)
+            if cantidad + en_segmento >= n:
+                candidatos = compress(range(desde + 1, fin, 2), banderas)
+                return next(islice(candidatos, n - cantidad - 1, None))
+            cantidad += en_segmento
+        raise ValueError("No se encontró el primo pedido")  # No debería ocurrir por la cota de Rosser
+    
+    @staticmethod
+    def cargar_mapa_primos(ruta: Union[str, None], verificar: bool = False) -> None:
+        """Consulta los primos en un mapa de bits precalculado en disco; con None se deja de usar.
         
-        return [i for i in range(2, limite + 1) if es_primo[i]]
+        El archivo (ver mapa_primos.py) se abre con mmap de solo lectura, así que todos los
+        procesos que lo cargan comparten las mismas páginas de la caché del sistema operativo.
+        """
+        global _mapa_primos
+        mapa = None
+        if ruta is not None:
+            from mapa_primos import MapaPrimos  # Solo en el servidor: el navegador no carga este módulo
+            mapa = MapaPrimos(ruta, verificar)
+        # Los mapas anteriores no se cierran: otro hilo podría estar consultándolos todavía
+        _mapa_primos = mapa
     
     @staticmethod
     def factores_primos(n: int) -> List[int]:
         """Encuentra los factores primos de un número"""
-        if n <= 1:
-            return []
-        
         factores = []
-        d = 2
-        while d * d <= n:
-            while n % d == 0:
-                factores.append(d)
-                n //= d
-            d += 1
-        if n > 1:
-            factores.append(n)
+        for factor, exponente in AritmeticaBasica.factorizacion_completa(n).items():
+            factores.extend([factor] * exponente)
         return factores
     
     @staticmethod
     def factorizacion_completa(n: int) -> Dict[int, int]:
         """Devuelve la factorización completa como diccionario {factor: exponente}"""
-        factores = AritmeticaBasica.factores_primos(n)
-        factorizacion = {}
-        
-        for factor in factores:
-            factorizacion[factor] = factorizacion.get(factor, 0) + 1
+        if n <= 1:
+            return {}
+        if n < _tabla_factor_minimo.limite:
+            return _tabla_factor_minimo.factorizar(n)
+        return _factorizar(n)
+    
+    @staticmethod
+    def factorizar_lote(numeros: Iterable[int]) -> List[Dict[int, int]]:
+        """Factoriza una lista o rango de números de una vez usando la tabla de menores factores primos"""
+        numeros = list(numeros)
+        maximo = max(numeros, default=0)
+        if maximo < TablaFactorMinimo.LIMITE_LOTE:
+            _tabla_factor_minimo.asegurar(maximo + 1)
         
-        return factorizacion
+        tabla = _tabla_factor_minimo
+        return [tabla.factorizar(n) if 1 < n < tabla.limite else AritmeticaBasica.factorizacion_completa(n)
+                for n in numeros]
     
     @staticmethod
     def mcd(a: int, b: int) -> int:
@@ -170,14 +933,14 @@ class AritmeticaBasica:
     @staticmethod
     def mcd_extendido(a: int, b: int) -> Tuple[int, int, int]:
         """Algoritmo extendido de Euclides: devuelve (mcd, x, y) donde ax + by = mcd"""
-        if a == 0:
-            return b, 0, 1
-        
-        mcd, x1, y1 = AritmeticaBasica.mcd_extendido(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
+        # Versión iterativa: los pares (x, y) acompañan a a y b en cada paso (a, b) -> (b % a, a)
+        x_a, y_a, x_b, y_b = 1, 0, 0, 1
+        while a != 0:
+            q = b // a
+            a, b = b - q * a, a
+            x_a, y_a, x_b, y_b = x_b - q * x_a, y_b - q * y_a, x_a, y_a
         
-        return mcd, x, y
+        return b, x_b, y_b
     
     @staticmethod
     def mcm(a: int, b: int) -> int:
@@ -187,27 +950,76 @@ class AritmeticaBasica:
         return abs(a * b) // AritmeticaBasica.mcd(a, b)
     
     @staticmethod
-    def mcm_lista(numeros: List[int]) -> int:
-        """Calcula el MCM de una lista de números"""
-        if not numeros:
+    def mcd_lote(a, b):
+        """mcd por pares de dos arreglos NumPy o secuencias de enteros de cualquier tamaño.
+        
+        Devuelve un arreglo int64 (de objetos si algún carril necesita un int de Python) o una
+        lista si NumPy no está disponible; cada valor coincide con el de mcd.
+        """
+        return _por_pares(a, b, _mcd_int64, AritmeticaBasica.mcd)
+    
+    @staticmethod
+    def mcm_lote(a, b):
+        """mcm por pares; los carriles cuyo resultado no cabe en int64 se calculan con int de Python"""
+        return _por_pares(a, b, _mcm_int64, AritmeticaBasica.mcm)
+    
+    @staticmethod
+    def mcm_lista(numeros: Iterable[int], procesos: int = 1) -> int:
+        """Calcula el MCM de una lista o flujo de números.
+        
+        De los enteros pequeños solo se guarda el mayor exponente de cada primo (con la tabla de
+        menores factores); el resultado sale de multiplicar esas potencias en un árbol equilibrado,
+        de modo que cada multiplicación junta operandos de tamaño parecido. Un 0 termina la
+        lectura. Con procesos > 1 los bloques de la entrada se reparten entre varios procesos.
+        """
+        iterador = iter(numeros)
+        primero = next(iterador, None)
+        if primero is None:
             return 0
+        segundo = next(iterador, None)
+        if segundo is None:
+            return primero
         
-        resultado = numeros[0]
-        for i in range(1, len(numeros)):
-            resultado = AritmeticaBasica.mcm(resultado, numeros[i])
+        numeros = chain((primero, segundo), iterador)
+        if procesos > 1:
+            parciales = _en_procesos(_mcm_parcial, _bloques(numeros, 1 << 16), procesos)
+        else:
+            parciales = [_mcm_parcial(numeros)]
         
-        return resultado
+        exponentes, otros = {}, None
+        for exponentes_parte, otros_parte in parciales:
+            for p, e in exponentes_parte.items():
+                if e > exponentes.get(p, 0):
+                    exponentes[p] = e
+            if otros_parte is not None:
+                otros = otros_parte if otros is None else _mcm_exacto(otros, otros_parte)
+        
+        potencias = _reducir_en_arbol((p ** e for p, e in exponentes.items()), int.__mul__, 1)
+        return potencias if otros is None else _mcm_exacto(potencias, otros)
     
     @staticmethod
-    def mcd_lista(numeros: List[int]) -> int:
-        """Calcula el MCD de una lista de números"""
-        if not numeros:
-            return 0
+    def mcd_lista(numeros: Iterable[int], procesos: int = 1) -> int:
+        """Calcula el MCD de una lista o flujo de números; deja de leer en cuanto el MCD llega a 1.
         
-        resultado = numeros[0]
-        for i in range(1, len(numeros)):
-            resultado = AritmeticaBasica.mcd(resultado, numeros[i])
+        Con procesos > 1 los bloques de la entrada se reparten entre varios procesos.
+        """
+        if procesos > 1:
+            parciales = _en_procesos(AritmeticaBasica.mcd_lista, _bloques(numeros, 1 << 16), procesos)
+            return _reducir_en_arbol(parciales, AritmeticaBasica.mcd, 0)
         
+        iterador = iter(numeros)
+        resultado = next(iterador, None)
+        if resultado is None:
+            return 0
+        
+        for bloque in _bloques(iterador, 4096):
+            try:
+                resultado = math.gcd(resultado, *bloque)
+            except TypeError:
+                for numero in bloque:
+                    resultado = AritmeticaBasica.mcd(resultado, numero)
+            if resultado == 1:
+                break
         return resultado
     
     @staticmethod
@@ -216,16 +1028,40 @@ class AritmeticaBasica:
         if n == 0:
             return []
         
-        n = abs(n)
-        divisores = []
+        # Producto multiplicativo: cada potencia p^k escala una lista ya ordenada,
+        # así que basta mezclar las listas escaladas para mantener el orden
+        divisores = [1]
+        for p, e in AritmeticaBasica.factorizacion_completa(abs(n)).items():
+            potencias = [p ** k for k in range(e + 1)]
+            divisores = list(heapq.merge(*([d * q for d in divisores] for q in potencias)))
         
-        for i in range(1, int(math.sqrt(n)) + 1):
-            if n % i == 0:
-                divisores.append(i)
-                if i != n // i:
-                    divisores.append(n // i)
+        return divisores
+    
+    @staticmethod
+    def numero_divisores(n: int) -> int:
+        """Cuenta los divisores de un número a partir de los exponentes de su factorización"""
+        if n == 0:
+            return 0
+        if _tabla_aritmetica.cubre(abs(n)):
+            return _tabla_aritmetica.tau(abs(n))
         
-        return sorted(divisores)
+        total = 1
+        for exponente in AritmeticaBasica.factorizacion_completa(abs(n)).values():
+            total *= exponente + 1
+        return total
+    
+    @staticmethod
+    def suma_divisores(n: int) -> int:
+        """Suma los divisores de un número con la fórmula multiplicativa de sigma"""
+        if n == 0:
+            return 0
+        if _tabla_aritmetica.cubre(abs(n)):
+            return _tabla_aritmetica.sigma(abs(n))
+        
+        total = 1
+        for p, e in AritmeticaBasica.factorizacion_completa(abs(n)).items():
+            total *= (p ** (e + 1) - 1) // (p - 1)
+        return total
     
     @staticmethod
     def es_divisible(dividendo: int, divisor: int) -> bool:
@@ -235,66 +1071,551 @@ class AritmeticaBasica:
         return dividendo % divisor == 0
     
     @staticmethod
-    def criterios_divisibilidad(n: int) -> Dict[int, bool]:
-        """Aplica criterios de divisibilidad para números del 2 al 11"""
-        n_abs = abs(n)
-        n_str = str(n_abs)
-        criterios = {}
+    def es_divisible_lote(dividendos, divisores):
+        """es_divisible por pares; devuelve un arreglo de booleanos (o una lista sin NumPy)"""
+        return _por_pares(dividendos, divisores, _es_divisible_int64, AritmeticaBasica.es_divisible)
+    
+    @staticmethod
+    def criterios_divisibilidad(n: Union[int, str, Iterable[str]], modulos: Iterable[int] = ()) -> Dict[int, bool]:
+        """Aplica criterios de divisibilidad para números del 2 al 11 y para los módulos adicionales.
         
-        # Divisibilidad por 2
-        criterios[2] = n_abs % 2 == 0
+        n puede ser un entero, una cadena de dígitos o un flujo de fragmentos de texto (por
+        ejemplo, un archivo abierto con un número de millones de cifras). Todos los criterios
+        salen de un único resto módulo el mcm de los divisores, calculado en una sola pasada.
+        """
+        divisores = list(range(2, 12))
+        for m in modulos:
+            if m < 1:
+                raise ValueError("Los módulos de divisibilidad deben ser enteros positivos")
+            if m not in divisores:
+                divisores.append(m)
         
-        # Divisibilidad por 3
-        suma_digitos = sum(int(d) for d in n_str)
-        criterios[3] = suma_digitos % 3 == 0
+        modulo = math.lcm(*divisores)
+        # Un entero se reduce directamente: convertirlo en texto sería cuadrático
+        resto = abs(n) % modulo if isinstance(n, int) else _resto_cifras(n, modulo)
+        return {m: resto % m == 0 for m in divisores}
+
+class AritmeticaModular:
+    """Clase para aritmética modular: inversos, congruencias y logaritmo discreto"""
+    
+    @staticmethod
+    def indicatriz_euler(n: int) -> int:
+        """Función phi de Euler: cantidad de enteros en [1, n] coprimos con n"""
+        if n <= 0:
+            raise ValueError("La función phi solo está definida para enteros positivos")
+        if _tabla_aritmetica.cubre(n):
+            return _tabla_aritmetica.phi(n)
         
-        # Divisibilidad por 4
-        if len(n_str) >= 2:
-            ultimos_dos = int(n_str[-2:])
-            criterios[4] = ultimos_dos % 4 == 0
-        else:
-            criterios[4] = n_abs % 4 == 0
-        
-        # Divisibilidad por 5
-        criterios[5] = n_str[-1] in ['0', '5']
-        
-        # Divisibilidad por 6
-        criterios[6] = criterios[2] and criterios[3]
-        
-        # Divisibilidad por 7 (método de divisibilidad)
-        if len(n_str) >= 2:
-            resto = n_abs
-            while resto >= 70:
-                ultimo_digito = resto % 10
-                resto = resto // 10
-                resto -= 2 * ultimo_digito
-            criterios[7] = resto % 7 == 0
-        else:
-            criterios[7] = n_abs % 7 == 0
+        phi = n
+        for p in AritmeticaBasica.factorizacion_completa(n):
+            phi -= phi // p
+        return phi
+    
+    @staticmethod
+    def funcion_mobius(n: int) -> int:
+        """Función de Möbius: 0 si n tiene un factor cuadrado, (-1)^k si es producto de k primos distintos"""
+        if n <= 0:
+            raise ValueError("La función de Möbius solo está definida para enteros positivos")
+        if _tabla_aritmetica.cubre(n):
+            return _tabla_aritmetica.mu(n)
         
-        # Divisibilidad por 8
-        if len(n_str) >= 3:
-            ultimos_tres = int(n_str[-3:])
-            criterios[8] = ultimos_tres % 8 == 0
-        else:
-            criterios[8] = n_abs % 8 == 0
+        factorizacion = AritmeticaBasica.factorizacion_completa(n)
+        if any(e > 1 for e in factorizacion.values()):
+            return 0
+        return -1 if len(factorizacion) % 2 else 1
+    
+    @staticmethod
+    def funciones_aritmeticas_rango(inicio: int, fin: int) -> Dict[str, List[int]]:
+        """Sigma, tau, phi y Möbius de cada entero de [inicio, fin) en listas paralelas"""
+        inicio = max(inicio, 1)
+        if fin <= inicio:
+            return {'sigma': [], 'tau': [], 'phi': [], 'mu': []}
+        if fin <= TablaFuncionesAritmeticas.LIMITE_LOTE:
+            _tabla_aritmetica.asegurar(fin)
+        if fin <= _tabla_aritmetica.limite:
+            return _tabla_aritmetica.rango(inicio, fin)
+        
+        numeros = range(inicio, fin)
+        return {
+            'sigma': [AritmeticaBasica.suma_divisores(n) for n in numeros],
+            'tau': [AritmeticaBasica.numero_divisores(n) for n in numeros],
+            'phi': [AritmeticaModular.indicatriz_euler(n) for n in numeros],
+            'mu': [AritmeticaModular.funcion_mobius(n) for n in numeros]
+        }
+    
+    @staticmethod
+    def orden_multiplicativo(a: int, modulo: int) -> int:
+        """Menor k > 0 con a^k ≡ 1 (mod modulo); requiere mcd(a, modulo) = 1"""
+        if modulo <= 0:
+            raise ValueError("El módulo debe ser positivo")
+        if math.gcd(a, modulo) != 1:
+            raise ValueError(f"{a} no es invertible módulo {modulo}")
+        if modulo == 1:
+            return 1
         
-        # Divisibilidad por 9
-        criterios[9] = suma_digitos % 9 == 0
+        # El orden divide a phi(modulo): se quitan factores primos mientras la potencia siga siendo 1
+        orden = AritmeticaModular.indicatriz_euler(modulo)
+        for p, e in AritmeticaBasica.factorizacion_completa(orden).items():
+            for _ in range(e):
+                if Potenciacion.potencia_modular(a, orden // p, modulo) != 1:
+                    break
+                orden //= p
+        return orden
+    
+    @staticmethod
+    def inverso_modular(a: int, modulo: int) -> int:
+        """Calcula el inverso de a módulo modulo (requiere mcd(a, modulo) = 1)"""
+        if modulo <= 0:
+            raise ValueError("El módulo debe ser positivo")
         
-        # Divisibilidad por 10
-        criterios[10] = n_str[-1] == '0'
+        mcd, x, _ = AritmeticaBasica.mcd_extendido(a % modulo, modulo)
+        if mcd != 1:
+            raise ValueError(f"{a} no tiene inverso módulo {modulo}: MCD({a}, {modulo}) = {mcd}")
+        return x % modulo
+    
+    @staticmethod
+    def resolver_congruencias(congruencias: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """Teorema chino del resto: resuelve x ≡ resto (mod modulo) para cada par (resto, modulo).
         
-        # Divisibilidad por 11
-        suma_alternada = 0
-        for i, digito in enumerate(n_str[::-1]):
-            if i % 2 == 0:
-                suma_alternada += int(digito)
-            else:
-                suma_alternada -= int(digito)
-        criterios[11] = suma_alternada % 11 == 0
+        Admite módulos no coprimos y devuelve (x, M) con 0 <= x < M = MCM de los módulos.
+        """
+        x, m = 0, 1
+        for resto, modulo in congruencias:
+            if modulo <= 0:
+                raise ValueError("Los módulos deben ser positivos")
+            
+            mcd, p, _ = AritmeticaBasica.mcd_extendido(m, modulo)
+            diferencia = resto - x
+            if diferencia % mcd != 0:
+                raise ValueError(f"Las congruencias no son compatibles: x ≡ {x} (mod {m}) y x ≡ {resto} (mod {modulo})")
+            
+            # m * p ≡ mcd (mod modulo), así que x + m * t con t = (diferencia / mcd) * p satisface ambas
+            paso = modulo // mcd
+            t = diferencia // mcd * p % paso
+            x, m = x + m * t, m * paso
+            x %= m
+        
+        return x, m
+    
+    @staticmethod
+    def logaritmo_discreto(base: int, valor: int, modulo: int) -> Union[int, None]:
+        """Menor x >= 0 con base^x ≡ valor (mod modulo) por paso de bebé-paso de gigante, o None si no existe"""
+        if modulo <= 0:
+            raise ValueError("El módulo debe ser positivo")
+        if modulo == 1:
+            return 0
+        
+        base %= modulo
+        valor %= modulo
+        
+        # Reducir mientras base y módulo compartan factores: coeficiente * base^x ≡ valor
+        desplazamiento, coeficiente = 0, 1
+        while True:
+            if coeficiente == valor:
+                return desplazamiento
+            mcd = math.gcd(base, modulo)
+            if mcd == 1:
+                break
+            if valor % mcd != 0:
+                return None
+            valor //= mcd
+            modulo //= mcd
+            coeficiente = coeficiente * (base // mcd) % modulo
+            desplazamiento += 1
+        
+        # Pasos de bebé: valor * base^j -> j (se conserva el mayor j para obtener el menor x)
+        pasos = math.isqrt(modulo) + 1
+        tabla = {}
+        actual = valor
+        for j in range(pasos):
+            tabla[actual] = j
+            actual = actual * base % modulo
+        
+        # Pasos de gigante: coeficiente * base^(i * pasos)
+        gigante = Potenciacion.potencia_modular(base, pasos, modulo)
+        actual = coeficiente
+        for i in range(1, pasos + 1):
+            actual = actual * gigante % modulo
+            if actual in tabla:
+                return i * pasos - tabla[actual] + desplazamiento
+        
+        return None
+
+class Fraccion:
+    """Fracción inmutable en mínima expresión con denominador positivo.
+    
+    Suma y producto cancelan el MCD antes de multiplicar (Henrici), de modo que
+    los intermedios no crecen más de lo necesario en operaciones encadenadas.
+    """
+    
+    __slots__ = ('_numerador', '_denominador')
+    
+    def __init__(self, numerador: int, denominador: int = 1):
+        if denominador == 0:
+            raise ValueError("El denominador no puede ser cero")
+        if denominador < 0:
+            numerador, denominador = -numerador, -denominador
+        
+        mcd = math.gcd(numerador, denominador)
+        self._numerador = numerador // mcd
+        self._denominador = denominador // mcd
+    
+    @classmethod
+    def _normalizada(cls, numerador: int, denominador: int) -> 'Fraccion':
+        """Construye sin simplificar; requiere denominador positivo y coprimo con el numerador"""
+        fraccion = object.__new__(cls)
+        fraccion._numerador = numerador
+        fraccion._denominador = denominador
+        return fraccion
+    
+    @property
+    def numerador(self) -> int:
+        return self._numerador
+    
+    @property
+    def denominador(self) -> int:
+        return self._denominador
+    
+    def como_tupla(self) -> Tuple[int, int]:
+        """Devuelve la fracción como el par (numerador, denominador) que usa Fraccionarios"""
+        return self._numerador, self._denominador
+    
+    def __repr__(self) -> str:
+        return f"Fraccion({self._numerador}, {self._denominador})"
+    
+    def __str__(self) -> str:
+        if self._denominador == 1:
+            return str(self._numerador)
+        return f"{self._numerador}/{self._denominador}"
+    
+    def __add__(self, otra):
+        if isinstance(otra, int):
+            return Fraccion._normalizada(self._numerador + otra * self._denominador, self._denominador)
+        if not isinstance(otra, Fraccion):
+            return NotImplemented
+        
+        a, b = self._numerador, self._denominador
+        c, d = otra._numerador, otra._denominador
+        mcd = math.gcd(b, d)
+        if mcd == 1:
+            return Fraccion._normalizada(a * d + b * c, b * d)
+        
+        s = b // mcd
+        t = a * (d // mcd) + c * s
+        mcd2 = math.gcd(t, mcd)
+        return Fraccion._normalizada(t // mcd2, s * (d // mcd2))
+    
+    __radd__ = __add__
+    
+    def __neg__(self) -> 'Fraccion':
+        return Fraccion._normalizada(-self._numerador, self._denominador)
+    
+    def __pos__(self) -> 'Fraccion':
+        return self
+    
+    def __abs__(self) -> 'Fraccion':
+        return Fraccion._normalizada(abs(self._numerador), self._denominador)
+    
+    def __sub__(self, otra):
+        if isinstance(otra, (int, Fraccion)):
+            return self + (-otra)
+        return NotImplemented
+    
+    def __rsub__(self, otra):
+        if isinstance(otra, int):
+            return (-self) + otra
+        return NotImplemented
+    
+    def __mul__(self, otra):
+        if isinstance(otra, int):
+            otra = Fraccion._normalizada(otra, 1)
+        elif not isinstance(otra, Fraccion):
+            return NotImplemented
         
-        return criterios
+        a, b = self._numerador, self._denominador
+        c, d = otra._numerador, otra._denominador
+        mcd1 = math.gcd(a, d)
+        mcd2 = math.gcd(c, b)
+        return Fraccion._normalizada((a // mcd1) * (c // mcd2), (b // mcd2) * (d // mcd1))
+    
+    __rmul__ = __mul__
+    
+    def inversa(self) -> 'Fraccion':
+        """Devuelve el recíproco de la fracción"""
+        if self._numerador == 0:
+            raise ValueError("No se puede dividir por cero")
+        if self._numerador < 0:
+            return Fraccion._normalizada(-self._denominador, -self._numerador)
+        return Fraccion._normalizada(self._denominador, self._numerador)
+    
+    def __truediv__(self, otra):
+        if isinstance(otra, int):
+            otra = Fraccion._normalizada(otra, 1)
+        elif not isinstance(otra, Fraccion):
+            return NotImplemented
+        return self * otra.inversa()
+    
+    def __rtruediv__(self, otra):
+        if isinstance(otra, int):
+            return self.inversa() * otra
+        return NotImplemented
+    
+    def _comparar(self, otra) -> int:
+        """Compara por productos cruzados (denominadores positivos); devuelve -1, 0 o 1"""
+        if isinstance(otra, int):
+            izquierda, derecha = self._numerador, otra * self._denominador
+        else:
+            izquierda = self._numerador * otra._denominador
+            derecha = otra._numerador * self._denominador
+        return (izquierda > derecha) - (izquierda < derecha)
+    
+    def __eq__(self, otra):
+        if isinstance(otra, Fraccion):
+            return self._numerador == otra._numerador and self._denominador == otra._denominador
+        if isinstance(otra, int):
+            return self._denominador == 1 and self._numerador == otra
+        return NotImplemented
+    
+    def __lt__(self, otra):
+        if isinstance(otra, (int, Fraccion)):
+            return self._comparar(otra) < 0
+        return NotImplemented
+    
+    def __le__(self, otra):
+        if isinstance(otra, (int, Fraccion)):
+            return self._comparar(otra) <= 0
+        return NotImplemented
+    
+    def __gt__(self, otra):
+        if isinstance(otra, (int, Fraccion)):
+            return self._comparar(otra) > 0
+        return NotImplemented
+    
+    def __ge__(self, otra):
+        if isinstance(otra, (int, Fraccion)):
+            return self._comparar(otra) >= 0
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        # Mismo hash numérico que int y fractions.Fraction para valores iguales
+        modulo = sys.hash_info.modulus
+        inverso = pow(self._denominador, modulo - 2, modulo)
+        if not inverso:
+            valor = sys.hash_info.inf
+        else:
+            valor = hash(abs(self._numerador)) * inverso % modulo
+        valor = valor if self._numerador >= 0 else -valor
+        return -2 if valor == -1 else valor
+    
+    def __bool__(self) -> bool:
+        return self._numerador != 0
+    
+    def __float__(self) -> float:
+        return self._numerador / self._denominador
+
+def _cifras(n: int, longitud: int) -> str:
+    """Escribe n >= 0 con exactamente longitud cifras (ceros a la izquierda).
+    
+    Divide el número en mitades para no chocar con el límite de conversión int -> str
+    de Python ni pagar la conversión cuadrática en números de millones de cifras.
+    """
+    if longitud <= 2048:
+        return f"{n:0{longitud}d}"
+    mitad = longitud // 2
+    alto, bajo = divmod(n, 10 ** mitad)
+    return _cifras(alto, longitud - mitad) + _cifras(bajo, mitad)
+
+def _longitud_decimal(n: int) -> int:
+    """Cota superior del número de cifras de n >= 0, sin convertirlo a texto"""
+    return n.bit_length() * 30103 // 100000 + 1
+
+def _razon_exacta(valor) -> Tuple[int, int]:
+    """Par (numerador, denominador) exacto de un entero, float, Decimal, Fraction o cadena decimal"""
+    if isinstance(valor, str):
+        valor = Fraction(valor)
+    # Los enteros de NumPy (np.int64...) no tienen as_integer_ratio
+    if isinstance(valor, numbers.Integral):
+        return operator.index(valor), 1
+    return valor.as_integer_ratio()
+
+def _limitar_denominador(numerador: int, denominador: int, cota: int, tolerancia=None) -> Tuple[int, int]:
+    """Mejor aproximación racional de numerador/denominador con denominador <= cota.
+    
+    Recorre las fracciones continuas igual que Fraction.limit_denominator, pero con enteros y
+    sin crear objetos. Con tolerancia se detiene en la primera convergente que esté a esa
+    distancia o menos del valor exacto.
+    """
+    if cota < 1:
+        raise ValueError("La cota del denominador debe ser al menos 1")
+    if denominador < 0:
+        numerador, denominador = -numerador, -denominador
+    mcd = math.gcd(numerador, denominador)
+    numerador, denominador = numerador // mcd, denominador // mcd
+    if tolerancia is not None:
+        tolerancia_num, tolerancia_den = _razon_exacta(tolerancia)
+    
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerador, denominador
+    while d:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > cota:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+        if tolerancia is not None and \
+                abs(p1 * denominador - numerador * q1) * tolerancia_den <= tolerancia_num * q1 * denominador:
+            return p1, q1
+    else:
+        return p1, q1  # El valor exacto ya tenía denominador <= cota
+    
+    # p1/q1 y la semiconvergente quedan a lados opuestos del valor, separadas 1/(q1 * qb);
+    # p1/q1 está a d/(q1 * denominador), así que es la más cercana si 2 * d * qb <= denominador
+    k = (cota - q0) // q1
+    qb = q0 + k * q1
+    if 2 * d * qb <= denominador:
+        return p1, q1
+    return p0 + k * p1, qb
+
+def _limitar_denominador_lote(valores, cota: int, tolerancia=None):
+    """Versión NumPy de _limitar_denominador para un arreglo float64 en una sola pasada vectorizada.
+    
+    Cada float se convierte en su razón exacta n / 2^k con enteros int64, así que el resultado
+    coincide con el escalar. Devuelve (numeradores, denominadores, pendientes): los carriles
+    pendientes (no finitos, o cuya razón no cabe en int64) deben resolverse con el escalar.
+    """
+    finitos = np.isfinite(valores)
+    mantisas, exponentes = np.frexp(np.where(finitos, valores, 0.0))
+    numeradores = (mantisas * 2.0 ** 53).astype(np.int64)
+    exponentes = exponentes.astype(np.int64) - 53
+    
+    # Quitar los ceros binarios finales de la mantisa para obtener la razón reducida
+    ceros = np.log2((numeradores & -numeradores).astype(np.float64), where=numeradores != 0,
+                    out=np.zeros(valores.shape)).astype(np.int64)
+    numeradores >>= ceros
+    exponentes += ceros
+    bits = np.ceil(np.log2(np.abs(numeradores) + 1.0)).astype(np.int64)
+    
+    pendientes = ~finitos | (exponentes < -62) | (np.abs(valores) >= 2.0 ** 61 / cota) | \
+        ((exponentes > 0) & (bits + exponentes > 62))
+    exponentes = np.where(pendientes, 0, exponentes)
+    numeradores = np.where(pendientes, 0, numeradores)
+    numeradores = np.where(exponentes > 0, numeradores << np.maximum(exponentes, 0), numeradores)
+    denominadores = np.left_shift(1, np.maximum(-exponentes, 0)).astype(np.int64)
+    
+    p0, q0 = np.zeros_like(numeradores), np.ones_like(numeradores)
+    p1, q1 = np.ones_like(numeradores), np.zeros_like(numeradores)
+    n, d = numeradores.copy(), denominadores.copy()
+    activos = ~pendientes
+    semiconvergente = np.zeros(valores.shape, dtype=bool)
+    
+    while activos.any():
+        activos &= d != 0
+        a = n // np.maximum(d, 1)
+        # Comparar a con el máximo admisible evita desbordar q0 + a * q1
+        avanza = activos & ((q1 == 0) | (a <= (cota - q0) // np.maximum(q1, 1)))
+        semiconvergente |= activos & ~avanza
+        p0, q0, p1, q1 = (np.where(avanza, p1, p0), np.where(avanza, q1, q0),
+                          np.where(avanza, p0 + a * p1, p1), np.where(avanza, q0 + a * q1, q1))
+        n, d = np.where(avanza, d, n), np.where(avanza, n - a * d, d)
+        activos = avanza
+        if tolerancia is not None:
+            activos &= np.abs(p1 / np.maximum(q1, 1) - valores) > tolerancia
+    
+    k = (cota - q0) // np.maximum(q1, 1)
+    qb = q0 + k * q1
+    usar_semiconvergente = semiconvergente & (d > denominadores // (2 * np.maximum(qb, 1)))
+    p = np.where(usar_semiconvergente, p0 + k * p1, p1)
+    q = np.where(usar_semiconvergente, qb, q1)
+    return np.where(pendientes, 0, p), np.where(pendientes, 0, q), pendientes
+
+def _como_columna(enteros: List[int]):
+    """Convierte una lista de enteros en arreglo int64, o de objetos si alguno no cabe"""
+    try:
+        return np.array(enteros, dtype=np.int64)
+    except OverflowError:
+        return np.array(enteros, dtype=object)
+
+def _reducir_en_arbol(elementos: Iterable, operacion, neutro):
+    """Reduce un iterable combinando operandos de tamaño parecido, como un árbol binario equilibrado.
+    
+    Funciona como un contador binario: la pila guarda a lo sumo un resultado parcial por nivel,
+    así que consume flujos sin materializarlos y usa memoria O(log n).
+    """
+    pila = []  # Pares (nivel, valor) con niveles estrictamente decrecientes
+    for elemento in elementos:
+        nivel, valor = 0, elemento
+        while pila and pila[-1][0] == nivel:
+            valor = operacion(pila.pop()[1], valor)
+            nivel += 1
+        pila.append((nivel, valor))
+    
+    if not pila:
+        return neutro
+    resultado = pila.pop()[1]
+    while pila:
+        resultado = operacion(pila.pop()[1], resultado)
+    return resultado
+
+def _bloques(elementos: Iterable, tamano: int) -> Iterator[list]:
+    """Parte un iterable en listas de tamano elementos (la última puede ser más corta)"""
+    iterador = iter(elementos)
+    return iter(lambda: list(islice(iterador, tamano)), [])
+
+def _mcm_exacto(a, b):
+    """mcm de dos valores con math.lcm, o con AritmeticaBasica.mcm si no son enteros"""
+    try:
+        return math.lcm(a, b)
+    except TypeError:
+        return AritmeticaBasica.mcm(a, b)
+
+def _en_procesos(funcion, bloques: Iterable[list], procesos: int) -> list:
+    """Aplica funcion a cada bloque en un grupo de procesos y devuelve los resultados en orden"""
+    from concurrent.futures import ProcessPoolExecutor  # Solo en el servidor: el navegador no tiene procesos
+    
+    with ProcessPoolExecutor(procesos) as ejecutor:
+        return list(ejecutor.map(funcion, bloques))
+
+def _mcm_parcial(numeros: Iterable) -> Tuple[Dict[int, int], Any]:
+    """Reduce una parte de la entrada de mcm_lista a (exponentes, otros).
+    
+    exponentes guarda el mayor exponente de cada primo entre los enteros pequeños y otros es
+    el MCM del resto (None si no hubo ninguno, 0 si apareció un 0, que termina la lectura).
+    """
+    exponentes = {}
+    
+    def mcm_por_bloques():
+        for bloque in _bloques(numeros, 1024):
+            if 0 in bloque:
+                yield 0
+                return
+            
+            pequenos = {abs(n) for n in bloque if type(n) is int and abs(n) < TablaFactorMinimo.LIMITE_LOTE}
+            if pequenos:
+                _tabla_factor_minimo.asegurar(max(pequenos) + 1)
+                for n in pequenos:
+                    for p, e in _tabla_factor_minimo.factorizar(n).items():
+                        if e > exponentes.get(p, 0):
+                            exponentes[p] = e
+            
+            resto = [n for n in bloque if not (type(n) is int and abs(n) < TablaFactorMinimo.LIMITE_LOTE)]
+            if resto:
+                try:
+                    yield math.lcm(*resto)
+                except TypeError:
+                    yield _reducir_en_arbol(resto, AritmeticaBasica.mcm, 0)
+    
+    otros = _reducir_en_arbol(mcm_por_bloques(), _mcm_exacto, None)
+    return exponentes, otros
+
+def _como_fraccion(valor) -> Fraccion:
+    """Acepta una Fraccion, un entero o un par (numerador, denominador)"""
+    if isinstance(valor, Fraccion):
+        return valor
+    if isinstance(valor, int):
+        return Fraccion._normalizada(valor, 1)
+    numerador, denominador = valor
+    return Fraccion(numerador, denominador)
 
 class Fraccionarios:
     """Clase para manejar operaciones con fracciones"""
@@ -302,74 +1623,363 @@ class Fraccionarios:
     @staticmethod
     def simplificar_fraccion(numerador: int, denominador: int) -> Tuple[int, int]:
         """Simplifica una fracción a su mínima expresión"""
-        if denominador == 0:
-            raise ValueError("El denominador no puede ser cero")
-        
-        # Manejar signos
-        if denominador < 0:
-            numerador = -numerador
-            denominador = -denominador
-        
-        mcd = AritmeticaBasica.mcd(abs(numerador), abs(denominador))
-        return numerador // mcd, denominador // mcd
+        return Fraccion(numerador, denominador).como_tupla()
     
     @staticmethod
     def sumar_fracciones(n1: int, d1: int, n2: int, d2: int) -> Tuple[int, int]:
         """Suma dos fracciones y devuelve el resultado simplificado"""
-        denominador_comun = AritmeticaBasica.mcm(d1, d2)
-        numerador_resultado = n1 * (denominador_comun // d1) + n2 * (denominador_comun // d2)
-        return Fraccionarios.simplificar_fraccion(numerador_resultado, denominador_comun)
+        return (Fraccion(n1, d1) + Fraccion(n2, d2)).como_tupla()
     
     @staticmethod
     def restar_fracciones(n1: int, d1: int, n2: int, d2: int) -> Tuple[int, int]:
         """Resta dos fracciones y devuelve el resultado simplificado"""
-        denominador_comun = AritmeticaBasica.mcm(d1, d2)
-        numerador_resultado = n1 * (denominador_comun // d1) - n2 * (denominador_comun // d2)
-        return Fraccionarios.simplificar_fraccion(numerador_resultado, denominador_comun)
+        return (Fraccion(n1, d1) - Fraccion(n2, d2)).como_tupla()
     
     @staticmethod
     def multiplicar_fracciones(n1: int, d1: int, n2: int, d2: int) -> Tuple[int, int]:
         """Multiplica dos fracciones y devuelve el resultado simplificado"""
-        numerador_resultado = n1 * n2
-        denominador_resultado = d1 * d2
-        return Fraccionarios.simplificar_fraccion(numerador_resultado, denominador_resultado)
+        return (Fraccion(n1, d1) * Fraccion(n2, d2)).como_tupla()
     
     @staticmethod
     def dividir_fracciones(n1: int, d1: int, n2: int, d2: int) -> Tuple[int, int]:
         """Divide dos fracciones y devuelve el resultado simplificado"""
         if n2 == 0:
             raise ValueError("No se puede dividir por cero")
-        return Fraccionarios.multiplicar_fracciones(n1, d1, d2, n2)
+        return (Fraccion(n1, d1) / Fraccion(n2, d2)).como_tupla()
     
     @staticmethod
     def comparar_fracciones(n1: int, d1: int, n2: int, d2: int) -> int:
         """Compara dos fracciones. Devuelve -1, 0, o 1"""
-        # Convertir a denominador común
-        denominador_comun = AritmeticaBasica.mcm(d1, d2)
-        num1_convertido = n1 * (denominador_comun // d1)
-        num2_convertido = n2 * (denominador_comun // d2)
-        
-        if num1_convertido < num2_convertido:
-            return -1
-        elif num1_convertido > num2_convertido:
-            return 1
-        else:
-            return 0
+        return Fraccion(n1, d1)._comparar(Fraccion(n2, d2))
+    
+    @staticmethod
+    def sumar_lista(fracciones: Iterable) -> Tuple[int, int]:
+        """Suma un iterable de fracciones (pares o Fraccion) con reducción en árbol y devuelve el resultado simplificado"""
+        suma = _reducir_en_arbol(map(_como_fraccion, fracciones), Fraccion.__add__, Fraccion(0))
+        return suma.como_tupla()
+    
+    @staticmethod
+    def multiplicar_lista(fracciones: Iterable) -> Tuple[int, int]:
+        """Multiplica un iterable de fracciones (pares o Fraccion) con reducción en árbol y devuelve el resultado simplificado"""
+        producto = _reducir_en_arbol(map(_como_fraccion, fracciones), Fraccion.__mul__, Fraccion(1))
+        return producto.como_tupla()
     
     @staticmethod
     def fraccion_a_decimal(numerador: int, denominador: int, precision: int = 10) -> str:
-        """Convierte una fracción a su representación decimal"""
-        if denominador == 0:
-            raise ValueError("El denominador no puede ser cero")
+        """Convierte una fracción a su representación decimal exacta, redondeada a precision cifras"""
+        if precision < 0:
+            raise ValueError("La precisión no puede ser negativa")
+        numerador, denominador = Fraccion(numerador, denominador).como_tupla()
+        
+        # División entera exacta con redondeo escolar: la mitad se redondea alejándose de cero
+        escala = 10 ** precision
+        cociente, resto = divmod(abs(numerador) * escala, denominador)
+        if 2 * resto >= denominador:
+            cociente += 1
         
-        resultado = numerador / denominador
-        return f"{resultado:.{precision}f}".rstrip('0').rstrip('.')
+        signo = '-' if numerador < 0 and cociente else ''
+        entera, decimales = divmod(cociente, escala)
+        if precision <= 0 or decimales == 0:
+            return f"{signo}{entera}"
+        return f"{signo}{entera}.{_cifras(decimales, precision)}".rstrip('0')
     
     @staticmethod
-    def decimal_a_fraccion(decimal: float, precision: int = 1000000) -> Tuple[int, int]:
-        """Convierte un decimal a fracción usando el algoritmo de fracciones continuas"""
-        frac = Fraction(decimal).limit_denominator(precision)
-        return frac.numerator, frac.denominator
+    def expansion_decimal(numerador: int, denominador: int, max_cifras: int = 10 ** 6) -> Tuple[str, str, str]:
+        """Devuelve (parte entera, anteperiodo, periodo) de la expansión decimal exacta.
+        
+        Las longitudes salen de la factorización del denominador d = 2^a · 5^b · m: el
+        anteperiodo tiene max(a, b) cifras y el periodo el orden multiplicativo de 10 módulo m.
+        """
+        numerador, denominador = Fraccion(numerador, denominador).como_tupla()
+        signo = '-' if numerador < 0 else ''
+        entera, resto = divmod(abs(numerador), denominador)
+        
+        m = denominador
+        doses = cincos = 0
+        while m % 2 == 0:
+            m //= 2
+            doses += 1
+        while m % 5 == 0:
+            m //= 5
+            cincos += 1
+        longitud_ante = max(doses, cincos)
+        longitud_periodo = AritmeticaModular.orden_multiplicativo(10, m) if m > 1 else 0
+        if longitud_ante + longitud_periodo > max_cifras:
+            raise ValueError(f"La expansión tiene {longitud_ante + longitud_periodo} cifras; "
+                             f"usa digitos_decimales para recorrerla de forma perezosa")
+        
+        # Cada bloque de cifras sale de una sola división entera, sin simular la división larga
+        cifras_ante, resto = divmod(resto * 10 ** longitud_ante, denominador)
+        anteperiodo = _cifras(cifras_ante, longitud_ante) if longitud_ante else ''
+        periodo = ''
+        if longitud_periodo:
+            cifras_periodo = resto * (10 ** longitud_periodo - 1) // denominador
+            periodo = _cifras(cifras_periodo, longitud_periodo)
+        
+        return f"{signo}{entera}", anteperiodo, periodo
+    
+    @staticmethod
+    def fraccion_a_decimal_periodico(numerador: int, denominador: int) -> str:
+        """Representa la fracción con el periodo entre paréntesis, por ejemplo 7/6 = 1.1(6)"""
+        entera, anteperiodo, periodo = Fraccionarios.expansion_decimal(numerador, denominador)
+        if not anteperiodo and not periodo:
+            return entera
+        return f"{entera}.{anteperiodo}" + (f"({periodo})" if periodo else '')
+    
+    @staticmethod
+    def digitos_decimales(numerador: int, denominador: int, bloque: int = 64) -> Iterator[int]:
+        """Genera perezosamente las cifras decimales de |numerador/denominador| tras la coma.
+        
+        Solo guarda el resto actual, así que sirve para cualquier precisión sin construir la
+        cadena completa; cada bloque de cifras se obtiene con una sola división entera.
+        """
+        numerador, denominador = Fraccion(numerador, denominador).como_tupla()
+        resto = abs(numerador) % denominador
+        escala = 10 ** bloque
+        while True:
+            cifras, resto = divmod(resto * escala, denominador)
+            for cifra in f"{cifras:0{bloque}d}":
+                yield ord(cifra) - 48
+    
+    @staticmethod
+    def decimal_a_fraccion(decimal: Union[float, Decimal, str], precision: int = 1000000,
+                           tolerancia: Union[float, None] = None) -> Tuple[int, int]:
+        """Convierte un decimal a fracción usando el algoritmo de fracciones continuas.
+        
+        precision es el denominador máximo. Los Decimal y las cadenas se aproximan de forma
+        exacta, sin pasar por float; con tolerancia se devuelve la primera convergente a esa
+        distancia o menos.
+        """
+        numerador, denominador = _razon_exacta(decimal)
+        return _limitar_denominador(numerador, denominador, precision, tolerancia)
+    
+    @staticmethod
+    def decimales_a_fracciones(valores, precision: int = 1000000, tolerancia: Union[float, None] = None):
+        """Versión por lotes de decimal_a_fraccion: devuelve (numeradores, denominadores).
+        
+        Un arreglo de float se resuelve en una sola pasada vectorizada con NumPy; los Decimal y
+        las cadenas usan el camino exacto. Los valores no finitos dan denominador 0. Sin NumPy
+        se devuelven listas.
+        """
+        if np is not None:
+            arreglo = np.ravel(np.asarray(valores))
+            if arreglo.dtype.kind in 'fiu' and precision < 2 ** 31:
+                flotantes = arreglo.astype(np.float64)
+                numeradores, denominadores, pendientes = _limitar_denominador_lote(flotantes, precision, tolerancia)
+                if not pendientes.any():
+                    return numeradores, denominadores
+                
+                numeradores, denominadores = numeradores.tolist(), denominadores.tolist()
+                for i in np.flatnonzero(pendientes & np.isfinite(flotantes)):
+                    numeradores[i], denominadores[i] = Fraccionarios.decimal_a_fraccion(
+                        float(flotantes[i]), precision, tolerancia)
+                return _como_columna(numeradores), _como_columna(denominadores)
+            valores = arreglo.tolist()
+        
+        numeradores, denominadores = [], []
+        for valor in valores:
+            try:
+                numerador, denominador = Fraccionarios.decimal_a_fraccion(valor, precision, tolerancia)
+            except (OverflowError, ValueError):
+                numerador, denominador = 0, 0
+            numeradores.append(numerador)
+            denominadores.append(denominador)
+        
+        if np is not None:
+            return _como_columna(numeradores), _como_columna(denominadores)
+        return numeradores, denominadores
+
+# Restos posibles de un cuadrado o de un cubo: descartan la mayoría de los casos sin calcular la raíz
+_RESIDUOS_CUADRATICOS = tuple((m, frozenset(x * x % m for x in range(m))) for m in (64, 63, 65, 11))
+_RESIDUOS_CUBICOS = tuple((m, frozenset(x ** 3 % m for x in range(m))) for m in (63, 19, 37))
+
+def _entero_exacto(n: Union[int, float]) -> Union[int, None]:
+    """Convierte los floats enteros (16.0) en int; None para los que no lo son (2.5, nan, inf)"""
+    if isinstance(n, float):
+        return int(n) if n.is_integer() else None
+    return n
+
+def _pasa_residuos(n: int, filtros) -> bool:
+    """Comprueba que n deje un resto admisible módulo cada m de los filtros"""
+    return all(n % m in residuos for m, residuos in filtros)
+
+def _raiz_entera(n: int, k: int, semilla: int = 0) -> int:
+    """Parte entera de la raíz k-ésima de n >= 0 con Newton sobre enteros.
+    
+    Una semilla positiva cercana a la raíz (por ejemplo, una raíz anterior con menos cifras)
+    ahorra la mayoría de los pasos de Newton.
+    """
+    if n < 2:
+        return n
+    if k == 2:
+        return math.isqrt(n)
+    bits = n.bit_length()
+    if k >= bits:
+        return 1
+    
+    # Semilla a partir de la longitud en bits: los 53 bits altos dan la raíz en float y el
+    # resto se recupera con un desplazamiento múltiplo de k
+    if semilla > 0:
+        x = semilla
+    elif k < 900:
+        desplazamiento = max(0, (bits - 53) // k * k)
+        x = (int((n >> desplazamiento) ** (1.0 / k)) + 1) << (desplazamiento // k)
+    else:
+        x = 1 << -(-bits // k)
+    # Tras un paso de Newton la estimación queda por encima de la raíz y luego solo baja
+    x = ((k - 1) * x + n // x ** (k - 1)) // k
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+def _razon_radicando(radicando) -> Tuple[int, int]:
+    """Par (numerador, denominador) exacto de un radicando, incluida una Fraccion"""
+    if isinstance(radicando, Fraccion):
+        return radicando.como_tupla()
+    return _razon_exacta(radicando)
+
+class RaizDecimal:
+    """Raíz k-ésima exacta de un racional, calculada con tantas cifras decimales como se pidan.
+    
+    Guarda la última raíz entera escalada; pedir más cifras continúa desde ella como semilla de
+    Newton y la precisión interna crece al menos al doble, de modo que ampliar poco a poco no
+    cuesta un trabajo total cuadrático.
+    """
+    
+    def __init__(self, radicando, indice: int = 2):
+        if indice < 1:
+            raise ValueError("El índice de la raíz debe ser un entero positivo")
+        numerador, denominador = _razon_radicando(radicando)
+        if numerador < 0 and indice % 2 == 0:
+            raise ValueError("No se puede calcular raíz par de número negativo")
+        
+        self.indice = indice
+        self.negativa = numerador < 0
+        self._numerador, self._denominador = abs(numerador), denominador
+        self._precision = 0  # Cifras decimales ya calculadas
+        self._raiz = _raiz_entera(self._numerador // denominador, indice)  # floor(raíz · 10^_precision)
+        self._texto = _cifras(self._raiz, _longitud_decimal(self._raiz))  # Cifras de _raiz, con al menos _precision + 1 caracteres
+    
+    def _ampliar(self, cifras: int) -> None:
+        """Calcula la raíz con al menos cifras decimales, partiendo de la precisión anterior"""
+        if cifras <= self._precision:
+            return
+        nuevas = max(cifras, 2 * self._precision, 16)
+        escalado = self._numerador * 10 ** (self.indice * nuevas) // self._denominador
+        # (raiz + 1) escalada queda por encima de la nueva raíz y a menos de una unidad de la anterior
+        semilla = (self._raiz + 1) * 10 ** (nuevas - self._precision)
+        self._raiz = _raiz_entera(escalado, self.indice, semilla)
+        self._precision = nuevas
+        self._texto = _cifras(self._raiz, max(nuevas + 1, _longitud_decimal(self._raiz)))
+    
+    def truncada(self, cifras: int) -> int:
+        """Parte entera de |raíz| · 10^cifras"""
+        self._ampliar(cifras)
+        return self._raiz // 10 ** (self._precision - cifras)
+    
+    def redondeada(self, cifras: int = 10) -> str:
+        """Raíz con cifras decimales correctamente redondeadas (la mitad se aleja de cero)"""
+        cifras = max(cifras, 0)
+        self._ampliar(cifras + 1)
+        # Se trabaja sobre el texto ya calculado: convertir la raíz completa en cada llamada sería cuadrático
+        texto = self._texto[:len(self._texto) - (self._precision - cifras - 1)]
+        cuerpo = texto[:-1]
+        if texto[-1] >= '5':
+            sin_nueves = cuerpo.rstrip('9')
+            acarreo = '1' if not sin_nueves else sin_nueves[:-1] + chr(ord(sin_nueves[-1]) + 1)
+            cuerpo = acarreo + '0' * (len(cuerpo) - len(sin_nueves))
+        
+        entera = cuerpo[:len(cuerpo) - cifras].lstrip('0') or '0'
+        decimales = cuerpo[len(cuerpo) - cifras:].rstrip('0')
+        signo = '-' if self.negativa and (entera != '0' or decimales) else ''
+        if not decimales:
+            return f"{signo}{entera}"
+        return f"{signo}{entera}.{decimales}"
+    
+    def digitos(self) -> Iterator[int]:
+        """Genera perezosamente las cifras decimales de |raíz| tras la coma"""
+        entregadas = 0
+        while True:
+            self._ampliar(entregadas + 1)
+            for cifra in self._texto[len(self._texto) - self._precision + entregadas:]:
+                yield ord(cifra) - 48
+            entregadas = self._precision
+
+# Raíces decimales recientes, para que pedir más cifras de la misma raíz continúe el cálculo
+_raices_decimales: Dict[Tuple[int, int, int], RaizDecimal] = {}
+_MAX_RAICES_DECIMALES = 64
+
+def _raiz_decimal(radicando, indice: int) -> RaizDecimal:
+    """Devuelve la RaizDecimal guardada para (radicando, indice) o crea una nueva"""
+    numerador, denominador = _razon_radicando(radicando)
+    clave = (numerador, denominador, indice)
+    guardada = _raices_decimales.get(clave)
+    if guardada is not None:
+        return guardada
+    raiz = RaizDecimal(radicando, indice)
+    if len(_raices_decimales) >= _MAX_RAICES_DECIMALES:
+        del _raices_decimales[next(iter(_raices_decimales))]
+    _raices_decimales[clave] = raiz
+    return raiz
+
+class TablaRadicales:
+    """Tabla, para un índice k, del mayor a tal que a^k divide a n: √[k]n = a · √[k](n / a^k)"""
+    
+    LIMITE_INICIAL = 1 << 12
+    LIMITE_AUTOMATICO = 1 << 16  # simplificar_radical solo amplía la tabla por debajo de este valor
+    LIMITE_LOTE = 1 << 24  # Límite hasta el que simplificar_radicales_lote amplía la tabla
+    LIMITE_MAXIMO = 1 << 32  # Los factores se guardan en un array('I')
+    
+    def __init__(self, indice: int = 2):
+        if indice < 2:
+            raise ValueError("El índice de la tabla de radicales debe ser al menos 2")
+        self.indice = indice
+        self.limite = 0  # La tabla cubre los enteros de [0, limite)
+        self._factor = array('I')
+        self._candado = threading.Lock()
+    
+    def asegurar(self, n: int) -> None:
+        """Amplía la tabla, si hace falta, para cubrir todos los enteros menores que n"""
+        if n <= self.limite:
+            return
+        if n > self.LIMITE_MAXIMO:
+            raise ValueError(f"La tabla de radicales no puede superar {self.LIMITE_MAXIMO}")
+        
+        with self._candado:
+            if n > self.limite:
+                self._extender(min(max(n, 2 * self.limite, self.LIMITE_INICIAL), self.LIMITE_MAXIMO))
+    
+    def _extender(self, nuevo_limite: int) -> None:
+        """Criba el tramo [limite, nuevo_limite): cada múltiplo de p^(jk) gana un factor p"""
+        inicio, k = self.limite, self.indice
+        tramo = array('I', [1]) * (nuevo_limite - inicio)
+        
+        for p in _tabla_primos.primos_hasta(_raiz_entera(nuevo_limite - 1, k)):
+            potencia = p ** k
+            while potencia < nuevo_limite:
+                primero = max(potencia, -(-inicio // potencia) * potencia) - inicio
+                tramo[primero::potencia] = array('I', [a * p for a in tramo[primero::potencia]])
+                potencia *= p ** k
+        
+        self._factor.extend(tramo)
+        self.limite = nuevo_limite
+    
+    def simplificar(self, n: int) -> Tuple[int, int]:
+        """Devuelve (factor extraído, radicando restante) para 0 <= n < limite"""
+        factor = self._factor[n]
+        return factor, n // factor ** self.indice
+
+# Una tabla de radicales por índice, creadas al primer uso
+_tablas_radicales: Dict[int, TablaRadicales] = {}
+
+def _tabla_radicales(indice: int) -> TablaRadicales:
+    """Devuelve la tabla de radicales del índice dado, creándola si no existe"""
+    tabla = _tablas_radicales.get(indice)
+    if tabla is None:
+        tabla = _tablas_radicales.setdefault(indice, TablaRadicales(indice))
+    return tabla
 
 class Potenciacion:
     """Clase para manejar operaciones de potenciación y radicación"""
@@ -384,6 +1994,8 @@ class Potenciacion:
         """Calcula (base^exponente) mod modulo de forma eficiente"""
         if modulo == 1:
             return 0
+        if exponente >= 0 and modulo > 1:
+            return pow(base, exponente, modulo)
         
         resultado = 1
         base = base % modulo
@@ -397,42 +2009,114 @@ class Potenciacion:
         return resultado
     
     @staticmethod
-    def raiz_cuadrada(n: float) -> float:
-        """Calcula la raíz cuadrada de un número"""
+    def raiz_cuadrada(n: float, cifras: Union[int, None] = None) -> Union[float, str]:
+        """Calcula la raíz cuadrada de un número; con cifras, la devuelve exacta y redondeada como texto"""
         if n < 0:
             raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+        if cifras is not None:
+            return _raiz_decimal(n, 2).redondeada(cifras)
         return math.sqrt(n)
     
     @staticmethod
-    def raiz_n(numero: float, indice: int) -> float:
-        """Calcula la raíz n-ésima de un número"""
+    def raiz_n(numero: float, indice: int, cifras: Union[int, None] = None) -> Union[float, str]:
+        """Calcula la raíz n-ésima de un número; con cifras, la devuelve exacta y redondeada como texto"""
         if indice == 0:
             raise ValueError("El índice de la raíz no puede ser cero")
         if numero < 0 and indice % 2 == 0:
             raise ValueError("No se puede calcular raíz par de número negativo")
+        if cifras is not None:
+            return _raiz_decimal(numero, indice).redondeada(cifras)
         
         if numero < 0:
             return -(abs(numero) ** (1/indice))
         return numero ** (1/indice)
     
+    @staticmethod
+    def raiz_entera(n: int, indice: int = 2) -> int:
+        """Parte entera exacta de la raíz n-ésima; con índice impar y n negativo trunca hacia cero"""
+        if indice < 1:
+            raise ValueError("El índice de la raíz debe ser un entero positivo")
+        if n < 0:
+            if indice % 2 == 0:
+                raise ValueError("No se puede calcular raíz par de número negativo")
+            return -_raiz_entera(-n, indice)
+        return _raiz_entera(n, indice)
+    
+    @staticmethod
+    def raiz_entera_lote(numeros: Iterable[int], indice: int = 2) -> List[int]:
+        """Versión por lotes de raiz_entera, vectorizada con NumPy si todos caben en 52 bits.
+        
+        La corrección compara (raíz + 1)^indice con cada número, así que solo se vectoriza cuando
+        esa potencia cabe en int64; con índices grandes se calcula cada raíz por separado.
+        """
+        numeros = list(numeros)
+        if (np is not None and numeros and indice >= 1 and min(numeros) >= 0 and max(numeros) < 2 ** 52
+                and indice * (Potenciacion.raiz_entera(max(numeros), indice) + 1).bit_length() <= 62):
+            valores = np.array(numeros, dtype=np.int64)
+            raices = np.rint(valores.astype(np.float64) ** (1.0 / indice)).astype(np.int64)
+            # El float se equivoca como mucho en una unidad: se corrige con potencias enteras exactas
+            raices -= raices ** indice > valores
+            raices += (raices + 1) ** indice <= valores
+            return raices.tolist()
+        return [Potenciacion.raiz_entera(n, indice) for n in numeros]
+    
     @staticmethod
     def es_cuadrado_perfecto(n: int) -> bool:
         """Verifica si un número es un cuadrado perfecto"""
-        if n < 0:
+        n = _entero_exacto(n)
+        if n is None or n < 0 or not _pasa_residuos(n, _RESIDUOS_CUADRATICOS):
             return False
         
-        raiz = int(math.sqrt(n))
+        raiz = math.isqrt(n)
         return raiz * raiz == n
     
     @staticmethod
     def es_cubo_perfecto(n: int) -> bool:
         """Verifica si un número es un cubo perfecto"""
-        if n < 0:
-            raiz_cubica = -round(abs(n) ** (1/3))
-        else:
-            raiz_cubica = round(n ** (1/3))
+        n = _entero_exacto(n)
+        if n is None or not _pasa_residuos(n, _RESIDUOS_CUBICOS):
+            return False
+        
+        raiz_cubica = _raiz_entera(abs(n), 3)
+        return raiz_cubica ** 3 == abs(n)
+    
+    @staticmethod
+    def potencia_perfecta(n: int) -> Tuple[int, int]:
+        """Escribe n como base^exponente con el mayor exponente posible; (n, 1) si no es potencia perfecta"""
+        if -1 <= n <= 1:
+            return n, 1
+        
+        base, exponente = abs(n), 1
+        # Basta probar exponentes primos hasta log2(n); cada acierto se sigue probando sobre la base
+        for p in _tabla_primos.primos_hasta(base.bit_length()):
+            if p > base.bit_length():
+                break
+            filtros = _RESIDUOS_CUADRATICOS if p == 2 else _RESIDUOS_CUBICOS if p == 3 else ()
+            while _pasa_residuos(base, filtros):
+                raiz = _raiz_entera(base, p)
+                if raiz ** p != base:
+                    break
+                base, exponente = raiz, exponente * p
         
-        return raiz_cubica ** 3 == n
+        if n < 0:
+            # Un negativo solo es potencia de exponente impar
+            while exponente % 2 == 0:
+                base, exponente = base * base, exponente // 2
+            base = -base
+        return base, exponente
+    
+    @staticmethod
+    def es_potencia_perfecta(n: int) -> bool:
+        """Verifica si n = m^k para algún entero m y algún k >= 2"""
+        return -1 <= n <= 1 or Potenciacion.potencia_perfecta(n)[1] > 1
+    
+    @staticmethod
+    def potencias_perfectas_lote(numeros: Iterable[int]) -> List[Tuple[int, int]]:
+        """Versión por lotes de potencia_perfecta"""
+        numeros = list(numeros)
+        # Preparar una sola vez los exponentes primos que necesita el mayor número
+        _tabla_primos.asegurar(max((abs(n).bit_length() for n in numeros), default=0) + 1)
+        return [Potenciacion.potencia_perfecta(n) for n in numeros]
     
     @staticmethod
     def simplificar_radical(radicando: int, indice: int = 2) -> Tuple[int, int]:
@@ -440,15 +2124,20 @@ class Potenciacion:
         if radicando < 0 and indice % 2 == 0:
             raise ValueError("No se puede simplificar raíz par de número negativo")
         
+        # Consulta directa en la tabla de radicales si el número está cubierto
+        if indice >= 2:
+            tabla = _tabla_radicales(indice)
+            if abs(radicando) < TablaRadicales.LIMITE_AUTOMATICO:
+                tabla.asegurar(abs(radicando) + 1)
+            if abs(radicando) < tabla.limite:
+                factor_extraido, radicando_simplificado = tabla.simplificar(abs(radicando))
+                return -factor_extraido if radicando < 0 else factor_extraido, radicando_simplificado
+        
         factor_extraido = 1
         radicando_simplificado = abs(radicando)
         
         # Encontrar factores que se pueden extraer
-        factores = AritmeticaBasica.factores_primos(radicando_simplificado)
-        contador_factores = {}
-        
-        for factor in factores:
-            contador_factores[factor] = contador_factores.get(factor, 0) + 1
+        contador_factores = AritmeticaBasica.factorizacion_completa(radicando_simplificado)
         
         for factor, cantidad in contador_factores.items():
             extraibles = cantidad // indice
@@ -460,6 +2149,27 @@ class Potenciacion:
         
         return factor_extraido, radicando_simplificado
     
+    @staticmethod
+    def simplificar_radicales_lote(radicandos: Iterable[int], indice: int = 2) -> List[Tuple[int, int]]:
+        """Simplifica de una vez una lista o rango de radicandos usando la tabla de radicales"""
+        radicandos = list(radicandos)
+        if indice < 2 or not radicandos:
+            return [Potenciacion.simplificar_radical(n, indice) for n in radicandos]
+        
+        tabla = _tabla_radicales(indice)
+        maximo = max(abs(n) for n in radicandos)
+        if maximo < TablaRadicales.LIMITE_LOTE:
+            tabla.asegurar(maximo + 1)
+        # Los radicandos no negativos cubiertos por la tabla se resuelven con una consulta directa
+        simplificar, limite = tabla.simplificar, tabla.limite
+        return [simplificar(n) if 0 <= n < limite else Potenciacion.simplificar_radical(n, indice)
+                for n in radicandos]
+    
+    @staticmethod
+    def preparar_tabla_radicales(limite: int, indice: int = 2) -> None:
+        """Precalcula la tabla de radicales de índice dado para todos los radicandos menores que limite"""
+        _tabla_radicales(indice).asegurar(limite)
+    
     @staticmethod
     def leyes_exponentes() -> Dict[str, str]:
         """Devuelve las leyes de los exponentes"""
@@ -676,7 +2386,7 @@ def generar_ejercicio_potenciacion() -> Dict[str, Any]:
         # Usar cuadrados perfectos
         cuadrados = [4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225]
         numero = random.choice(cuadrados)
-        raiz = int(Potenciacion.raiz_cuadrada(numero))
+        raiz = Potenciacion.raiz_entera(numero)
         
         return {
             'pregunta': f'Calcula: √{numero}',
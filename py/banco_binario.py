@@ -0,0 +1,183 @@
+"""
+Banco Binario de Ejercicios
+Banco de ejercicios precalculados que se abre con mmap y se muestrea en O(1) por tema, dificultad y tipo
+"""
+
+import argparse
+import json
+import mmap
+import os
+import random
+import struct
+import time
+from typing import Any, Dict, List, Optional, Union
+from generador import GeneradorEjercicios
+
+# Formato del archivo: cabecera, índice de cubetas, registros de ancho fijo y montículo de cadenas.
+# Cada cubeta apunta a un tramo contiguo de registros y cada registro al JSON de un ejercicio en el
+# montículo; la clave de la cubeta ("tema/dificultad/tipo") también se guarda en el montículo.
+MAGICO = b'MEBANCO\x00'
+VERSION = 1
+CABECERA = struct.Struct('<8sIIQQQ')  # mágico, versión, cubetas, registros, desplazamiento de registros y del montículo
+ENTRADA = struct.Struct('<QIIQ')  # desplazamiento y longitud de la clave, cantidad, primer registro
+REGISTRO = struct.Struct('<QI4x')  # desplazamiento y longitud del ejercicio en el montículo
+
+# Metadatos que se añaden al servir cada ejercicio y que por tanto no se guardan
+_METADATOS = ('tema', 'dificultad', 'subtema', 'timestamp', 'id')
+
+class BancoEjercicios:
+    """Banco binario consultado directamente sobre el mmap: solo se decodifica el ejercicio elegido"""
+    
+    def __init__(self, ruta: str):
+        with open(ruta, 'rb') as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mapa) < CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un banco de ejercicios")
+        magico, version, num_cubetas, self.registros, inicio_registros, inicio_monticulo = CABECERA.unpack_from(self._mapa)
+        if magico != MAGICO:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un banco de ejercicios")
+        if version != VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de banco de ejercicios no soportada: {version}")
+        if len(self._mapa) < inicio_monticulo or inicio_registros + self.registros * REGISTRO.size > inicio_monticulo:
+            self.cerrar()
+            raise ValueError(f"El banco de ejercicios {ruta} está truncado")
+        self.ruta = ruta
+        self._inicio_registros = inicio_registros
+        self._inicio_monticulo = inicio_monticulo
+        
+        # El índice es pequeño (una entrada por cubeta): se lee una vez al abrir
+        self._cubetas = {}
+        for i in range(num_cubetas):
+            desplazamiento, longitud, cantidad, primero = ENTRADA.unpack_from(self._mapa, CABECERA.size + i * ENTRADA.size)
+            inicio = inicio_monticulo + desplazamiento
+            tema, dificultad, tipo = self._mapa[inicio:inicio + longitud].decode().split('/')
+            if cantidad:
+                self._cubetas.setdefault((tema, dificultad), {})[tipo] = (primero, cantidad)
+        # Tramos de cada tema y dificultad en una lista, para elegir un tipo al azar en O(1)
+        self._tramos = {clave: list(tipos.values()) for clave, tipos in self._cubetas.items()}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+    
+    def cerrar(self) -> None:
+        """Libera el mapeo del archivo"""
+        self._mapa.close()
+    
+    def cubetas(self) -> Dict[tuple, int]:
+        """Devuelve {(tema, dificultad, tipo): cantidad de ejercicios} de las cubetas no vacías"""
+        return {(tema, dificultad, tipo): cantidad
+                for (tema, dificultad), tipos in self._cubetas.items()
+                for tipo, (_, cantidad) in tipos.items()}
+    
+    def ejercicio(self, indice: int) -> Dict[str, Any]:
+        """Decodifica el registro indice"""
+        desplazamiento, longitud = REGISTRO.unpack_from(self._mapa, self._inicio_registros + indice * REGISTRO.size)
+        inicio = self._inicio_monticulo + desplazamiento
+        return json.loads(self._mapa[inicio:inicio + longitud])
+    
+    def muestra(self, tema: str, dificultad: str, tipo: Optional[str] = None,
+                rng: Optional[random.Random] = None) -> Optional[Dict[str, Any]]:
+        """Elige un ejercicio al azar de la cubeta; sin tipo, primero un tipo al azar entre los del banco.
+        
+        Devuelve None si la cubeta está vacía, para que quien llama lo genere en vivo.
+        """
+        rng = rng or random
+        if tipo is None:
+            tramos = self._tramos.get((tema, dificultad))
+            if not tramos:
+                return None
+            primero, cantidad = rng.choice(tramos)
+        else:
+            tramo = self._cubetas.get((tema, dificultad), {}).get(tipo)
+            if tramo is None:
+                return None
+            primero, cantidad = tramo
+        return self.ejercicio(primero + rng.randrange(cantidad))
+
+def construir_banco_binario(ruta: str, por_cubeta: int = 2000, dificultades: tuple = ('facil', 'medio'),
+                            semilla: int = 0) -> BancoEjercicios:
+    """Genera por_cubeta ejercicios de cada tema, dificultad y tipo implementado y escribe el banco en ruta.
+    
+    Los ejercicios repetidos de una cubeta se guardan una sola vez, de modo que el muestreo es
+    uniforme sobre los ejercicios distintos. El archivo se escribe con otro nombre y se renombra
+    al terminar, como el mapa de primos.
+    """
+    raiz = GeneradorEjercicios(semilla)
+    for dificultad in dificultades:
+        if dificultad not in raiz.dificultades:
+            raise ValueError(f"Dificultad '{dificultad}' no disponible. Dificultades: {raiz.dificultades}")
+    
+    entradas, registros = [], []
+    monticulo = bytearray()
+    for tema in raiz.temas_disponibles:
+        for dificultad in dificultades:
+            for tipo, nombre in raiz.SUBTIPOS[tema].items():
+                if not hasattr(raiz, nombre):
+                    continue
+                generador = raiz.generador_hijo(f"{tema}/{dificultad}/{tipo}")
+                distintos = {}
+                for ejercicio in generador.generar_lote(tema, dificultad, por_cubeta, subtema=tipo):
+                    for clave in _METADATOS:
+                        ejercicio.pop(clave, None)
+                    texto = json.dumps(ejercicio, ensure_ascii=False, separators=(',', ':')).encode()
+                    distintos.setdefault(texto, None)
+                
+                clave = f"{tema}/{dificultad}/{tipo}".encode()
+                entradas.append((len(monticulo), len(clave), len(distintos), len(registros)))
+                monticulo += clave
+                for texto in distintos:
+                    registros.append((len(monticulo), len(texto)))
+                    monticulo += texto
+    
+    inicio_registros = CABECERA.size + len(entradas) * ENTRADA.size
+    inicio_registros = -(-inicio_registros // 8) * 8
+    inicio_monticulo = inicio_registros + len(registros) * REGISTRO.size
+    
+    temporal = f"{ruta}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(CABECERA.pack(MAGICO, VERSION, len(entradas), len(registros), inicio_registros, inicio_monticulo))
+        for entrada in entradas:
+            archivo.write(ENTRADA.pack(*entrada))
+        archivo.write(bytes(inicio_registros - archivo.tell()))
+        for registro in registros:
+            archivo.write(REGISTRO.pack(*registro))
+        archivo.write(monticulo)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+    return BancoEjercicios(ruta)
+
+def main(argumentos: Union[List[str], None] = None) -> None:
+    """Línea de órdenes: construir un banco binario o describir uno existente"""
+    parser = argparse.ArgumentParser(description="Banco binario de ejercicios para el Motor Matemático")
+    ordenes = parser.add_subparsers(dest='orden', required=True)
+    
+    construir = ordenes.add_parser('construir', help="genera las cubetas y escribe el banco")
+    construir.add_argument('ruta')
+    construir.add_argument('--por-cubeta', type=int, default=2000, help="ejercicios generados por cubeta")
+    construir.add_argument('--dificultades', nargs='+', default=['facil', 'medio'])
+    construir.add_argument('--semilla', type=int, default=0)
+    
+    describir = ordenes.add_parser('describir', help="muestra las cubetas del banco")
+    describir.add_argument('ruta')
+    
+    args = parser.parse_args(argumentos)
+    inicio = time.perf_counter()
+    if args.orden == 'construir':
+        with construir_banco_binario(args.ruta, args.por_cubeta, tuple(args.dificultades), args.semilla) as banco:
+            print(f"Banco de {banco.registros} ejercicios distintos en {len(banco.cubetas())} cubetas escrito en "
+                  f"{banco.ruta}: {os.path.getsize(banco.ruta) / 2 ** 20:.1f} MiB, {time.perf_counter() - inicio:.1f}s")
+    else:
+        with BancoEjercicios(args.ruta) as banco:
+            for (tema, dificultad, tipo), cantidad in sorted(banco.cubetas().items()):
+                print(f"{tema:25} {dificultad:8} {tipo:25} {cantidad}")
+
+if __name__ == "__main__":
+    main()
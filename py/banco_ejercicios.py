@@ -0,0 +1,114 @@
+"""
+Banco de Ejercicios
+Genera en paralelo un banco de ejercicios pregenerados en formato JSONL
+"""
+
+import argparse
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Union
+from generador import GeneradorEjercicios
+
+def _entero(texto: str) -> int:
+    """Convierte argumentos como 5000000, 5e6 o 10**6 en un entero"""
+    if '**' in texto:
+        base, exponente = texto.split('**')
+        return int(base) ** int(exponente)
+    if 'e' in texto.lower():
+        return int(float(texto))
+    return int(texto)
+
+def _repartir(cantidad: int, tamano_fragmento: int) -> List[Tuple[str, str, int]]:
+    """Reparte la cantidad entre todas las combinaciones de tema y dificultad en fragmentos (tema, dificultad, n)"""
+    generador = GeneradorEjercicios()
+    combinaciones = [(t, d) for t in generador.temas_disponibles for d in generador.dificultades]
+    fragmentos = []
+    for i, (tema, dificultad) in enumerate(combinaciones):
+        # Las primeras combinaciones reciben un ejercicio más si la división no es exacta
+        pendientes = cantidad // len(combinaciones) + (i < cantidad % len(combinaciones))
+        while pendientes > 0:
+            n = min(pendientes, tamano_fragmento)
+            fragmentos.append((tema, dificultad, n))
+            pendientes -= n
+    return fragmentos
+
+def _generar_fragmento(ruta: str, tema: str, dificultad: str, n: int, semilla: int) -> int:
+    """Escribe n ejercicios de un tema y dificultad en un fragmento JSONL y devuelve cuántos escribió"""
+    generador = GeneradorEjercicios(semilla)
+    escritos = 0
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for ejercicio in generador.generar_lote(tema, dificultad, n):
+            archivo.write(json.dumps(ejercicio, ensure_ascii=False))
+            archivo.write('\n')
+            escritos += 1
+    return escritos
+
+def construir_banco(ruta: str, cantidad: int, procesos: Union[int, None] = None, semilla: int = 0,
+                    tamano_fragmento: int = 50000) -> Dict[str, float]:
+    """Genera cantidad ejercicios repartidos entre todos los temas y dificultades y los escribe en ruta.
+    
+    Cada proceso escribe sus fragmentos en un directorio temporal; al terminar se concatenan en
+    orden en el archivo final, de modo que el resultado no depende del número de procesos.
+    """
+    if cantidad < 1:
+        raise ValueError("La cantidad de ejercicios debe ser positiva")
+    if tamano_fragmento < 1:
+        raise ValueError("El tamaño de fragmento debe ser positivo")
+    procesos = procesos or os.cpu_count() or 1
+    
+    directorio = f"{ruta}.fragmentos"
+    os.makedirs(directorio, exist_ok=True)
+    fragmentos = _repartir(cantidad, tamano_fragmento)
+    rutas = [os.path.join(directorio, f"{i:06d}.jsonl") for i in range(len(fragmentos))]
+    # Cada fragmento tiene su propio flujo aleatorio, derivado de la semilla del banco
+    raiz = GeneradorEjercicios(semilla)
+    
+    inicio = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(procesos) as ejecutor:
+            tareas = [ejecutor.submit(_generar_fragmento, ruta_fragmento, tema, dificultad, n, raiz.semilla_hija(i))
+                      for i, (ruta_fragmento, (tema, dificultad, n)) in enumerate(zip(rutas, fragmentos))]
+            generados = sum(tarea.result() for tarea in tareas)
+        tiempo_generacion = time.perf_counter() - inicio
+        
+        temporal = f"{ruta}.tmp"
+        with open(temporal, 'wb') as salida:
+            for ruta_fragmento in rutas:
+                with open(ruta_fragmento, 'rb') as fragmento:
+                    shutil.copyfileobj(fragmento, salida, 1 << 20)
+        os.replace(temporal, ruta)
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+    
+    tiempo_total = time.perf_counter() - inicio
+    return {
+        'ejercicios': generados,
+        'fragmentos': len(fragmentos),
+        'procesos': procesos,
+        'tiempo_generacion': tiempo_generacion,
+        'tiempo_total': tiempo_total,
+        'ejercicios_por_segundo': generados / tiempo_total
+    }
+
+def main(argumentos: Union[List[str], None] = None) -> None:
+    """Línea de órdenes: construir un banco de ejercicios"""
+    parser = argparse.ArgumentParser(description="Banco de ejercicios pregenerados para el Motor Matemático")
+    parser.add_argument('ruta', help="archivo JSONL de salida")
+    parser.add_argument('cantidad', type=_entero, help="número total de ejercicios, por ejemplo 5e6")
+    parser.add_argument('--procesos', type=int, default=None, help="por defecto, uno por núcleo")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--fragmento', type=_entero, default=50000, help="ejercicios por fragmento")
+    
+    args = parser.parse_args(argumentos)
+    resultado = construir_banco(args.ruta, args.cantidad, args.procesos, args.semilla, args.fragmento)
+    print(f"Banco de {resultado['ejercicios']} ejercicios escrito en {args.ruta}: "
+          f"{resultado['fragmentos']} fragmentos con {resultado['procesos']} procesos, "
+          f"{resultado['tiempo_total']:.1f}s ({resultado['ejercicios_por_segundo']:,.0f} ejercicios/s; "
+          f"generación {resultado['tiempo_generacion']:.1f}s)")
+    print(f"Tamaño: {os.path.getsize(args.ruta) / 2 ** 20:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
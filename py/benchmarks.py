@@ -0,0 +1,206 @@
+"""
+Benchmarks del Motor Matemático
+Compara las rutas optimizadas del módulo de aritmética con sus alternativas de referencia
+"""
+
+import random
+import time
+from fractions import Fraction
+from typing import Callable, Dict, Any, Iterable
+from aritmetica import AritmeticaBasica, Fraccion, Fraccionarios, RaizDecimal
+from generador import GeneradorEjercicios
+
+def medir(funcion: Callable[[], Any], repeticiones: int = 5) -> float:
+    """Devuelve el mejor tiempo en segundos de varias ejecuciones de la función"""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+def benchmark_fracciones(num_operaciones: int = 20000, semilla: int = 0) -> Dict[str, float]:
+    """Operaciones encadenadas con Fraccion frente a fractions.Fraction"""
+    rng = random.Random(semilla)
+    pares = [(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(num_operaciones)]
+    
+    def encadenar(tipo):
+        fracciones = [tipo(n, d) for n, d in pares]
+        acumulado = tipo(0, 1)
+        for i, f in enumerate(fracciones):
+            # Mezcla de operaciones para que el resultado no crezca sin control
+            if i % 4 == 0:
+                acumulado = acumulado + f
+            elif i % 4 == 1:
+                acumulado = acumulado - f
+            elif i % 4 == 2:
+                acumulado = acumulado * f if f else acumulado
+            else:
+                acumulado = max(acumulado, f)
+        return acumulado
+    
+    tiempo_fraccion = medir(lambda: encadenar(Fraccion))
+    tiempo_fraction = medir(lambda: encadenar(Fraction))
+    return {
+        'fraccion': tiempo_fraccion,
+        'fractions.Fraction': tiempo_fraction,
+        'aceleracion': tiempo_fraction / tiempo_fraccion
+    }
+
+def benchmark_suma_fracciones(tamanos: Iterable[int] = (10 ** 4, 10 ** 5, 10 ** 6),
+                              limite_encadenado: int = 10 ** 5, semilla: int = 0) -> Dict[int, Dict[str, float]]:
+    """Suma en árbol con sumar_lista frente a encadenar sumar_fracciones de izquierda a derecha"""
+    rng = random.Random(semilla)
+    resultados = {}
+    for tamano in tamanos:
+        pares = [(rng.randint(1, 99), rng.randint(1, 1000)) for _ in range(tamano)]
+        
+        def encadenar():
+            acumulado = (0, 1)
+            for n, d in pares:
+                acumulado = Fraccionarios.sumar_fracciones(*acumulado, n, d)
+            return acumulado
+        
+        resultados[tamano] = {'arbol': medir(lambda: Fraccionarios.sumar_lista(iter(pares)), repeticiones=1)}
+        # El plegado encadenado es demasiado lento para las listas más largas
+        if tamano <= limite_encadenado:
+            resultados[tamano]['encadenado'] = medir(encadenar, repeticiones=1)
+    return resultados
+
+def benchmark_decimales_a_fracciones(cantidad: int = 10 ** 6, precision: int = 10 ** 6,
+                                     semilla: int = 0) -> Dict[str, float]:
+    """Conversión por lotes con decimales_a_fracciones frente a Fraction.limit_denominator uno a uno"""
+    rng = random.Random(semilla)
+    valores = [rng.uniform(-100, 100) for _ in range(cantidad)]
+    
+    tiempo_lote = medir(lambda: Fraccionarios.decimales_a_fracciones(valores, precision), repeticiones=1)
+    tiempo_fraction = medir(lambda: [Fraction(x).limit_denominator(precision) for x in valores], repeticiones=1)
+    return {
+        'lote': tiempo_lote,
+        'fractions.Fraction': tiempo_fraction,
+        'valores_por_segundo': cantidad / tiempo_lote
+    }
+
+def benchmark_raiz_incremental(cifras: int = 20000, paso: int = 10, radicando: int = 3,
+                               indice: int = 7) -> Dict[str, float]:
+    """Ampliar una raíz de paso en paso cifras frente a calcularla de una vez con todas"""
+    def ampliar():
+        raiz = RaizDecimal(radicando, indice)
+        for precision in range(paso, cifras + 1, paso):
+            raiz.redondeada(precision)
+    
+    return {
+        'incremental': medir(ampliar, repeticiones=1),
+        'directa': medir(lambda: RaizDecimal(radicando, indice).redondeada(cifras), repeticiones=1)
+    }
+
+def benchmark_mcd_mcm_lote(cantidad: int = 10 ** 5, semilla: int = 0) -> Dict[str, float]:
+    """mcd y mcm por pares con mcd_lote y mcm_lote frente a llamadas escalares una a una"""
+    rng = random.Random(semilla)
+    a = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(cantidad)]
+    b = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(cantidad)]
+    
+    def escalar():
+        for x, y in zip(a, b):
+            AritmeticaBasica.mcd(x, y)
+            AritmeticaBasica.mcm(x, y)
+    
+    def lote():
+        AritmeticaBasica.mcd_lote(a, b)
+        AritmeticaBasica.mcm_lote(a, b)
+    
+    tiempo_lote = medir(lote, repeticiones=1)
+    tiempo_escalar = medir(escalar, repeticiones=1)
+    return {'lote': tiempo_lote, 'escalar': tiempo_escalar, 'aceleracion': tiempo_escalar / tiempo_lote}
+
+def benchmark_reducciones(cantidad: int = 10 ** 6, limite_encadenado: int = 10 ** 5,
+                          semilla: int = 0) -> Dict[str, float]:
+    """mcd_lista y mcm_lista sobre 10^6 elementos frente al plegado de izquierda a derecha"""
+    rng = random.Random(semilla)
+    # Múltiplos de 7 para que el MCD no llegue a 1 y haya que leer la entrada completa
+    multiplos = [7 * rng.randint(1, 10 ** 9) for _ in range(cantidad)]
+    numeros = [rng.randint(1, 10 ** 6) for _ in range(cantidad)]
+    
+    def plegar(operacion, valores):
+        resultado = valores[0]
+        for valor in valores[1:]:
+            resultado = operacion(resultado, valor)
+        return resultado
+    
+    resultados = {
+        'mcd_lista': medir(lambda: AritmeticaBasica.mcd_lista(multiplos), repeticiones=1),
+        'mcd_plegado': medir(lambda: plegar(AritmeticaBasica.mcd, multiplos), repeticiones=1),
+        'mcm_lista': medir(lambda: AritmeticaBasica.mcm_lista(numeros), repeticiones=1),
+        'mcm_lista_4_procesos': medir(lambda: AritmeticaBasica.mcm_lista(numeros, procesos=4), repeticiones=1)
+    }
+    # El plegado del MCM crece cuadráticamente: solo se mide sobre un prefijo
+    resultados['mcm_plegado_prefijo'] = medir(
+        lambda: plegar(AritmeticaBasica.mcm, numeros[:limite_encadenado]), repeticiones=1)
+    return resultados
+
+def benchmark_generacion(cantidad: int = 10 ** 5, semilla: int = 0) -> Dict[str, float]:
+    """Ejercicios por segundo con generar_lote frente a llamar a generar_ejercicio en un bucle.
+    
+    Las dos rutas reparten los ejercicios por igual entre temas y dificultades, guardan historial y
+    descartan los repetidos de la ventana, cada una con un generador nuevo con la misma semilla.
+    """
+    def bucle():
+        generador = GeneradorEjercicios(semilla)
+        combinaciones = [(t, d) for t in generador.temas_disponibles for d in generador.dificultades]
+        for i in range(cantidad):
+            generador.generar_ejercicio(*combinaciones[i % len(combinaciones)])
+    
+    def lote():
+        generador = GeneradorEjercicios(semilla)
+        for _ in generador.generar_lote(generador.temas_disponibles, generador.dificultades, cantidad,
+                                        historial=True, evitar_repetidos=True):
+            pass
+    
+    tiempo_lote = medir(lote, repeticiones=1)
+    tiempo_bucle = medir(bucle, repeticiones=1)
+    return {
+        'lote': cantidad / tiempo_lote,
+        'bucle': cantidad / tiempo_bucle,
+        'aceleracion': tiempo_bucle / tiempo_lote
+    }
+
+def ejecutar_benchmarks() -> None:
+    """Ejecuta todos los benchmarks e imprime los resultados"""
+    print("=== Benchmarks del Motor Matemático ===")
+    
+    resultado = benchmark_fracciones()
+    print(f"Fracciones encadenadas: Fraccion {resultado['fraccion']:.4f}s, "
+          f"Fraction {resultado['fractions.Fraction']:.4f}s (x{resultado['aceleracion']:.2f})")
+    
+    for tamano, tiempos in benchmark_suma_fracciones().items():
+        encadenado = f", encadenado {tiempos['encadenado']:.3f}s" if 'encadenado' in tiempos else ''
+        print(f"Suma de {tamano} fracciones: árbol {tiempos['arbol']:.3f}s{encadenado}")
+    
+    resultado = benchmark_decimales_a_fracciones()
+    print(f"Decimales a fracciones: lote {resultado['lote']:.3f}s, "
+          f"Fraction {resultado['fractions.Fraction']:.3f}s "
+          f"({resultado['valores_por_segundo']:,.0f} valores/s)")
+    
+    resultado = benchmark_raiz_incremental()
+    print(f"Raíz séptima de 3 con 20000 cifras: de 10 en 10 {resultado['incremental']:.3f}s, "
+          f"directa {resultado['directa']:.3f}s")
+    
+    resultado = benchmark_mcd_mcm_lote()
+    print(f"mcd y mcm de 100000 pares: lote {resultado['lote']:.3f}s, "
+          f"escalar {resultado['escalar']:.3f}s (x{resultado['aceleracion']:.1f})")
+    
+    resultado = benchmark_reducciones()
+    print(f"MCD de 10^6 números: mcd_lista {resultado['mcd_lista']:.3f}s, "
+          f"plegado {resultado['mcd_plegado']:.3f}s")
+    print(f"MCM de 10^6 números: mcm_lista {resultado['mcm_lista']:.3f}s, "
+          f"con 4 procesos {resultado['mcm_lista_4_procesos']:.3f}s, "
+          f"plegado de 10^5 {resultado['mcm_plegado_prefijo']:.3f}s")
+    
+    resultado = benchmark_generacion()
+    print(f"Generación de ejercicios: generar_lote {resultado['lote']:,.0f}/s, "
+          f"generar_ejercicio {resultado['bucle']:,.0f}/s (x{resultado['aceleracion']:.2f})")
+    
+    print("=== Fin de los Benchmarks ===")
+
+if __name__ == "__main__":
+    ejecutar_benchmarks()
@@ -3,10 +3,14 @@ Generador de Ejercicios Avanzado
 Sistema inteligente para crear ejercicios matemáticos variados con múltiples niveles de dificultad
 """
 
+import hashlib
+import os
 import random
 import json
-import math
-from typing import Dict, List, Any, Tuple, Optional, Union
+import time
+from collections import deque
+from itertools import accumulate
+from typing import Dict, List, Any, Tuple, Optional, Union, Iterator, Callable
 from aritmetica import (
     AritmeticaBasica, 
     Fraccionarios, 
@@ -18,10 +22,110 @@ from aritmetica import (
     generar_ejercicio_potenciacion
 )
 
+class RegistroRecientes:
+    """Ventana de las claves de los últimos ejercicios aceptados, con consulta de repetidos en O(1).
+    
+    Una cola guarda el orden de llegada y un diccionario cuenta cuántas veces está cada clave en la
+    ventana. Compartir un mismo registro entre varios generadores evita repeticiones globales.
+    """
+    
+    def __init__(self, ventana: int = 20):
+        if ventana < 0:
+            raise ValueError("La ventana de repeticiones no puede ser negativa")
+        self.ventana = ventana
+        self._claves = deque()
+        self._cuentas = {}
+        self.aceptados = 0
+        self.rechazados = 0
+        self.repetidos = 0  # Aceptados a pesar de estar en la ventana, tras agotar los intentos
+    
+    @staticmethod
+    def clave(ejercicio: Dict[str, Any]) -> Tuple[Any, str]:
+        """Clave canónica del contenido: el tipo y la pregunta, que incluye los operandos"""
+        return ejercicio.get('tipo'), str(ejercicio.get('pregunta'))
+    
+    def __contains__(self, clave: Tuple[Any, str]) -> bool:
+        return clave in self._cuentas
+    
+    def __len__(self) -> int:
+        return len(self._claves)
+    
+    def registrar(self, clave: Tuple[Any, str]) -> None:
+        """Agrega la clave de un ejercicio aceptado y expulsa la más antigua si la ventana está llena"""
+        self.aceptados += 1
+        if clave in self._cuentas:
+            self.repetidos += 1
+        if self.ventana == 0:
+            return
+        self._claves.append(clave)
+        self._cuentas[clave] = self._cuentas.get(clave, 0) + 1
+        if len(self._claves) > self.ventana:
+            antigua = self._claves.popleft()
+            if self._cuentas[antigua] == 1:
+                del self._cuentas[antigua]
+            else:
+                self._cuentas[antigua] -= 1
+    
+    def vaciar(self) -> None:
+        """Olvida las claves recientes, por ejemplo al empezar una sesión nueva; las métricas se conservan"""
+        self._claves.clear()
+        self._cuentas.clear()
+    
+    def metricas(self) -> Dict[str, Any]:
+        """Contadores de aceptados, rechazados y repetidos, y tasa de rechazo sobre todos los intentos"""
+        intentos = self.aceptados + self.rechazados
+        return {
+            'ventana': self.ventana,
+            'recientes': len(self._claves),
+            'aceptados': self.aceptados,
+            'rechazados': self.rechazados,
+            'repetidos': self.repetidos,
+            'tasa_rechazo': self.rechazados / intentos if intentos else 0.0
+        }
+
 class GeneradorEjercicios:
     """Generador principal de ejercicios matemáticos con IA adaptativa"""
     
-    def __init__(self):
+    # Subtipos de cada tema y el método que genera cada uno (algunos aún no están implementados)
+    SUBTIPOS = {
+        'conjuntos_numericos': {
+            'operaciones_basicas': '_ejercicio_operaciones_basicas',
+            'propiedades_operaciones': '_ejercicio_propiedades',
+            'clasificacion_numeros': '_ejercicio_clasificacion',
+            'orden_numeros': '_ejercicio_orden',
+            'valor_absoluto': '_ejercicio_valor_absoluto',
+            'intervalos': '_ejercicio_intervalos'
+        },
+        'numeros_primos': {
+            'identificar_primo': '_ejercicio_identificar_primo',
+            'mcd_mcm': '_ejercicio_mcd_mcm',
+            'factorizacion': '_ejercicio_factorizacion',
+            'divisibilidad': '_ejercicio_divisibilidad',
+            'criba_eratostenes': '_ejercicio_criba',
+            'teorema_fundamental': '_ejercicio_teorema_fundamental'
+        },
+        'fraccionarios': {
+            'operaciones_fracciones': '_ejercicio_operaciones_fracciones',
+            'simplificacion': '_ejercicio_simplificacion',
+            'comparacion': '_ejercicio_comparacion_fracciones',
+            'conversion_decimal': '_ejercicio_conversion_decimal',
+            'fracciones_mixtas': '_ejercicio_fracciones_mixtas',
+            'problemas_aplicados': '_ejercicio_problemas_fracciones'
+        },
+        'potenciacion_radicacion': {
+            'potencias': '_ejercicio_potencias',
+            'raices': '_ejercicio_raices',
+            'leyes_exponentes': '_ejercicio_leyes_exponentes',
+            'simplificacion_radicales': '_ejercicio_simplificacion_radicales',
+            'exponentes_negativos': '_ejercicio_exponentes_negativos',
+            'notacion_cientifica': '_ejercicio_notacion_cientifica'
+        }
+    }
+    
+    def __init__(self, semilla: Optional[int] = None, ventana_repeticiones: int = 20,
+                 recientes: Optional[RegistroRecientes] = None, banco: Optional[Any] = None):
+        # Flujo aleatorio propio: con la misma semilla se obtienen exactamente los mismos ejercicios
+        self.reiniciar(semilla)
         self.dificultades = ['facil', 'medio', 'dificil', 'experto']
         self.temas_disponibles = [
             'conjuntos_numericos',
@@ -38,9 +142,30 @@ class GeneradorEjercicios:
             'experto': {'min': 1, 'max': 1000, 'operaciones': ['+', '-', '*', '/', '^', 'sqrt']}
         }
         
-        # Historial de ejercicios para evitar repeticiones
+        # Historial de los últimos ejercicios generados
         self.historial_ejercicios = []
         self.max_historial = 50
+        
+        # Claves de los ejercicios recientes para evitar repeticiones; se puede pasar un registro
+        # compartido entre generadores para que la ventana sea global
+        self.recientes = recientes if recientes is not None else RegistroRecientes(ventana_repeticiones)
+        self._recientes_compartido = recientes is not None
+        self.max_intentos_repeticion = 5
+        
+        # Generador específico de cada tema
+        self._generadores = {
+            'conjuntos_numericos': self._generar_conjuntos,
+            'numeros_primos': self._generar_primos,
+            'fraccionarios': self._generar_fraccionarios,
+            'potenciacion_radicacion': self._generar_potenciacion
+        }
+        # Subtipos con generador implementado de cada tema, para no sortear los pendientes
+        self._implementados = {tema: self._subtipos_implementados(tema) for tema in self.temas_disponibles}
+        
+        # Banco binario de ejercicios precalculados (ver cargar_banco); None genera siempre en vivo.
+        # Un banco recibido ya abierto se comparte y no lo cierra este generador
+        self.banco = banco
+        self._banco_propio = False
     
     def generar_ejercicio(self, tema: str, dificultad: str = 'medio', subtema: Optional[str] = None) -> Dict[str, Any]:
         """Genera un ejercicio basado en el tema, dificultad y subtema especificados"""
@@ -51,15 +176,17 @@ class GeneradorEjercicios:
         if dificultad not in self.dificultades:
             dificultad = 'medio'
         
-        # Seleccionar generador específico
-        generadores = {
-            'conjuntos_numericos': self._generar_conjuntos,
-            'numeros_primos': self._generar_primos,
-            'fraccionarios': self._generar_fraccionarios,
-            'potenciacion_radicacion': self._generar_potenciacion
-        }
-        
-        ejercicio = generadores[tema](dificultad, subtema)
+        implementados = self._implementados[tema]
+        if subtema in implementados:
+            opciones = [implementados[subtema]]
+        elif subtema in self.SUBTIPOS[tema]:
+            # Subtema conocido pero sin generador: se conserva el comportamiento del generador del tema
+            opciones = [lambda d: self._generadores[tema](d, subtema)]
+        else:
+            # Sin subtema se sortea, también al descartar repetidos, solo entre los implementados
+            opciones = list(implementados.values())
+        ejercicio = self._sin_repetir(
+            lambda: self._muestra_banco(tema, dificultad, subtema) or self.rng.choice(opciones)(dificultad))
         
         # Agregar metadatos
         ejercicio.update({
@@ -75,6 +202,145 @@ class GeneradorEjercicios:
         
         return ejercicio
     
+    def _sin_repetir(self, producir: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Llama a producir hasta obtener un ejercicio que no esté en la ventana de recientes.
+        
+        Si tras max_intentos_repeticion intentos todos se repiten (el espacio de ejercicios es más
+        pequeño que la ventana), se acepta el último y se cuenta como repetido.
+        """
+        ultimo = max(self.max_intentos_repeticion, 1) - 1
+        for intento in range(ultimo + 1):
+            ejercicio = producir()
+            clave = self.recientes.clave(ejercicio)
+            if clave not in self.recientes or intento == ultimo:
+                break
+            self.recientes.rechazados += 1
+        self.recientes.registrar(clave)
+        return ejercicio
+    
+    def cargar_banco(self, ruta: Optional[str]) -> None:
+        """Abre un banco binario de ejercicios para servir desde él las cubetas que contenga.
+        
+        Las combinaciones de tema, dificultad y tipo que no estén en el banco se siguen generando
+        en vivo. Con ruta None se deja de usar el banco actual, que se cierra si lo abrió este generador.
+        """
+        if self.banco is not None and self._banco_propio:
+            self.banco.cerrar()
+        self.banco, self._banco_propio = None, False
+        if ruta is not None:
+            from banco_binario import BancoEjercicios  # Solo en el servidor: el navegador no tiene mmap
+            self.banco, self._banco_propio = BancoEjercicios(ruta), True
+    
+    def _muestra_banco(self, tema: str, dificultad: str, subtema: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Ejercicio al azar del banco cargado, o None si no hay banco o la cubeta está vacía"""
+        if self.banco is None:
+            return None
+        tipo = subtema if subtema in self.SUBTIPOS[tema] else None
+        return self.banco.muestra(tema, dificultad, tipo, self.rng)
+    
+    def reiniciar(self, semilla: Optional[int] = None) -> None:
+        """Reinicia el flujo aleatorio; sin semilla se elige una al azar y queda guardada en self.semilla"""
+        if semilla is None:
+            semilla = int.from_bytes(os.urandom(8), 'big')
+        self.semilla = semilla
+        self.rng = random.Random(semilla)
+    
+    def semilla_hija(self, clave: Any) -> int:
+        """Deriva de la semilla y una clave la semilla de un flujo hijo independiente.
+        
+        La derivación no consume el flujo del generador: la misma clave da siempre la misma semilla.
+        """
+        resumen = hashlib.sha256(f"{self.semilla}/{clave}".encode()).digest()
+        return int.from_bytes(resumen[:16], 'big')
+    
+    def generador_hijo(self, clave: Any) -> 'GeneradorEjercicios':
+        """Crea un generador con el flujo hijo de la clave, por ejemplo para un fragmento o un hilo.
+        
+        El hijo hereda la ventana de repeticiones, el registro de recientes si es compartido y el
+        banco cargado; solo cambia el flujo aleatorio.
+        """
+        hijo = GeneradorEjercicios(self.semilla_hija(clave), self.recientes.ventana,
+                                   self.recientes if self._recientes_compartido else None, self.banco)
+        hijo.max_intentos_repeticion = self.max_intentos_repeticion
+        return hijo
+    
+    def generar_lote(self, tema: Union[str, List[str], Dict[str, float]],
+                     dificultad: Union[str, List[str], Dict[str, float]] = 'medio', n: int = 100,
+                     subtema: Optional[str] = None, historial: bool = False,
+                     evitar_repetidos: bool = False) -> Iterator[Dict[str, Any]]:
+        """Genera n ejercicios de forma perezosa, con los costes fijos pagados una vez por lote.
+        
+        tema y dificultad aceptan un valor, una lista (reparto uniforme) o un diccionario de pesos.
+        Los métodos de cada subtipo, la marca de tiempo y el prefijo de los identificadores se
+        resuelven al empezar; solo se eligen subtipos con generador implementado, y un subtema
+        que no lo tenga en alguno de los temas es un ValueError. Con un banco
+        cargado, las cubetas que contiene se sirven desde él. Los ejercicios se agregan al
+        historial únicamente si historial es True, y solo se descartan los que están en la
+        ventana de recientes si evitar_repetidos es True.
+        """
+        temas = self._mezcla(tema)
+        for t in temas:
+            if t not in self.temas_disponibles:
+                raise ValueError(f"Tema '{t}' no disponible. Temas disponibles: {self.temas_disponibles}")
+        dificultades = {}
+        for d, peso in self._mezcla(dificultad).items():
+            d = d if d in self.dificultades else 'medio'
+            dificultades[d] = dificultades.get(d, 0) + peso
+        
+        metodos = {}
+        for t in temas:
+            disponibles = self._subtipos_implementados(t)
+            if subtema is None:
+                metodos[t] = list(disponibles.values())
+            elif subtema in disponibles:
+                metodos[t] = [disponibles[subtema]]
+            else:
+                raise ValueError(f"Subtema '{subtema}' no disponible para '{t}'. Subtemas disponibles: {list(disponibles)}")
+        
+        # Cada combinación de tema y dificultad con su peso acumulado para rng.choices
+        combinaciones = [(t, d, metodos[t]) for t in temas for d in dificultades]
+        acumulados = list(accumulate(temas[t] * dificultades[d] for t, d, _ in combinaciones))
+        
+        timestamp = self._get_timestamp()
+        prefijo = self._generar_id_ejercicio()
+        generados = 0
+        while generados < n:
+            elegidas = self.rng.choices(combinaciones, cum_weights=acumulados, k=min(n - generados, 1024))
+            for t, d, opciones in elegidas:
+                if evitar_repetidos:
+                    ejercicio = self._sin_repetir(
+                        lambda: self._muestra_banco(t, d, subtema) or self.rng.choice(opciones)(d))
+                else:
+                    ejercicio = self._muestra_banco(t, d, subtema) or self.rng.choice(opciones)(d)
+                ejercicio.update({
+                    'tema': t,
+                    'dificultad': d,
+                    'subtema': subtema,
+                    'timestamp': timestamp,
+                    'id': f"{prefijo}-{generados}"
+                })
+                generados += 1
+                if historial:
+                    self._agregar_al_historial(ejercicio)
+                yield ejercicio
+    
+    def _subtipos_implementados(self, tema: str) -> Dict[str, Callable[[str], Dict[str, Any]]]:
+        """Métodos de los subtipos del tema que tienen generador implementado"""
+        return {s: getattr(self, nombre) for s, nombre in self.SUBTIPOS[tema].items() if hasattr(self, nombre)}
+    
+    @staticmethod
+    def _mezcla(valor: Union[str, List[str], Dict[str, float]]) -> Dict[str, float]:
+        """Normaliza un valor, una lista o un diccionario de pesos a {opción: peso}"""
+        if isinstance(valor, str):
+            return {valor: 1}
+        if isinstance(valor, dict):
+            mezcla = {opcion: peso for opcion, peso in valor.items() if peso > 0}
+        else:
+            mezcla = dict.fromkeys(valor, 1)
+        if not mezcla:
+            raise ValueError("La mezcla debe tener al menos una opción con peso positivo")
+        return mezcla
+    
     def _generar_conjuntos(self, dificultad: str, subtema: Optional[str] = None) -> Dict[str, Any]:
         """Genera ejercicios sobre conjuntos numéricos"""
         
@@ -90,7 +356,7 @@ class GeneradorEjercicios:
         if subtema and subtema in subtipos:
             tipo = subtema
         else:
-            tipo = random.choice(subtipos)
+            tipo = self.rng.choice(subtipos)
         
         if tipo == 'operaciones_basicas':
             return self._ejercicio_operaciones_basicas(dificultad)
@@ -109,10 +375,10 @@ class GeneradorEjercicios:
         """Genera ejercicios de operaciones básicas"""
         
         config = self.rangos_dificultad[dificultad]
-        operacion = random.choice(config['operaciones'])
+        operacion = self.rng.choice(config['operaciones'])
         
         if operacion == '+':
-            a, b = random.randint(config['min'], config['max']), random.randint(config['min'], config['max'])
+            a, b = self.rng.randint(config['min'], config['max']), self.rng.randint(config['min'], config['max'])
             return {
                 'pregunta': f'Calcula: {a} + {b}',
                 'respuesta': a + b,
@@ -126,8 +392,8 @@ class GeneradorEjercicios:
             }
         
         elif operacion == '-':
-            a = random.randint(config['min'], config['max'])
-            b = random.randint(config['min'], min(a, config['max']))
+            a = self.rng.randint(config['min'], config['max'])
+            b = self.rng.randint(config['min'], min(a, config['max']))
             return {
                 'pregunta': f'Calcula: {a} - {b}',
                 'respuesta': a - b,
@@ -142,7 +408,7 @@ class GeneradorEjercicios:
         
         elif operacion == '*':
             max_factor = min(config['max'] // 10, 50)
-            a, b = random.randint(2, max_factor), random.randint(2, max_factor)
+            a, b = self.rng.randint(2, max_factor), self.rng.randint(2, max_factor)
             return {
                 'pregunta': f'Calcula: {a} × {b}',
                 'respuesta': a * b,
@@ -156,8 +422,8 @@ class GeneradorEjercicios:
             }
         
         elif operacion == '/':
-            b = random.randint(2, 20)
-            cociente = random.randint(2, config['max'] // b)
+            b = self.rng.randint(2, 20)
+            cociente = self.rng.randint(2, config['max'] // b)
             a = b * cociente
             return {
                 'pregunta': f'Calcula: {a} ÷ {b}',
@@ -172,8 +438,8 @@ class GeneradorEjercicios:
             }
         
         elif operacion == '^':
-            base = random.randint(2, 10)
-            exponente = random.randint(2, 4)
+            base = self.rng.randint(2, 10)
+            exponente = self.rng.randint(2, 4)
             resultado = base ** exponente
             return {
                 'pregunta': f'Calcula: {base}^{exponente}',
@@ -189,8 +455,8 @@ class GeneradorEjercicios:
         
         else:  # sqrt
             cuadrados = [4, 9, 16, 25, 36, 49, 64, 81, 100, 121, 144, 169, 196, 225]
-            numero = random.choice(cuadrados)
-            raiz = int(math.sqrt(numero))
+            numero = self.rng.choice(cuadrados)
+            raiz = Potenciacion.raiz_entera(numero)
             return {
                 'pregunta': f'Calcula: √{numero}',
                 'respuesta': raiz,
@@ -215,10 +481,10 @@ class GeneradorEjercicios:
             'elemento_neutro'
         ]
         
-        propiedad = random.choice(propiedades)
+        propiedad = self.rng.choice(propiedades)
         
         if propiedad == 'conmutativa_suma':
-            a, b = random.randint(1, 50), random.randint(1, 50)
+            a, b = self.rng.randint(1, 50), self.rng.randint(1, 50)
             return {
                 'pregunta': f'Verifica la propiedad conmutativa: {a} + {b} = {b} + {a}',
                 'respuesta': f'{a + b} = {a + b}',
@@ -232,7 +498,7 @@ class GeneradorEjercicios:
             }
         
         elif propiedad == 'distributiva':
-            a, b, c = random.randint(2, 10), random.randint(1, 10), random.randint(1, 10)
+            a, b, c = self.rng.randint(2, 10), self.rng.randint(1, 10), self.rng.randint(1, 10)
             lado_izq = a * (b + c)
             lado_der = a * b + a * c
             return {
@@ -271,11 +537,11 @@ class GeneradorEjercicios:
         else:
             numeros = [31, 37, 42, 49, 64, 81, 100, 121, 144, 169]
         
-        numero = random.choice(numeros)
+        numero = self.rng.choice(numeros)
         clasificacion = ConjuntosNumericos.clasificar_numero(numero)
         
         tipos_pregunta = ['primo', 'par_impar', 'perfecto', 'conjuntos']
-        tipo = random.choice(tipos_pregunta)
+        tipo = self.rng.choice(tipos_pregunta)
         
         if tipo == 'primo':
             return {
@@ -331,9 +597,9 @@ class GeneradorEjercicios:
         """Ejercicios de valor absoluto"""
         
         if dificultad == 'facil':
-            numero = random.choice([-10, -5, -3, -1, 0, 1, 3, 5, 10])
+            numero = self.rng.choice([-10, -5, -3, -1, 0, 1, 3, 5, 10])
         else:
-            numero = random.randint(-100, 100)
+            numero = self.rng.randint(-100, 100)
         
         return {
             'pregunta': f'Calcula: |{numero}|',
@@ -362,7 +628,7 @@ class GeneradorEjercicios:
         if subtema and subtema in subtipos:
             tipo = subtema
         else:
-            tipo = random.choice(subtipos)
+            tipo = self.rng.choice(subtipos)
         
         if tipo == 'identificar_primo':
             return self._ejercicio_identificar_primo(dificultad)
@@ -387,7 +653,7 @@ class GeneradorEjercicios:
         else:
             numeros = list(range(51, 100)) + [101, 103, 107, 109, 113]
         
-        numero = random.choice(numeros)
+        numero = self.rng.choice(numeros)
         es_primo = AritmeticaBasica.es_primo(numero)
         divisores = AritmeticaBasica.divisores(numero)
         
@@ -416,8 +682,8 @@ class GeneradorEjercicios:
         else:
             rangos = (15, 120)
         
-        a, b = random.randint(*rangos), random.randint(*rangos)
-        operacion = random.choice(['mcd', 'mcm'])
+        a, b = self.rng.randint(*rangos), self.rng.randint(*rangos)
+        operacion = self.rng.choice(['mcd', 'mcm'])
         
         if operacion == 'mcd':
             resultado = AritmeticaBasica.mcd(a, b)
@@ -458,7 +724,7 @@ class GeneradorEjercicios:
         else:
             numeros = [120, 144, 180, 210, 240, 300, 360, 420]
         
-        numero = random.choice(numeros)
+        numero = self.rng.choice(numeros)
         factores = AritmeticaBasica.factores_primos(numero)
         factorizacion = AritmeticaBasica.factorizacion_completa(numero)
         
@@ -491,8 +757,8 @@ class GeneradorEjercicios:
             numeros = [264, 396, 528, 660, 792, 924]
             divisores = [2, 3, 4, 6, 8, 9, 11]
         
-        numero = random.choice(numeros)
-        divisor = random.choice(divisores)
+        numero = self.rng.choice(numeros)
+        divisor = self.rng.choice(divisores)
         
         criterios = AritmeticaBasica.criterios_divisibilidad(numero)
         es_divisible = criterios.get(divisor, numero % divisor == 0)
@@ -521,7 +787,7 @@ class GeneradorEjercicios:
         if subtema and subtema in subtipos:
             tipo = subtema
         else:
-            tipo = random.choice(subtipos)
+            tipo = self.rng.choice(subtipos)
         
         if tipo == 'operaciones_fracciones':
             return self._ejercicio_operaciones_fracciones(dificultad)
@@ -547,10 +813,10 @@ class GeneradorEjercicios:
             rango = (1, 50)
         
         # Generar fracciones
-        n1, d1 = random.randint(*rango), random.randint(2, rango[1])
-        n2, d2 = random.randint(*rango), random.randint(2, rango[1])
+        n1, d1 = self.rng.randint(*rango), self.rng.randint(2, rango[1])
+        n2, d2 = self.rng.randint(*rango), self.rng.randint(2, rango[1])
         
-        operacion = random.choice(['+', '-', '*', '/'])
+        operacion = self.rng.choice(['+', '-', '*', '/'])
         
         if operacion == '+':
             num_res, den_res = Fraccionarios.sumar_fracciones(n1, d1, n2, d2)
@@ -623,17 +889,17 @@ class GeneradorEjercicios:
         
         # Generar fracción que se pueda simplificar
         if dificultad == 'facil':
-            factor = random.randint(2, 4)
-            n_simple = random.randint(1, 6)
-            d_simple = random.randint(2, 6)
+            factor = self.rng.randint(2, 4)
+            n_simple = self.rng.randint(1, 6)
+            d_simple = self.rng.randint(2, 6)
         elif dificultad == 'medio':
-            factor = random.randint(2, 8)
-            n_simple = random.randint(1, 10)
-            d_simple = random.randint(2, 10)
+            factor = self.rng.randint(2, 8)
+            n_simple = self.rng.randint(1, 10)
+            d_simple = self.rng.randint(2, 10)
         else:
-            factor = random.randint(2, 12)
-            n_simple = random.randint(1, 15)
-            d_simple = random.randint(2, 15)
+            factor = self.rng.randint(2, 12)
+            n_simple = self.rng.randint(1, 15)
+            d_simple = self.rng.randint(2, 15)
         
         numerador = n_simple * factor
         denominador = d_simple * factor
@@ -670,7 +936,7 @@ class GeneradorEjercicios:
         if subtema and subtema in subtipos:
             tipo = subtema
         else:
-            tipo = random.choice(subtipos)
+            tipo = self.rng.choice(subtipos)
         
         if tipo == 'potencias':
             return self._ejercicio_potencias(dificultad)
@@ -689,14 +955,14 @@ class GeneradorEjercicios:
         """Ejercicio de potencias"""
         
         if dificultad == 'facil':
-            base = random.randint(2, 5)
-            exponente = random.randint(2, 4)
+            base = self.rng.randint(2, 5)
+            exponente = self.rng.randint(2, 4)
         elif dificultad == 'medio':
-            base = random.randint(2, 10)
-            exponente = random.randint(2, 5)
+            base = self.rng.randint(2, 10)
+            exponente = self.rng.randint(2, 5)
         else:
-            base = random.randint(2, 12)
-            exponente = random.randint(2, 6)
+            base = self.rng.randint(2, 12)
+            exponente = self.rng.randint(2, 6)
         
         resultado = base ** exponente
         
@@ -722,8 +988,8 @@ class GeneradorEjercicios:
         else:
             cuadrados = [441, 484, 529, 576, 625, 676, 729, 784, 841, 900]
         
-        numero = random.choice(cuadrados)
-        raiz = int(math.sqrt(numero))
+        numero = self.rng.choice(cuadrados)
+        raiz = Potenciacion.raiz_entera(numero)
         
         return {
             'pregunta': f'Calcula: √{numero}',
@@ -781,21 +1047,18 @@ class GeneradorEjercicios:
     
     def _get_timestamp(self) -> str:
         """Genera timestamp para el ejercicio"""
-        import time
         return str(int(time.time()))
     
     def _generar_id_ejercicio(self) -> str:
-        """Genera ID único para el ejercicio"""
-        import hashlib
-        import time
-        data = f"{time.time()}{random.random()}"
-        return hashlib.md5(data.encode()).hexdigest()[:8]
+        """Genera ID único para el ejercicio a partir del flujo aleatorio, para que sea reproducible"""
+        return f"{self.rng.getrandbits(32):08x}"
     
     def _agregar_al_historial(self, ejercicio: Dict[str, Any]) -> None:
-        """Agrega ejercicio al historial"""
+        """Agrega ejercicio al historial y descarta de una vez los más antiguos que sobren"""
         self.historial_ejercicios.append(ejercicio)
-        if len(self.historial_ejercicios) > self.max_historial:
-            self.historial_ejercicios.pop(0)
+        exceso = len(self.historial_ejercicios) - self.max_historial
+        if exceso > 0:
+            del self.historial_ejercicios[:exceso]
     
     def generar_examen(self, tema: str, num_preguntas: int = 10, dificultad: str = 'medio') -> List[Dict[str, Any]]:
         """Genera un examen completo con múltiples ejercicios"""
@@ -0,0 +1,184 @@
+"""
+Mapa de Primos en Disco
+Mapa de bits de primos precalculado que se abre con mmap y se comparte entre procesos
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import time
+import zlib
+from itertools import compress
+from typing import Iterator, List, Union
+from aritmetica import TablaPrimos, _BANDERAS_A_BITS, _segmentos_impares
+
+# Formato del archivo: cabecera fija y, a partir de DESPLAZAMIENTO_DATOS, el mismo bitset de
+# impares que TablaPrimos (el bit i del byte i >> 3 representa al impar 2i + 1)
+MAGICO = b'MEPRIMOS'
+VERSION = 1
+CABECERA = struct.Struct('<8sIIQQ')  # mágico, versión, crc32 de los datos, límite, desplazamiento
+DESPLAZAMIENTO_DATOS = 4096  # Los datos empiezan en su propia página
+
+_BITS_A_BANDERAS = bytes.maketrans(b'01', b'\x00\x01')
+
+class MapaPrimos:
+    """Mapa de bits de primos en disco, consultado directamente sobre el mmap sin copiarlo"""
+    
+    BLOQUE = 1 << 16  # Bytes del mapa que se decodifican a la vez al recorrer un intervalo
+    
+    def __init__(self, ruta: str, verificar: bool = False):
+        with open(ruta, 'rb') as archivo:
+            # El mapeo sigue siendo válido después de cerrar el archivo
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(self._mapa) < CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un mapa de primos")
+        magico, version, self.crc, self.limite, desplazamiento = CABECERA.unpack_from(self._mapa)
+        if magico != MAGICO:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un mapa de primos")
+        if version != VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de mapa de primos no soportada: {version}")
+        
+        tamano = self.limite // 16
+        if len(self._mapa) < desplazamiento + tamano:
+            self.cerrar()
+            raise ValueError(f"El mapa de primos {ruta} está truncado")
+        self.ruta = ruta
+        self._datos = memoryview(self._mapa)[desplazamiento:desplazamiento + tamano]
+        
+        if verificar and not self.verificar():
+            self.cerrar()
+            raise ValueError(f"La suma de verificación del mapa de primos {ruta} no coincide")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()
+    
+    def cerrar(self) -> None:
+        """Libera la vista y el mapeo del archivo"""
+        datos = getattr(self, '_datos', None)
+        if datos is not None:
+            datos.release()
+            self._datos = None
+        self._mapa.close()
+    
+    def verificar(self) -> bool:
+        """Recalcula el crc32 de los datos y lo compara con el de la cabecera"""
+        crc = 0
+        for inicio in range(0, len(self._datos), 1 << 24):
+            crc = zlib.crc32(self._datos[inicio:inicio + (1 << 24)], crc)
+        return crc == self.crc
+    
+    def es_primo(self, n: int) -> bool:
+        """Consulta O(1) del mapa; requiere 0 <= n < limite"""
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        i = n >> 1
+        return bool(self._datos[i >> 3] >> (i & 7) & 1)
+    
+    def _tramos(self, a: int, b: int) -> Iterator[tuple]:
+        """Recorre por bloques los índices de impares de [a, b]: genera (primer índice, banderas)"""
+        primero, ultimo = max(a, 3) // 2, (min(b, self.limite - 1) - 1) // 2
+        for byte in range(primero >> 3, (ultimo >> 3) + 1, self.BLOQUE):
+            # La vista se libera antes de ceder el tramo: un generador a medias no debe impedir cerrar()
+            with self._datos[byte:min(byte + self.BLOQUE, (ultimo >> 3) + 1)] as trozo:
+                longitud = len(trozo)
+                bits = int.from_bytes(trozo, 'little')
+            # Invertir la representación binaria deja la bandera del índice j en la posición j
+            banderas = f"{bits:0{8 * longitud}b}"[::-1].encode().translate(_BITS_A_BANDERAS)
+            desde, hasta = max(primero, 8 * byte), min(ultimo + 1, 8 * (byte + longitud))
+            yield desde, banderas[desde - 8 * byte:hasta - 8 * byte]
+    
+    def primos_entre(self, a: int, b: int) -> Iterator[int]:
+        """Genera en orden los primos de [a, b] cubiertos por el mapa"""
+        if a <= 2 <= b and self.limite > 2:
+            yield 2
+        for desde, banderas in self._tramos(a, b):
+            yield from compress(range(2 * desde + 1, 2 * (desde + len(banderas)) + 1, 2), banderas)
+    
+    def contar_entre(self, a: int, b: int) -> int:
+        """Cuenta los primos de [a, b] cubiertos por el mapa sin generarlos"""
+        cantidad = 1 if a <= 2 <= b and self.limite > 2 else 0
+        for _, banderas in self._tramos(a, b):
+            cantidad += banderas.count(1)
+        return cantidad
+    
+    def primos_hasta(self, limite: int) -> List[int]:
+        """Devuelve los primos menores o iguales que limite"""
+        return list(self.primos_entre(2, limite))
+
+def construir_mapa_primos(ruta: str, limite: int, segmento: int = 1 << 20) -> MapaPrimos:
+    """Criba por segmentos todos los enteros menores que limite y escribe el mapa en ruta.
+    
+    El archivo se escribe primero con otro nombre y se renombra al terminar, de modo que los
+    procesos que ya tengan abierto un mapa anterior no ven nunca un archivo a medias.
+    """
+    if limite < 2:
+        raise ValueError("El límite del mapa de primos debe ser al menos 2")
+    limite = -(-limite // TablaPrimos.ALINEACION) * TablaPrimos.ALINEACION
+    segmento = -(-segmento // 8) * 8  # Cada segmento debe ocupar bytes completos
+    
+    temporal = f"{ruta}.tmp"
+    crc = 0
+    with open(temporal, 'wb') as archivo:
+        archivo.write(bytes(DESPLAZAMIENTO_DATOS))
+        for _, _, banderas in _segmentos_impares(0, limite - 1, segmento):
+            datos = int(banderas[::-1].translate(_BANDERAS_A_BITS), 2).to_bytes(len(banderas) // 8, 'little')
+            crc = zlib.crc32(datos, crc)
+            archivo.write(datos)
+        
+        archivo.seek(0)
+        archivo.write(CABECERA.pack(MAGICO, VERSION, crc, limite, DESPLAZAMIENTO_DATOS))
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+    return MapaPrimos(ruta)
+
+def _entero(texto: str) -> int:
+    """Convierte argumentos como 10000000000, 1e10 o 10**10 en un entero"""
+    if '**' in texto:
+        base, exponente = texto.split('**')
+        return int(base) ** int(exponente)
+    if 'e' in texto.lower():
+        return int(float(texto))
+    return int(texto)
+
+def main(argumentos: Union[List[str], None] = None) -> None:
+    """Línea de órdenes: construir o verificar un mapa de primos"""
+    parser = argparse.ArgumentParser(description="Mapa de bits de primos en disco para el Motor Matemático")
+    ordenes = parser.add_subparsers(dest='orden', required=True)
+    
+    construir = ordenes.add_parser('construir', help="criba hasta un límite y escribe el mapa")
+    construir.add_argument('ruta')
+    construir.add_argument('limite', type=_entero, help="por ejemplo 1e10 o 10**10")
+    construir.add_argument('--segmento', type=_entero, default=1 << 20,
+                           help="impares cribados a la vez (un byte por impar)")
+    
+    verificar = ordenes.add_parser('verificar', help="comprueba la cabecera y la suma de verificación")
+    verificar.add_argument('ruta')
+    
+    args = parser.parse_args(argumentos)
+    inicio = time.perf_counter()
+    if args.orden == 'construir':
+        with construir_mapa_primos(args.ruta, args.limite, args.segmento) as mapa:
+            print(f"Mapa de primos hasta {mapa.limite} escrito en {mapa.ruta}: "
+                  f"{os.path.getsize(mapa.ruta) / 2 ** 20:.1f} MiB, crc32 {mapa.crc:08x}, "
+                  f"{time.perf_counter() - inicio:.1f}s")
+    else:
+        with MapaPrimos(args.ruta) as mapa:
+            valido = mapa.verificar()
+            print(f"Mapa de primos hasta {mapa.limite}: {'correcto' if valido else 'CORRUPTO'} "
+                  f"({time.perf_counter() - inicio:.1f}s)")
+        if not valido:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Configuración de pytest: los módulos del motor viven sueltos en py/, como los carga el navegador"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,82 @@
+"""Pruebas del banco binario de ejercicios muestreado sobre mmap"""
+
+import collections
+import json
+import random
+
+import pytest
+
+from banco_binario import _METADATOS, CABECERA, BancoEjercicios, construir_banco_binario, main
+from generador import GeneradorEjercicios
+
+def ejercicios_por_tipo(banco, tema, dificultad):
+    """{tipo: [ejercicios de la cubeta]} leyendo los registros directamente"""
+    return {tipo: [banco.ejercicio(i) for i in range(primero, primero + cantidad)]
+            for tipo, (primero, cantidad) in banco._cubetas[(tema, dificultad)].items()}
+
+def texto(ejercicio):
+    return json.dumps(ejercicio, sort_keys=True)
+
+@pytest.fixture(scope='module')
+def banco(tmp_path_factory):
+    ruta = tmp_path_factory.mktemp('banco') / 'banco.bin'
+    with construir_banco_binario(str(ruta), por_cubeta=30, dificultades=('facil', 'medio'), semilla=2) as banco:
+        yield banco
+
+def test_banco_binario_guarda_las_cubetas_sin_repetidos(banco):
+    generador = GeneradorEjercicios()
+    esperadas = {(tema, dificultad, tipo)
+                 for tema in generador.temas_disponibles for dificultad in ('facil', 'medio')
+                 for tipo, nombre in generador.SUBTIPOS[tema].items() if hasattr(generador, nombre)}
+    cubetas = banco.cubetas()
+    assert set(cubetas) == esperadas
+    assert banco.registros == sum(cubetas.values()) and all(0 < c <= 30 for c in cubetas.values())
+    
+    # Cada cubeta guarda, sin metadatos y en orden de aparición, los ejercicios distintos de su flujo hijo
+    raiz = GeneradorEjercicios(2)
+    for tema, dificultad in banco._cubetas:
+        for tipo, ejercicios in ejercicios_por_tipo(banco, tema, dificultad).items():
+            distintos = {}
+            for e in raiz.generador_hijo(f"{tema}/{dificultad}/{tipo}").generar_lote(tema, dificultad, 30, subtema=tipo):
+                distintos.setdefault(texto({k: v for k, v in e.items() if k not in _METADATOS}), None)
+            assert [texto(e) for e in ejercicios] == list(distintos)
+
+def test_banco_binario_muestrea_de_forma_uniforme(banco):
+    rng = random.Random(4)
+    (tema, dificultad, tipo), cantidad = max(banco.cubetas().items(), key=lambda cubeta: cubeta[1])
+    cuenta = collections.Counter(texto(banco.muestra(tema, dificultad, tipo, rng)) for _ in range(400 * cantidad))
+    # 400 apariciones esperadas por ejercicio, con desviación típica de unas 20
+    assert len(cuenta) == cantidad and all(280 < c < 520 for c in cuenta.values())
+    
+    # Sin tipo se elige primero un tipo al azar entre los del banco
+    cubeta_de = {texto(e): t for t, ejercicios in ejercicios_por_tipo(banco, tema, dificultad).items() for e in ejercicios}
+    tipos = set(cubeta_de.values())
+    cuenta = collections.Counter(cubeta_de[texto(banco.muestra(tema, dificultad, rng=rng))]
+                                 for _ in range(400 * len(tipos)))
+    assert set(cuenta) == tipos and all(280 < c < 520 for c in cuenta.values())
+
+def test_banco_binario_cubeta_vacia_devuelve_none(banco):
+    assert banco.muestra('numeros_primos', 'dificil') is None
+    assert banco.muestra('numeros_primos', 'facil', 'no_existe') is None
+    assert banco.muestra('no_existe', 'facil') is None
+
+def test_banco_binario_rechaza_archivos_invalidos(banco, tmp_path):
+    with open(banco.ruta, 'rb') as archivo:
+        contenido = archivo.read()
+    casos = {
+        'corto.bin': contenido[:CABECERA.size - 1],
+        'ajeno.bin': b'X' * len(contenido),
+        'version.bin': contenido[:8] + (99).to_bytes(4, 'little') + contenido[12:],
+        'truncado.bin': contenido[:len(contenido) // 2],
+    }
+    for nombre, datos in casos.items():
+        ruta = tmp_path / nombre
+        ruta.write_bytes(datos)
+        with pytest.raises(ValueError):
+            BancoEjercicios(str(ruta))
+    with pytest.raises(ValueError):
+        construir_banco_binario(str(tmp_path / 'x.bin'), por_cubeta=1, dificultades=('imposible',))
+
+def test_describir_banco_binario(banco, capsys):
+    main(['describir', banco.ruta])
+    assert len(capsys.readouterr().out.splitlines()) == len(banco.cubetas())
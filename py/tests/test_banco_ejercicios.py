@@ -0,0 +1,43 @@
+"""Pruebas del banco de ejercicios JSONL generado en paralelo"""
+
+import collections
+import json
+import os
+
+import pytest
+
+from banco_ejercicios import construir_banco
+from generador import GeneradorEjercicios
+
+def leer_jsonl(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        return [json.loads(linea) for linea in archivo]
+
+def sin_campos_variables(ejercicios):
+    return [{k: v for k, v in e.items() if k != 'timestamp'} for e in ejercicios]
+
+def test_construir_banco_reparte_y_escribe_todos_los_ejercicios(tmp_path):
+    ruta = tmp_path / 'banco.jsonl'
+    resultado = construir_banco(str(ruta), 37, procesos=1, semilla=3, tamano_fragmento=2)
+    ejercicios = leer_jsonl(ruta)
+    assert resultado['ejercicios'] == len(ejercicios) == 37
+    assert len({e['id'] for e in ejercicios}) == 37
+    assert not os.path.exists(f"{ruta}.fragmentos") and not os.path.exists(f"{ruta}.tmp")
+    
+    # Cada combinación de tema y dificultad recibe su parte, las primeras una más si no es exacta
+    generador = GeneradorEjercicios()
+    combinaciones = [(t, d) for t in generador.temas_disponibles for d in generador.dificultades]
+    cuenta = collections.Counter((e['tema'], e['dificultad']) for e in ejercicios)
+    assert [cuenta[c] for c in combinaciones] == [37 // len(combinaciones) + (i < 37 % len(combinaciones))
+                                                  for i in range(len(combinaciones))]
+
+def test_construir_banco_no_depende_del_numero_de_procesos(tmp_path):
+    uno, dos = tmp_path / 'uno.jsonl', tmp_path / 'dos.jsonl'
+    construir_banco(str(uno), 40, procesos=1, semilla=5, tamano_fragmento=3)
+    construir_banco(str(dos), 40, procesos=2, semilla=5, tamano_fragmento=3)
+    assert sin_campos_variables(leer_jsonl(uno)) == sin_campos_variables(leer_jsonl(dos))
+    
+    construir_banco(str(dos), 40, procesos=1, semilla=6, tamano_fragmento=3)
+    assert sin_campos_variables(leer_jsonl(uno)) != sin_campos_variables(leer_jsonl(dos))
+    with pytest.raises(ValueError):
+        construir_banco(str(uno), 0)
@@ -0,0 +1,56 @@
+"""Pruebas de la clasificación por lotes de ConjuntosNumericos frente a clasificar_numero"""
+
+import math
+import random
+
+import pytest
+
+import aritmetica
+from aritmetica import AritmeticaBasica, ConjuntosNumericos, TablaPrimos
+
+def columnas_escalares(valores):
+    filas = [ConjuntosNumericos.clasificar_numero(v) for v in valores]
+    return {clave: [fila[clave] for fila in filas] for clave in filas[0]}
+
+def test_clasificar_lote_frente_a_clasificar_numero(monkeypatch):
+    rng = random.Random(15)
+    enteros = list(range(-50, 1000)) + [8128, 33550336, 2 ** 31 - 1, 2 ** 61 - 1, 2 ** 63 - 1, -2 ** 63, 2 ** 70]
+    flotantes = [rng.uniform(-100, 100) for _ in range(300)] + [0.5, -0.25, 2.0 ** 53, 2.0 ** 60, 28.0, -7.0,
+                                                                 math.pi, float('nan'), float('inf'), -0.0]
+    for valores in [enteros, flotantes]:
+        esperado = columnas_escalares(valores)
+        lote = ConjuntosNumericos.clasificar_lote(valores)
+        assert {clave: [bool(x) for x in columna] for clave, columna in lote.items()} == esperado
+        monkeypatch.setattr(aritmetica, 'np', None)
+        assert ConjuntosNumericos.clasificar_lote(valores) == esperado
+        monkeypatch.undo()
+
+def test_clasificar_lote_solo_resuelve_aparte_los_carriles_fuera_de_int64(monkeypatch):
+    np = pytest.importorskip('numpy')
+    valores = list(range(-100, 3000)) + [2 ** 70, -2 ** 63, 2 ** 64 + 1]
+    esperado = columnas_escalares(valores)
+    escalares = []
+    clasificar_numero = ConjuntosNumericos.clasificar_numero
+    monkeypatch.setattr(ConjuntosNumericos, 'clasificar_numero', lambda n: escalares.append(n) or clasificar_numero(n))
+    lote = ConjuntosNumericos.clasificar_lote(valores)
+    assert {clave: [bool(x) for x in columna] for clave, columna in lote.items()} == esperado
+    assert sorted(escalares) == [-2 ** 63, 2 ** 64 + 1, 2 ** 70]
+    
+    escalares.clear()
+    sin_signo = np.array([3, 4, 2 ** 63 + 1, 2 ** 64 - 1], dtype=np.uint64)
+    lote = ConjuntosNumericos.clasificar_lote(sin_signo)
+    assert escalares == [2 ** 63 + 1, 2 ** 64 - 1]
+    assert list(lote['primo']) == [True, False, False, False]
+
+def test_es_primo_lote_reutiliza_la_copia_del_bitset(monkeypatch):
+    np = pytest.importorskip('numpy')
+    tabla = TablaPrimos()
+    monkeypatch.setattr(aritmetica, '_tabla_primos', tabla)
+    tabla.es_primo_lote(np.arange(1000))
+    copia = tabla._bits_lote
+    assert list(np.flatnonzero(tabla.es_primo_lote(np.arange(50)))) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    assert tabla._bits_lote is copia
+    # Al crecer la tabla la copia se rehace y cubre los nuevos primos
+    numeros = np.arange(tabla.limite, tabla.limite + 5000)
+    assert list(tabla.es_primo_lote(numeros)) == [AritmeticaBasica.es_primo(int(n)) for n in numeros]
+    assert tabla._bits_lote is not copia and tabla._bits_lote.size * tabla.ALINEACION == tabla.limite
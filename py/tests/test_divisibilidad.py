@@ -0,0 +1,45 @@
+"""Pruebas de los criterios de divisibilidad frente al resto directo"""
+
+import random
+
+import pytest
+
+from aritmetica import AritmeticaBasica
+
+def test_criterios_divisibilidad_frente_al_resto(tmp_path):
+    rng = random.Random(16)
+    numeros = [0, 1, -1, 2 * 3 * 5 * 7 * 11 * 13, 27720 * 17]
+    numeros += [rng.randint(-10 ** 40, 10 ** 40) for _ in range(200)] + [rng.randint(1, 10 ** 6) for _ in range(200)]
+    for n in numeros:
+        esperado = {m: n % m == 0 for m in list(range(2, 12)) + [13, 17, 1000]}
+        assert AritmeticaBasica.criterios_divisibilidad(n, [13, 17, 1000]) == esperado
+        assert AritmeticaBasica.criterios_divisibilidad(str(n), [13, 17, 1000]) == esperado
+        texto = str(n)
+        fragmentos = [texto[i:i + 3] for i in range(0, len(texto), 3)]
+        assert AritmeticaBasica.criterios_divisibilidad(iter(fragmentos), [13, 17, 1000]) == esperado
+    
+    # Un número de cien mil cifras leído desde un archivo, con el salto de línea final habitual
+    texto = str(rng.randint(1, 9)) + ''.join(rng.choice('0123456789') for _ in range(99999))
+    resto = 0
+    for cifra in texto:
+        resto = (resto * 10 + int(cifra)) % (27720 * 13 * 19)
+    ruta = tmp_path / "numero.txt"
+    ruta.write_text(texto + '\n')
+    with open(ruta) as archivo:
+        criterios = AritmeticaBasica.criterios_divisibilidad(archivo, [13, 19])
+    assert criterios == {m: resto % m == 0 for m in list(range(2, 12)) + [13, 19]}
+    
+    with pytest.raises(ValueError):
+        AritmeticaBasica.criterios_divisibilidad("12a4")
+    with pytest.raises(ValueError):
+        AritmeticaBasica.criterios_divisibilidad(12, [0])
+
+def test_criterios_divisibilidad_solo_admiten_signo_inicial_y_cifras():
+    assert AritmeticaBasica.criterios_divisibilidad("+120")[3]
+    assert AritmeticaBasica.criterios_divisibilidad(iter(['-', '12', '0\n']))[5]
+    for texto in ["1 234", "12-3", "--5", "+-5", " 5", "5 ", "\n5", "5\n\n", "1\n2", "-", "\n"]:
+        with pytest.raises(ValueError):
+            AritmeticaBasica.criterios_divisibilidad(texto)
+    for fragmentos in [['-', '-5'], ['12', '+3'], ['12\n', '3'], ['1', ' ', '2']]:
+        with pytest.raises(ValueError):
+            AritmeticaBasica.criterios_divisibilidad(iter(fragmentos))
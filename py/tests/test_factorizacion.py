@@ -0,0 +1,59 @@
+"""Pruebas de la factorización y las funciones aritméticas frente a referencias directas"""
+
+import math
+
+from aritmetica import AritmeticaBasica, AritmeticaModular, ConjuntosNumericos
+
+def divisores_referencia(n: int) -> list:
+    return [d for d in range(1, n + 1) if n % d == 0]
+
+def factorizacion_referencia(n: int) -> dict:
+    """División por tentativa sin tablas"""
+    factores, p = {}, 2
+    while p * p <= n:
+        while n % p == 0:
+            factores[p] = factores.get(p, 0) + 1
+            n //= p
+        p += 1
+    if n > 1:
+        factores[n] = factores.get(n, 0) + 1
+    return factores
+
+def test_factorizacion_frente_a_division_por_tentativa():
+    for n in list(range(2, 3000)) + [2 ** 31 - 1, 600851475143, 10 ** 12 + 39, 2 ** 40 * 3 ** 5]:
+        esperada = factorizacion_referencia(n)
+        assert AritmeticaBasica.factorizacion_completa(n) == esperada
+        assert AritmeticaBasica.factores_primos(n) == sorted(p for p, e in esperada.items() for _ in range(e))
+
+def test_factorizacion_de_semiprimos_grandes():
+    p, q = 1000000007, 998244353
+    assert AritmeticaBasica.factorizacion_completa(p * q) == {q: 1, p: 1}
+    r = 10 ** 6 + 3
+    assert AritmeticaBasica.factorizacion_completa(r * r * 3 * (2 ** 31 - 1)) == {3: 1, r: 2, 2 ** 31 - 1: 1}
+
+def test_factorizar_lote_frente_a_escalar():
+    numeros = list(range(0, 5000)) + [10 ** 9 + 7, 2 ** 45]
+    lote = AritmeticaBasica.factorizar_lote(numeros)
+    assert lote == [AritmeticaBasica.factorizacion_completa(n) for n in numeros]
+
+def test_divisores_y_funciones_de_divisores():
+    for n in range(1, 1500):
+        divisores = divisores_referencia(n)
+        assert AritmeticaBasica.divisores(n) == divisores
+        assert AritmeticaBasica.numero_divisores(n) == len(divisores)
+        assert AritmeticaBasica.suma_divisores(n) == sum(divisores)
+        assert ConjuntosNumericos.es_perfecto(n) == (sum(divisores) == 2 * n)
+    assert AritmeticaBasica.divisores(-12) == [1, 2, 3, 4, 6, 12]
+    assert ConjuntosNumericos.es_perfecto(2 ** 30 * (2 ** 31 - 1))
+    assert not ConjuntosNumericos.es_perfecto(2 ** 30 * (2 ** 31 - 1) + 2)
+
+def test_funciones_aritmeticas_rango_frente_a_definiciones():
+    tabla = AritmeticaModular.funciones_aritmeticas_rango(1, 2000)
+    for n in range(1, 2000):
+        factores = factorizacion_referencia(n)
+        assert tabla['sigma'][n - 1] == sum(divisores_referencia(n))
+        assert tabla['tau'][n - 1] == len(divisores_referencia(n))
+        assert tabla['phi'][n - 1] == sum(math.gcd(k, n) == 1 for k in range(1, n + 1))
+        mu = 0 if any(e > 1 for e in factores.values()) else (-1) ** len(factores)
+        assert tabla['mu'][n - 1] == mu == AritmeticaModular.funcion_mobius(n)
+        assert AritmeticaModular.indicatriz_euler(n) == tabla['phi'][n - 1]
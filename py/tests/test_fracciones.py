@@ -0,0 +1,137 @@
+"""Pruebas de Fraccion y Fraccionarios frente a fractions.Fraction, decimal y la división larga"""
+
+import math
+import random
+from decimal import ROUND_HALF_UP, Decimal, localcontext
+from fractions import Fraction
+from itertools import islice
+
+import pytest
+
+from aritmetica import Fraccion, Fraccionarios
+
+def fracciones_aleatorias(rng: random.Random, cantidad: int, tope: int = 10 ** 6):
+    pares = []
+    while len(pares) < cantidad:
+        denominador = rng.randint(-tope, tope)
+        if denominador:
+            pares.append((rng.randint(-tope, tope), denominador))
+    return pares
+
+def division_larga(numerador: int, denominador: int):
+    """Expansión decimal clásica: (parte entera, anteperiodo, periodo) detectando el primer resto repetido"""
+    fraccion = Fraction(numerador, denominador)
+    signo = '-' if fraccion < 0 else ''
+    entera, resto = divmod(abs(fraccion.numerator), fraccion.denominator)
+    vistos, cifras = {}, []
+    while resto and resto not in vistos:
+        vistos[resto] = len(cifras)
+        cifra, resto = divmod(resto * 10, fraccion.denominator)
+        cifras.append(str(cifra))
+    if not resto:
+        return f"{signo}{entera}", ''.join(cifras), ''
+    inicio = vistos[resto]
+    return f"{signo}{entera}", ''.join(cifras[:inicio]), ''.join(cifras[inicio:])
+
+def test_fraccion_frente_a_fraction():
+    rng = random.Random(8)
+    pares = fracciones_aleatorias(rng, 400)
+    for (a, b), (c, d) in zip(pares, pares[1:]):
+        x, y = Fraccion(a, b), Fraccion(c, d)
+        fx, fy = Fraction(a, b), Fraction(c, d)
+        assert x.como_tupla() == (fx.numerator, fx.denominator)
+        for resultado, esperado in [(x + y, fx + fy), (x - y, fx - fy), (x * y, fx * fy), (x / y, fx / fy),
+                                    (x + c, fx + c), (c - x, c - fx), (x * c, fx * c), (-x, -fx), (abs(x), abs(fx))]:
+            assert resultado.como_tupla() == (esperado.numerator, esperado.denominator)
+        assert (x < y, x <= y, x == y, x > y) == (fx < fy, fx <= fy, fx == fy, fx > fy)
+        assert Fraccionarios.comparar_fracciones(a, b, c, d) == (fx > fy) - (fx < fy)
+        assert hash(x) == hash(fx) and float(x) == float(fx)
+    assert hash(Fraccion(4, 2)) == hash(2) and Fraccion(4, 2) == 2
+    with pytest.raises(ValueError):
+        Fraccion(1, 0)
+    with pytest.raises(ValueError):
+        Fraccion(0, 3).inversa()
+
+def test_sumar_y_multiplicar_lista():
+    rng = random.Random(9)
+    for cantidad in [0, 1, 2, 3, 17, 500]:
+        pares = fracciones_aleatorias(rng, cantidad, 10 ** 4)
+        suma = sum((Fraction(*p) for p in pares), Fraction(0))
+        producto = math.prod((Fraction(*p) for p in pares), start=Fraction(1))
+        assert Fraccionarios.sumar_lista(pares) == (suma.numerator, suma.denominator)
+        assert Fraccionarios.sumar_lista(Fraccion(*p) for p in pares) == (suma.numerator, suma.denominator)
+        assert Fraccionarios.multiplicar_lista(iter(pares)) == (producto.numerator, producto.denominator)
+    armonica = sum(Fraction(1, k) for k in range(1, 300))
+    assert Fraccionarios.sumar_lista((1, k) for k in range(1, 300)) == (armonica.numerator, armonica.denominator)
+
+def test_fraccion_a_decimal_redondea_como_decimal():
+    rng = random.Random(10)
+    casos = fracciones_aleatorias(rng, 500, 10 ** 5) + [(1, 8), (-1, 8), (5, 2), (-5, 2), (-1, 10 ** 12), (1, 3), (0, 7)]
+    for numerador, denominador in casos:
+        for precision in [0, 1, 3, 10, 30]:
+            with localcontext() as contexto:
+                contexto.prec = precision + 60
+                valor = Decimal(numerador) / Decimal(denominador)
+                redondeado = valor.quantize(Decimal(1).scaleb(-precision), rounding=ROUND_HALF_UP)
+                esperado = f"{abs(redondeado):f}"
+            if '.' in esperado:
+                esperado = esperado.rstrip('0').rstrip('.')
+            if redondeado < 0:
+                esperado = '-' + esperado
+            assert Fraccionarios.fraccion_a_decimal(numerador, denominador, precision) == esperado
+    with pytest.raises(ValueError):
+        Fraccionarios.fraccion_a_decimal(1, 3, -2)
+
+def test_expansion_decimal_frente_a_division_larga():
+    rng = random.Random(11)
+    casos = fracciones_aleatorias(rng, 300, 3000) + [(1, 7), (-22, 7), (7, 6), (1, 2 ** 10 * 5 ** 3 * 41), (3, 1), (0, 5)]
+    for numerador, denominador in casos:
+        esperado = division_larga(numerador, denominador)
+        assert Fraccionarios.expansion_decimal(numerador, denominador) == esperado
+        entera, anteperiodo, periodo = esperado
+        decimal = entera + ('.' + anteperiodo if anteperiodo or periodo else '') + (f"({periodo})" if periodo else '')
+        assert Fraccionarios.fraccion_a_decimal_periodico(numerador, denominador) == decimal
+    with pytest.raises(ValueError):
+        Fraccionarios.expansion_decimal(1, 10 ** 9 + 7, max_cifras=1000)
+
+def test_digitos_decimales_frente_a_division_larga():
+    rng = random.Random(12)
+    for numerador, denominador in fracciones_aleatorias(rng, 100, 10 ** 9):
+        resto, esperadas = abs(numerador) % abs(denominador), []
+        for _ in range(150):
+            cifra, resto = divmod(resto * 10, abs(denominador))
+            esperadas.append(cifra)
+        for bloque in [1, 7, 64]:
+            assert list(islice(Fraccionarios.digitos_decimales(numerador, denominador, bloque), 150)) == esperadas
+
+def test_decimal_a_fraccion_frente_a_limit_denominator():
+    rng = random.Random(13)
+    valores = [rng.uniform(-1000, 1000) for _ in range(500)] + [math.pi, math.e, 0.1, -0.75, 1e-9, 123456.0]
+    for precision in [10, 1000, 10 ** 6]:
+        for valor in valores:
+            esperado = Fraction(valor).limit_denominator(precision)
+            assert Fraccionarios.decimal_a_fraccion(valor, precision) == (esperado.numerator, esperado.denominator)
+        numeradores, denominadores = Fraccionarios.decimales_a_fracciones(valores, precision)
+        assert list(zip([int(n) for n in numeradores], [int(d) for d in denominadores])) == \
+            [Fraccionarios.decimal_a_fraccion(v, precision) for v in valores]
+    # Las cadenas y los Decimal se aproximan sin pasar por float
+    esperado = Fraction('0.1234567890123456789').limit_denominator(10 ** 15)
+    assert Fraccionarios.decimal_a_fraccion('0.1234567890123456789', 10 ** 15) == (esperado.numerator, esperado.denominator)
+    assert Fraccionarios.decimal_a_fraccion(Decimal('2.5')) == (5, 2)
+
+def test_decimal_a_fraccion_acepta_enteros_de_numpy():
+    np = pytest.importorskip('numpy')
+    assert Fraccionarios.decimal_a_fraccion(np.int64(-7)) == (-7, 1)
+    assert Fraccionarios.decimal_a_fraccion(np.uint8(200), 10) == (200, 1)
+    assert Fraccionarios.decimal_a_fraccion(np.float32(0.75)) == (3, 4)
+    # Un arreglo de objetos mezclados pasa por el camino exacto, elemento a elemento
+    numeradores, denominadores = Fraccionarios.decimales_a_fracciones([np.int64(3), Decimal('0.5'), '0.25'])
+    assert list(zip(numeradores, denominadores)) == [(3, 1), (1, 2), (1, 4)]
+
+def test_decimal_a_fraccion_con_tolerancia():
+    rng = random.Random(14)
+    for _ in range(300):
+        valor, tolerancia = rng.uniform(-10, 10), 10.0 ** -rng.randint(1, 9)
+        numerador, denominador = Fraccionarios.decimal_a_fraccion(valor, 10 ** 9, tolerancia)
+        assert abs(Fraction(numerador, denominador) - Fraction(valor)) <= tolerancia
+        assert math.gcd(numerador, denominador) == 1 and denominador > 0
@@ -0,0 +1,118 @@
+"""Pruebas de la generación por lotes, los flujos aleatorios y la ventana de repetidos del generador"""
+
+import collections
+import json
+
+import pytest
+
+from generador import GeneradorEjercicios
+
+def sin_marca_de_tiempo(ejercicios):
+    return [{k: v for k, v in e.items() if k != 'timestamp'} for e in ejercicios]
+
+def test_generar_lote_respeta_tema_dificultad_y_cantidad():
+    generador = GeneradorEjercicios()
+    lote = list(generador.generar_lote('numeros_primos', 'facil', 50))
+    assert len(lote) == 50
+    assert all(e['tema'] == 'numeros_primos' and e['dificultad'] == 'facil' for e in lote)
+    assert len({e['id'] for e in lote}) == 50
+    assert not generador.historial_ejercicios
+
+def test_generar_lote_mezcla_con_pesos():
+    lote = GeneradorEjercicios().generar_lote({'fraccionarios': 3, 'potenciacion_radicacion': 1}, ['facil', 'experto'], 4000)
+    temas = collections.Counter(e['tema'] for e in lote)
+    assert set(temas) == {'fraccionarios', 'potenciacion_radicacion'}
+    assert 2700 < temas['fraccionarios'] < 3300
+
+def test_generar_lote_con_subtema():
+    lote = list(GeneradorEjercicios().generar_lote('numeros_primos', 'medio', 30, subtema='identificar_primo'))
+    assert all(e['tipo'] == 'identificar_primo' and e['subtema'] == 'identificar_primo' for e in lote)
+
+@pytest.mark.parametrize('subtema', ['no_existe', 'criba_eratostenes'])
+def test_generar_lote_rechaza_subtemas_desconocidos_o_sin_implementar(subtema):
+    with pytest.raises(ValueError):
+        next(GeneradorEjercicios().generar_lote('numeros_primos', 'medio', 5, subtema=subtema))
+
+def test_generar_lote_rechaza_temas_desconocidos():
+    with pytest.raises(ValueError):
+        next(GeneradorEjercicios().generar_lote('geometria'))
+
+def test_misma_semilla_mismos_ejercicios():
+    temas, dificultades = ['fraccionarios', 'numeros_primos'], ['facil', 'experto']
+    a = list(GeneradorEjercicios(5).generar_lote(temas, dificultades, 300))
+    b = list(GeneradorEjercicios(5).generar_lote(temas, dificultades, 300))
+    assert sin_marca_de_tiempo(a) == sin_marca_de_tiempo(b)
+    c = [GeneradorEjercicios(5).generar_ejercicio('numeros_primos', 'medio', 'mcd_mcm')['pregunta'] for _ in range(5)]
+    assert len(set(c)) == 1
+
+def test_semillas_hijas_deterministas_e_independientes():
+    padre = GeneradorEjercicios(5)
+    antes = padre.rng.getstate()
+    assert padre.semilla_hija(1) == GeneradorEjercicios(5).semilla_hija(1) != padre.semilla_hija(2)
+    assert padre.rng.getstate() == antes
+    assert padre.generador_hijo('a').semilla == GeneradorEjercicios(5).generador_hijo('a').semilla
+
+def test_generador_hijo_hereda_la_configuracion(tmp_path):
+    from banco_binario import construir_banco_binario
+    from generador import RegistroRecientes
+    
+    padre = GeneradorEjercicios(6, ventana_repeticiones=7)
+    padre.max_intentos_repeticion = 3
+    hijo = padre.generador_hijo(0)
+    assert hijo.recientes.ventana == 7 and hijo.recientes is not padre.recientes
+    assert hijo.max_intentos_repeticion == 3
+    
+    compartido = RegistroRecientes(30)
+    padre = GeneradorEjercicios(6, recientes=compartido)
+    with construir_banco_binario(str(tmp_path / 'banco.bin'), por_cubeta=20) as banco:
+        padre.cargar_banco(banco.ruta)
+        hijo = padre.generador_hijo(0)
+        assert hijo.recientes is compartido and hijo.banco is padre.banco
+        # El hijo no cierra el banco del padre al soltarlo
+        hijo.cargar_banco(None)
+        assert padre.generar_ejercicio('numeros_primos', 'facil', 'identificar_primo')['tipo'] == 'identificar_primo'
+        padre.cargar_banco(None)
+
+@pytest.mark.parametrize('tema', GeneradorEjercicios().temas_disponibles)
+def test_sin_subtema_solo_se_sortean_subtipos_implementados(tema):
+    generador = GeneradorEjercicios(7, ventana_repeticiones=50)
+    for dificultad in generador.dificultades:
+        for _ in range(200):
+            assert generador.generar_ejercicio(tema, dificultad)['tema'] == tema
+    examen = generador.generar_examen(tema, 10)
+    assert [e['numero'] for e in examen] == list(range(1, 11))
+
+def test_ventana_de_recientes_evita_repetidos():
+    from generador import RegistroRecientes
+    
+    generador = GeneradorEjercicios(8)
+    preguntas = [generador.generar_ejercicio('numeros_primos', 'facil', 'identificar_primo')['pregunta'] for _ in range(10)]
+    assert len(set(preguntas)) >= 9
+    metricas = generador.recientes.metricas()
+    assert metricas['aceptados'] == 10 and 0 < metricas['tasa_rechazo'] < 1
+    
+    registro = RegistroRecientes(3)
+    for clave in 'abca':
+        registro.registrar(clave)
+    assert 'a' in registro and 'b' in registro and len(registro) == 3 and registro.repetidos == 1
+    registro.registrar('d')
+    registro.registrar('e')
+    assert 'a' in registro and 'b' not in registro and 'c' not in registro and len(registro) == 3
+    with pytest.raises(ValueError):
+        RegistroRecientes(-1)
+
+def test_historial_acotado():
+    generador = GeneradorEjercicios(9)
+    for _ in range(120):
+        generador.generar_ejercicio('fraccionarios', 'medio', 'simplificacion')
+    assert len(generador.historial_ejercicios) == generador.max_historial
+    # Sigue siendo una lista: se puede serializar y recortar
+    assert json.loads(json.dumps(generador.historial_ejercicios[-5:])) == generador.historial_ejercicios[-5:]
+    ultimo = generador.historial_ejercicios[-1]
+    generador.max_historial = 10
+    generador.generar_ejercicio('fraccionarios', 'medio', 'simplificacion')
+    assert len(generador.historial_ejercicios) == 10 and generador.historial_ejercicios[-2] is ultimo
+    generador.max_historial = 30
+    for _ in range(40):
+        generador.generar_ejercicio('fraccionarios', 'medio', 'simplificacion')
+    assert len(generador.historial_ejercicios) == 30
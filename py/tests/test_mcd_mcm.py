@@ -0,0 +1,32 @@
+"""Pruebas de MCD, MCM y divisibilidad por pares y sobre listas frente a las funciones escalares"""
+
+import math
+import random
+from functools import reduce
+
+from aritmetica import AritmeticaBasica
+
+def test_mcd_mcm_y_divisibilidad_por_pares():
+    rng = random.Random(19)
+    a = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(3000)] + [0, 0, 2 ** 62, -2 ** 63, 10 ** 30]
+    b = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(3000)] + [0, 5, 2 ** 62, 3, 10 ** 20]
+    assert [int(x) for x in AritmeticaBasica.mcd_lote(a, b)] == [math.gcd(x, y) for x, y in zip(a, b)]
+    assert [int(x) for x in AritmeticaBasica.mcm_lote(a, b)] == [AritmeticaBasica.mcm(x, y) for x, y in zip(a, b)]
+    assert [bool(x) for x in AritmeticaBasica.es_divisible_lote(a, b)] == \
+        [AritmeticaBasica.es_divisible(x, y) for x, y in zip(a, b)]
+
+def test_mcd_lista_y_mcm_lista_frente_al_plegado():
+    rng = random.Random(20)
+    for _ in range(50):
+        # Mayoría de enteros pequeños (tabla de factores) y algunos grandes o negativos (math.lcm)
+        numeros = [rng.randint(1, 10 ** 4) if rng.random() < 0.95 else rng.randint(-10 ** 15, 10 ** 15)
+                   for _ in range(rng.randint(2, 300))]
+        assert AritmeticaBasica.mcd_lista(numeros) == reduce(AritmeticaBasica.mcd, numeros)
+        assert AritmeticaBasica.mcd_lista(iter(numeros)) == reduce(AritmeticaBasica.mcd, numeros)
+        assert AritmeticaBasica.mcm_lista(numeros) == reduce(AritmeticaBasica.mcm, numeros)
+        assert AritmeticaBasica.mcm_lista(iter(numeros)) == reduce(AritmeticaBasica.mcm, numeros)
+    assert AritmeticaBasica.mcm_lista([4, 0, 6]) == 0
+    assert AritmeticaBasica.mcm_lista([]) == 0 and AritmeticaBasica.mcm_lista([7]) == 7
+    multiplos = [6 * k for k in range(1, 20000)]
+    assert AritmeticaBasica.mcd_lista(multiplos) == 6
+    assert AritmeticaBasica.mcm_lista(range(1, 200), procesos=2) == math.lcm(*range(1, 200))
@@ -0,0 +1,48 @@
+"""Pruebas del algoritmo extendido de Euclides y la aritmética modular frente a pow y la búsqueda exhaustiva"""
+
+import math
+import random
+
+import pytest
+
+from aritmetica import AritmeticaBasica, AritmeticaModular
+
+def test_mcd_extendido_e_inverso():
+    rng = random.Random(7)
+    for _ in range(2000):
+        a, b = rng.randint(-10 ** 12, 10 ** 12), rng.randint(-10 ** 12, 10 ** 12)
+        d, x, y = AritmeticaBasica.mcd_extendido(a, b)
+        assert abs(d) == math.gcd(a, b) and a * x + b * y == d
+        m = rng.randint(2, 10 ** 9)
+        if math.gcd(a, m) == 1:
+            assert AritmeticaModular.inverso_modular(a, m) == pow(a, -1, m)
+        else:
+            with pytest.raises(ValueError):
+                AritmeticaModular.inverso_modular(a, m)
+
+def test_resolver_congruencias():
+    rng = random.Random(8)
+    for _ in range(500):
+        modulos = [rng.randint(1, 300) for _ in range(rng.randint(1, 4))]
+        x = rng.randint(0, 10 ** 6)
+        resultado, modulo = AritmeticaModular.resolver_congruencias([(x % m, m) for m in modulos])
+        assert modulo == math.lcm(*modulos) and resultado == x % modulo
+    with pytest.raises(ValueError):
+        AritmeticaModular.resolver_congruencias([(1, 4), (2, 6)])
+
+def test_logaritmo_discreto_frente_a_busqueda_exhaustiva():
+    for modulo in [2, 9, 11, 12, 97, 100]:
+        for base in range(modulo):
+            potencias = {}
+            for x in range(2 * modulo):
+                potencias.setdefault(pow(base, x, modulo), x)
+            for valor in range(modulo):
+                assert AritmeticaModular.logaritmo_discreto(base, valor, modulo) == potencias.get(valor)
+
+def test_orden_multiplicativo_e_indicatriz_de_euler():
+    for modulo in range(2, 100):
+        unidades = [a for a in range(1, modulo) if math.gcd(a, modulo) == 1]
+        assert AritmeticaModular.indicatriz_euler(modulo) == len(unidades)
+        for base in unidades:
+            orden = min(k for k in range(1, modulo + 1) if pow(base, k, modulo) == 1)
+            assert AritmeticaModular.orden_multiplicativo(base, modulo) == orden
@@ -0,0 +1,112 @@
+"""Pruebas de raíces enteras, potencias perfectas y raíces decimales frente a referencias exactas"""
+
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+import aritmetica
+from aritmetica import Fraccion, Potenciacion, RaizDecimal
+
+def raiz_por_biseccion(n: int, k: int) -> int:
+    """Referencia lenta e independiente: mayor r con r^k <= n"""
+    bajo, alto = 0, 1
+    while alto ** k <= n:
+        alto *= 2
+    while bajo < alto - 1:
+        medio = (bajo + alto) // 2
+        if medio ** k <= n:
+            bajo = medio
+        else:
+            alto = medio
+    return bajo
+
+def test_raiz_entera_frente_a_biseccion():
+    rng = random.Random(12)
+    for k in range(1, 70):
+        for n in [0, 1, 2, 2 ** 51, 2 ** 52 - 1, 10 ** 40] + [rng.randrange(2 ** rng.randint(1, 200)) for _ in range(30)]:
+            assert Potenciacion.raiz_entera(n, k) == raiz_por_biseccion(n, k), (n, k)
+
+def test_raiz_entera_bordes_de_potencias():
+    for k in range(2, 12):
+        for r in [2, 3, 10, 12345, 2 ** 20 + 7]:
+            assert Potenciacion.raiz_entera(r ** k, k) == r
+            assert Potenciacion.raiz_entera(r ** k - 1, k) == r - 1
+
+def test_raiz_entera_lote_coincide_con_escalar():
+    rng = random.Random(0)
+    numeros = [0, 1, 2, 3, 10 ** 6, 2 ** 40] + [rng.randrange(2 ** 40) for _ in range(300)]
+    for k in range(2, 8):
+        assert Potenciacion.raiz_entera_lote(numeros, k) == [Potenciacion.raiz_entera(n, k) for n in numeros], k
+
+def test_raiz_entera_lote_en_indices_grandes():
+    rng = random.Random(0)
+    numeros = [0, 1, 2, 3, 2 ** 51, 2 ** 52 - 1] + [rng.randrange(2 ** 52) for _ in range(300)]
+    for k in range(1, 64):
+        assert Potenciacion.raiz_entera_lote(numeros, k) == [Potenciacion.raiz_entera(n, k) for n in numeros], k
+    assert Potenciacion.raiz_entera_lote([2 ** 51], 40) == [2]
+
+def test_raiz_entera_lote_fuera_de_int64():
+    numeros = [10 ** 30, 2 ** 64 + 1, 7]
+    assert Potenciacion.raiz_entera_lote(numeros, 3) == [Potenciacion.raiz_entera(n, 3) for n in numeros]
+
+def test_cuadrados_y_cubos_perfectos():
+    for n in range(-50, 5000):
+        assert Potenciacion.es_cuadrado_perfecto(n) == (n >= 0 and math.isqrt(n) ** 2 == n)
+        assert Potenciacion.es_cubo_perfecto(n) == (round(abs(n) ** (1 / 3)) ** 3 == abs(n))
+    assert Potenciacion.es_cuadrado_perfecto((10 ** 20 + 1) ** 2)
+    assert not Potenciacion.es_cuadrado_perfecto((10 ** 20 + 1) ** 2 + 1)
+
+def test_cuadrados_y_cubos_aceptan_floats_enteros():
+    assert Potenciacion.es_cuadrado_perfecto(16.0)
+    assert not Potenciacion.es_cuadrado_perfecto(2.25)
+    assert not Potenciacion.es_cuadrado_perfecto(float('inf'))
+    assert Potenciacion.es_cubo_perfecto(27.0)
+    assert Potenciacion.es_cubo_perfecto(-8.0)
+    assert not Potenciacion.es_cubo_perfecto(2.5)
+
+def test_potencia_perfecta():
+    for n in range(2, 3000):
+        base, exponente = Potenciacion.potencia_perfecta(n)
+        assert base ** exponente == n
+        # Ningún exponente mayor escribe n como potencia entera
+        assert all(raiz_por_biseccion(n, e) ** e != n for e in range(exponente + 1, n.bit_length() + 1))
+    assert Potenciacion.potencia_perfecta(3 ** 40) == (3, 40)
+    assert Potenciacion.potencias_perfectas_lote([8, 10, 81]) == [(2, 3), (10, 1), (3, 4)]
+
+@pytest.mark.parametrize('radicando, indice', [(2, 2), (3, 7), (10 ** 6 + 3, 3), (Fraction(2, 3), 2), (Fraccion(5, 7), 5)])
+def test_raiz_decimal_truncada_exacta(radicando, indice):
+    p, q = (radicando.numerador, radicando.denominador) if isinstance(radicando, Fraccion) else \
+        (Fraction(radicando).numerator, Fraction(radicando).denominator)
+    raiz = RaizDecimal(radicando, indice)
+    for cifras in [0, 1, 5, 30, 31, 200, 17]:
+        assert raiz.truncada(cifras) == raiz_por_biseccion(p * 10 ** (indice * cifras) // q, indice), cifras
+
+def test_raiz_decimal_redondeada_y_digitos():
+    raiz = RaizDecimal(2)
+    assert raiz.redondeada(5) == '1.41421'
+    assert raiz.redondeada(3) == '1.414'
+    assert RaizDecimal(3, 3).redondeada(1) == '1.4'
+    assert RaizDecimal(Fraction(1, 4)).redondeada(10) == '0.5'
+    assert RaizDecimal(-27, 3).redondeada(4) == '-3'
+    assert RaizDecimal(99.9999999, 2).redondeada(2) == '10'
+    referencia = str(math.isqrt(2 * 10 ** 800))[1:]
+    digitos = RaizDecimal(2).digitos()
+    assert ''.join(str(next(digitos)) for _ in range(400)) == referencia
+    with pytest.raises(ValueError):
+        RaizDecimal(-4, 2)
+
+def test_raiz_cuadrada_con_cifras():
+    # Los ceros finales se omiten
+    assert Potenciacion.raiz_cuadrada(2, cifras=20) == '1.4142135623730950488'
+    assert Potenciacion.raiz_n(2, 3, cifras=12) == '1.259921049895'
+    assert Potenciacion.raiz_n(-8, 3, cifras=5) == '-2'
+
+def test_raiz_decimal_con_mas_de_4300_cifras():
+    # str() de un entero tan largo choca con el límite de conversión de Python
+    assert Potenciacion.raiz_cuadrada(10 ** 10000, cifras=5) == '1' + '0' * 5000
+    assert Potenciacion.raiz_cuadrada(10 ** 10000, cifras=3) == '1' + '0' * 5000
+    entera, decimales = RaizDecimal(2 * 10 ** 9000).redondeada(2).split('.')
+    assert len(entera) == 4501 and entera.startswith('14142135623730950488') and len(decimales) == 2
+    assert aritmetica._raiz_decimal(10 ** 10000, 2) is aritmetica._raiz_decimal(Fraction(10 ** 10000), 2)
@@ -0,0 +1,115 @@
+"""Pruebas de la criba, la criba segmentada y el mapa de primos en disco frente a una criba de referencia"""
+
+import random
+
+import pytest
+
+import aritmetica
+from aritmetica import AritmeticaBasica, TablaPrimos
+from mapa_primos import MapaPrimos, construir_mapa_primos
+
+def criba_referencia(limite: int) -> list:
+    """Criba de Eratóstenes sencilla, sin bitsets ni segmentos"""
+    es_primo = [True] * (limite + 1)
+    es_primo[:2] = [False, False][:limite + 1]
+    for p in range(2, int(limite ** 0.5) + 1):
+        if es_primo[p]:
+            es_primo[p * p::p] = [False] * len(range(p * p, limite + 1, p))
+    return [n for n in range(limite + 1) if es_primo[n]]
+
+PRIMOS = criba_referencia(200000)
+
+def test_es_primo_y_generar_primos():
+    conjunto = set(PRIMOS)
+    for n in range(-5, 20000):
+        assert AritmeticaBasica.es_primo(n) == (n in conjunto)
+    for limite in [0, 1, 2, 3, 100, 7919, 200000]:
+        assert AritmeticaBasica.generar_primos(limite) == [p for p in PRIMOS if p <= limite]
+
+def test_es_primo_acepta_floats_enteros():
+    assert AritmeticaBasica.es_primo(7.0) and AritmeticaBasica.es_primo(2.0)
+    assert not AritmeticaBasica.es_primo(9.0) and not AritmeticaBasica.es_primo(1.0)
+    assert not AritmeticaBasica.es_primo(7.5) and not AritmeticaBasica.es_primo(float('nan'))
+    # 2^61 - 1 no cabe en un float: se redondea a 2^61, que es par
+    assert not AritmeticaBasica.es_primo(float(2 ** 61 - 1))
+
+def test_es_primo_grandes():
+    assert AritmeticaBasica.es_primo(2 ** 61 - 1)
+    assert not AritmeticaBasica.es_primo((2 ** 31 - 1) * (2 ** 61 - 1))
+    assert AritmeticaBasica.es_primo(2 ** 127 - 1)
+
+def test_es_primo_frente_a_division_por_tentativa():
+    rng = random.Random(2)
+    for _ in range(3000):
+        n = rng.randint(200000, 4 * 10 ** 10)
+        assert AritmeticaBasica.es_primo(n) == all(n % p for p in PRIMOS if p * p <= n)
+
+def test_es_primo_rechaza_pseudoprimos_fuertes():
+    # Carmichael y pseudoprimos fuertes para las bases 2, 3, 5, 7, ... (el último, para las doce primeras)
+    compuestos = [561, 41041, 825265, 321197185, 2047, 1373653, 25326001, 3215031751, 2152302898747,
+                  3474749660383, 341550071728321, 3825123056546413051, 318665857834031151167461]
+    for n in compuestos:
+        assert not AritmeticaBasica.es_primo(n)
+    assert AritmeticaBasica.es_primo(2 ** 89 - 1) and not AritmeticaBasica.es_primo((2 ** 89 - 1) * (2 ** 107 - 1))
+
+@pytest.mark.parametrize('segmento', [8, 1000, 1 << 18])
+def test_primos_en_intervalo_frente_a_referencia(segmento):
+    rng = random.Random(segmento)
+    for _ in range(20):
+        a = rng.randrange(0, 150000)
+        b = a + rng.randrange(0, 50000)
+        esperado = [p for p in PRIMOS if a <= p <= b]
+        assert list(AritmeticaBasica.primos_en_intervalo(a, b, segmento)) == esperado
+        assert AritmeticaBasica.contar_primos(b, a, segmento) == len(esperado)
+
+def test_intervalo_lejano_frente_a_es_primo():
+    a = 10 ** 12
+    esperado = [n for n in range(a, a + 2000) if AritmeticaBasica.es_primo(n)]
+    assert list(AritmeticaBasica.primos_en_intervalo(a, a + 1999, segmento=512)) == esperado
+
+def test_enesimo_primo():
+    for n in [1, 2, 10, 1000, 17000]:
+        assert AritmeticaBasica.enesimo_primo(n) == PRIMOS[n - 1]
+
+@pytest.fixture
+def mapa(tmp_path, monkeypatch):
+    mapa = construir_mapa_primos(str(tmp_path / 'primos.bin'), 200000, segmento=4096)
+    monkeypatch.setattr(aritmetica, '_mapa_primos', mapa)
+    yield mapa
+    mapa.cerrar()
+
+def test_mapa_frente_a_referencia(mapa):
+    assert mapa.verificar()
+    conjunto = set(PRIMOS)
+    assert all(mapa.es_primo(n) == (n in conjunto) for n in range(mapa.limite))
+    assert mapa.primos_hasta(200000) == PRIMOS
+    assert list(mapa.primos_entre(1000, 5000)) == [p for p in PRIMOS if 1000 <= p <= 5000]
+    assert mapa.contar_entre(2, 199999) == len(PRIMOS)
+
+def test_mapa_se_cierra_con_generadores_a_medias(tmp_path):
+    mapa = construir_mapa_primos(str(tmp_path / 'primos.bin'), 1 << 20, segmento=4096)
+    primos = mapa.primos_entre(3, 1 << 20)
+    assert next(primos) == 3
+    mapa.cerrar()
+
+def test_generar_primos_usa_el_mapa_sin_ampliar_la_tabla(mapa, monkeypatch):
+    tabla = TablaPrimos()
+    monkeypatch.setattr(aritmetica, '_tabla_primos', tabla)
+    assert AritmeticaBasica.generar_primos(150000) == [p for p in PRIMOS if p <= 150000]
+    assert list(AritmeticaBasica.primos_en_intervalo(100, 150000)) == [p for p in PRIMOS if 100 <= p <= 150000]
+    assert AritmeticaBasica.contar_primos(150000) == len([p for p in PRIMOS if p <= 150000])
+    assert tabla.limite == 0
+
+def test_mapa_rechaza_archivos_ajenos(tmp_path):
+    ruta = tmp_path / 'otro.bin'
+    ruta.write_bytes(b'no es un mapa' * 10)
+    with pytest.raises(ValueError):
+        MapaPrimos(str(ruta))
+
+def test_criba_segmentada_lejana_no_amplia_la_tabla(monkeypatch):
+    tabla = TablaPrimos()
+    monkeypatch.setattr(aritmetica, '_tabla_primos', tabla)
+    a = 10 ** 14
+    primos = list(AritmeticaBasica.primos_en_intervalo(a, a + 3000, segmento=1024))
+    assert tabla.limite <= TablaPrimos.LIMITE_AUTOMATICO
+    assert primos == [n for n in range(a, a + 3001) if AritmeticaBasica.es_primo(n)]
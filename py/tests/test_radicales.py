@@ -0,0 +1,55 @@
+"""Pruebas de la simplificación de radicales frente a la búsqueda directa"""
+
+import random
+
+import pytest
+
+from aritmetica import Potenciacion, TablaRadicales
+
+def radical_referencia(n: int, k: int):
+    """Mayor a con a^k que divide a |n|, buscado de arriba abajo"""
+    a = round(abs(n) ** (1 / k)) + 1
+    while abs(n) % a ** k:
+        a -= 1
+    return (-a if n < 0 else a), abs(n) // a ** k
+
+def libre_de_potencias(n: int, k: int) -> bool:
+    return all(n % p ** k for p in range(2, 2000))
+
+def test_simplificar_radical_frente_a_busqueda_directa():
+    for k in [2, 3, 4, 5]:
+        for n in range(0 if k % 2 == 0 else -300, 3000):
+            assert Potenciacion.simplificar_radical(n, k) == radical_referencia(n, k)
+    assert Potenciacion.simplificar_radical(72) == (6, 2)
+    with pytest.raises(ValueError):
+        Potenciacion.simplificar_radical(-8, 2)
+
+def test_simplificar_radical_fuera_de_la_tabla():
+    rng = random.Random(14)
+    for _ in range(200):
+        k = rng.randint(2, 4)
+        n = rng.randint(1, 1000) ** k * rng.randint(TablaRadicales.LIMITE_MAXIMO, 10 ** 12)
+        factor, resto = Potenciacion.simplificar_radical(n, k)
+        assert factor ** k * resto == n and libre_de_potencias(resto, k)
+
+def test_simplificar_radicales_lote_frente_a_escalar():
+    rng = random.Random(15)
+    for k in [2, 3, 7]:
+        radicandos = list(range(0, 5000)) + [rng.randint(1, 10 ** 12) for _ in range(50)]
+        if k % 2:
+            radicandos += [-n for n in range(1, 500)]
+        assert Potenciacion.simplificar_radicales_lote(radicandos, k) == \
+            [Potenciacion.simplificar_radical(n, k) for n in radicandos]
+    assert Potenciacion.simplificar_radicales_lote([]) == []
+
+def test_tabla_radicales_frente_a_busqueda_directa():
+    for k in [2, 3]:
+        tabla = TablaRadicales(k)
+        tabla.asegurar(5000)
+        assert tabla.limite >= 5000
+        for n in range(1, 5000):
+            assert tabla.simplificar(n) == radical_referencia(n, k)
+    with pytest.raises(ValueError):
+        TablaRadicales(1)
+    with pytest.raises(ValueError):
+        TablaRadicales(2).asegurar(TablaRadicales.LIMITE_MAXIMO + 1)